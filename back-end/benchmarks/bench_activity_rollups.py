@@ -0,0 +1,93 @@
+'''
+수강 신청/찜 기록에서 일/주 단위 활동 집계를 만드는 시간과, 기간 조회를 원본 GROUP BY와 집계 테이블로
+처리할 때의 시간을 비교합니다.
+
+    $ python -m benchmarks.bench_activity_rollups --enrollments 500000 --wishes 500000 --days 365
+'''
+import argparse
+import random
+import time
+from datetime import timedelta
+
+from benchmarks.common import measure, populate, setup_django, temporary_database
+
+
+def spread_created_at(days):
+    # populate()는 모든 행을 현재 시각으로 만들므로 최근 days일에 고르게 흩어 놓음 (벤치마크 DB는 SQLite)
+    from django.db import connection
+
+    with connection.cursor() as cursor:
+        for table in ['courses_enrollment', 'courses_wishedcourses']:
+            cursor.execute(
+                f"UPDATE {table} SET created_at = datetime(created_at, '-' || (id * 7919 %% %s) || ' days')",
+                [days],
+            )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--users', type=int, default=50000)
+    parser.add_argument('--courses', type=int, default=2000)
+    parser.add_argument('--enrollments', type=int, default=500000)
+    parser.add_argument('--wishes', type=int, default=500000)
+    parser.add_argument('--days', type=int, default=365, help='기록을 흩어 놓을 기간(일)')
+    parser.add_argument('--batch-size', type=int, default=5000, help='증분 갱신 pk 구간 크기')
+    parser.add_argument('--course-batch-size', type=int, default=200, help='전체 채우기 과외 묶음 크기')
+    parser.add_argument('--new-wishes', type=int, default=200, help='증분 갱신 전에 추가할 찜 수')
+    parser.add_argument('--lookups', type=int, default=200, help='기간 조회 횟수')
+    args = parser.parse_args()
+
+    setup_django()
+    from django.db.models import Count
+    from django.db.models.functions import TruncDate
+    from django.utils import timezone
+
+    from accounts.models import User
+    from courses.activity_rollups import activity_series, backfill_activity_rollups, update_activity_rollups
+    from courses.models import Course, Enrollment, WishedCourses
+
+    with temporary_database():
+        started = time.perf_counter()
+        populate(n_users=args.users, n_courses=args.courses, n_enrollments=args.enrollments, n_wishes=args.wishes)
+        spread_created_at(args.days)
+        print(f'데이터 생성: 수강 신청 {args.enrollments}건, 찜 {args.wishes}건, {time.perf_counter() - started:.1f}초')
+
+        elapsed, queries = measure(backfill_activity_rollups, course_batch_size=args.course_batch_size)
+        print(f'전체 집계: {elapsed:.2f}초, 쿼리 {queries}번')
+
+        # 워터마크 이후에 들어온 새 찜
+        rng = random.Random(0)
+        user_ids = list(User.objects.values_list('pk', flat=True))
+        course_ids = list(Course.objects.values_list('pk', flat=True))
+        WishedCourses.objects.bulk_create(
+            [WishedCourses(user_id=rng.choice(user_ids), course_id=rng.choice(course_ids))
+             for _ in range(args.new_wishes)],
+            ignore_conflicts=True,
+        )
+        elapsed, queries = measure(update_activity_rollups, batch_size=args.batch_size)
+        print(f'증분 갱신 (새 찜 {args.new_wishes}건): {elapsed * 1000:.2f}ms, 쿼리 {queries}번')
+
+        today = timezone.localdate()
+        start = today - timedelta(days=args.days)
+        lookup_ids = [rng.choice(course_ids) for _ in range(args.lookups)]
+
+        def raw_lookups():
+            for course_id in lookup_ids:
+                for model in (Enrollment, WishedCourses):
+                    list(
+                        model.objects.filter(course_id=course_id, created_at__date__gte=start)
+                        .annotate(day=TruncDate('created_at')).values('day').annotate(count=Count('id')).order_by()
+                    )
+
+        def rollup_lookups():
+            for course_id in lookup_ids:
+                activity_series('day', start, today, course_id=course_id)
+
+        for name, func in [('원본 GROUP BY', raw_lookups), ('집계 테이블', rollup_lookups)]:
+            elapsed, queries = measure(func)
+            print(f'{name} 일별 조회 {args.lookups}회 ({args.days}일): '
+                  f'평균 {elapsed / args.lookups * 1000:.3f}ms, 조회당 쿼리 {queries / args.lookups:.0f}번')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,60 @@
+'''
+과외별 update_* 메서드 루프와 recompute_cached_fields의 쿼리 수/시간을 과외 수별로 비교합니다.
+시간은 쿼리 기록(CaptureQueriesContext) 없이 따로 실행한 벽시계 시간(--repeat번 중 최솟값)입니다.
+
+    $ python -m benchmarks.bench_cached_fields --sizes 10 100 1000 --batch-size 500
+'''
+import argparse
+import time
+
+from benchmarks.common import measure, populate, setup_django, temporary_database
+
+
+def per_course_loop():
+    from courses.models import Course
+
+    for course in Course.objects.all():
+        course.update_tutee_count()
+        course.update_review_metrics()
+
+
+def wall_time(func, repeat, **kwargs):
+    best = float('inf')
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func(**kwargs)
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10, 100, 1000])
+    parser.add_argument('--batch-size', type=int, default=500)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    setup_django()
+    from courses.cached_fields import recompute_cached_fields
+
+    print(f"{'과외 수':>8} | {'루프 쿼리':>10} {'루프 시간(s)':>12} | {'벌크 쿼리':>10} {'벌크 시간(s)':>12} | {'배율':>8}")
+    for size in args.sizes:
+        with temporary_database():
+            populate(
+                n_users=max(50, size),
+                n_courses=size,
+                n_enrollments=size * 5,
+                n_wishes=size * 3,
+                n_reviews=size * 2,
+            )
+            # 쿼리 수만 세고, 시간은 쿼리 기록 비용이 섞이지 않도록 따로 잼 (두 작업 모두 결과가 같아 반복해도 됨)
+            _, loop_queries = measure(per_course_loop)
+            _, bulk_queries = measure(recompute_cached_fields, batch_size=args.batch_size)
+            loop_time = wall_time(per_course_loop, args.repeat)
+            bulk_time = wall_time(recompute_cached_fields, args.repeat, batch_size=args.batch_size)
+        print(f'{size:>8} | {loop_queries:>10} {loop_time:>12.3f} | {bulk_queries:>10} {bulk_time:>12.3f} | '
+              f'{loop_time / bulk_time:>7.1f}x')
+
+
+if __name__ == '__main__':
+    main()
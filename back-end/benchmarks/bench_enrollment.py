@@ -0,0 +1,114 @@
+'''
+인기 과외에 수강 신청이 몰리는 상황을 여러 스레드로 재현해서, 정원 초과(overselling)가 없는지 확인하고
+초당 수강 신청 처리량을 측정합니다.
+
+    $ python -m benchmarks.bench_enrollment --threads 16 --attempts 200 --courses 5 --capacity 30
+
+각 스레드는 attempts번 임의의 유저로 임의의 과외에 enroll()을 호출합니다.
+(SQLite는 쓰기 잠금이 DB 단위이므로 동시 쓰기가 많으면 잠금 대기 시간이 처리량을 결정합니다.)
+'''
+import argparse
+import random
+import threading
+import time
+from collections import Counter
+
+from benchmarks.common import populate, setup_django, temporary_database
+
+
+def worker(seed, attempts, user_ids, course_ids, results, lock):
+    from django.db import OperationalError, connection
+
+    from courses.enrollment import EnrollmentError, enroll
+
+    rng = random.Random(seed)
+    outcomes = Counter()
+    try:
+        for _ in range(attempts):
+            try:
+                enroll(rng.choice(user_ids), rng.choice(course_ids), '2025-11-01', '2025-12-31')
+                outcomes['enrolled'] += 1
+            except EnrollmentError as e:
+                outcomes[type(e).__name__] += 1
+            except OperationalError:
+                # SQLite 잠금 대기 시간 초과
+                outcomes['locked'] += 1
+    finally:
+        connection.close()
+    with lock:
+        results.update(outcomes)
+
+
+def check_capacity():
+    '''정원 초과, 카운터 불일치, 모집 마감 누락이 있는 과외 목록을 반환합니다.'''
+    from django.db.models import Count
+
+    from courses.models import Course
+
+    problems = []
+    for course in Course.objects.annotate(n_enrollments=Count('enrollment')):
+        if course.n_enrollments > course.max_tutees:
+            problems.append(f'과외 {course.pk}: 정원 {course.max_tutees}명 초과 ({course.n_enrollments}명)')
+        if course.n_enrollments != course.current_tutees_count:
+            problems.append(f'과외 {course.pk}: current_tutees_count {course.current_tutees_count} != 실제 {course.n_enrollments}')
+        if course.n_enrollments >= course.max_tutees and course.status == Course.StatusChoices.RECRUITING:
+            problems.append(f'과외 {course.pk}: 정원이 찼는데 모집중 상태')
+    return problems
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--threads', type=int, default=16)
+    parser.add_argument('--attempts', type=int, default=200, help='스레드당 신청 시도 횟수')
+    parser.add_argument('--courses', type=int, default=5, help='신청이 몰리는 과외 수')
+    parser.add_argument('--capacity', type=int, default=30, help='과외별 정원')
+    parser.add_argument('--users', type=int, default=2000)
+    parser.add_argument('--lock-timeout', type=float, default=30, help='SQLite 잠금 대기 시간(초)')
+    args = parser.parse_args()
+
+    setup_django()
+    from django.conf import settings
+
+    from courses.models import Course
+    from accounts.models import User
+
+    # 스레드마다 새 연결을 만들므로 설정에 잠금 대기 시간을 넣어 둠
+    settings.DATABASES['default'].setdefault('OPTIONS', {})['timeout'] = args.lock_timeout
+
+    with temporary_database():
+        populate(n_users=args.users, n_courses=args.courses)
+        Course.objects.update(max_tutees=args.capacity)
+        user_ids = list(User.objects.values_list('pk', flat=True))
+        course_ids = list(Course.objects.values_list('pk', flat=True))
+
+        results = Counter()
+        lock = threading.Lock()
+        threads = [
+            threading.Thread(target=worker, args=(seed, args.attempts, user_ids, course_ids, results, lock))
+            for seed in range(args.threads)
+        ]
+        started = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = time.perf_counter() - started
+
+        problems = check_capacity()
+        full_courses = Course.objects.filter(status=Course.StatusChoices.IN_PROGRESS).count()
+
+    total = sum(results.values())
+    print(f'스레드 {args.threads}개 x {args.attempts}회 = 시도 {total}회, {elapsed:.3f}초')
+    print(f'처리량: {total / elapsed:.1f}회/s (성공한 신청 {results["enrolled"] / elapsed:.1f}건/s)')
+    print('결과: ' + ', '.join(f'{name} {count}' for name, count in results.most_common()))
+    print(f'모집 마감된 과외: {full_courses}/{args.courses} (정원 {args.capacity}명)')
+    if problems:
+        print('정원/카운터 오류:')
+        for problem in problems:
+            print(f'  {problem}')
+        raise SystemExit(1)
+    print('정원 초과 없음')
+
+
+if __name__ == '__main__':
+    main()
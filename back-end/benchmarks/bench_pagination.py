@@ -0,0 +1,103 @@
+'''
+OFFSET 페이지네이션과 커서(keyset) 페이지네이션의 페이지 깊이별 조회 시간을 비교합니다.
+실제 목록에서 쓰는 정렬 기준으로 측정합니다.
+
+- 수강 기록 전체 (-pk)
+- 과외 최신순 (-created_at, 동점은 -id)
+- 카테고리별 과외 인기순 (-popularity_score, 점수가 같은 과외가 많음)
+- 한 유저의 찜 목록 최신순 (-created_at)
+
+    $ python -m benchmarks.bench_pagination --enrollments 1000000 --courses 200000 --pages 1 100 1000 10000 40000
+
+기본값은 수강 기록 100만 건이므로 데이터 생성에 몇 분이 걸릴 수 있습니다.
+'''
+import argparse
+import time
+
+from benchmarks.common import populate, setup_django, temporary_database
+
+
+def timed(func, repeat):
+    best = float('inf')
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def compare(title, queryset, ordering, args):
+    '''정렬 기준 하나에 대해 페이지 깊이별 OFFSET/커서 조회 시간을 출력합니다.'''
+    from courses.pagination import KeysetPaginator
+
+    paginator = KeysetPaginator(queryset, ordering=ordering, page_size=args.page_size)
+    ordered = queryset.order_by(*paginator._order_by())
+    total = queryset.count()
+
+    print(f'\n{title} ({ordering}, {total}건)')
+    print(f"{'페이지':>8} | {'OFFSET(ms)':>12} | {'커서(ms)':>12}")
+    for page_number in args.pages:
+        offset = (page_number - 1) * args.page_size
+        if offset >= total:
+            break
+
+        def offset_page():
+            list(ordered[offset:offset + args.page_size])
+
+        # 이전 페이지의 마지막 행으로 커서를 만듦 (측정에서 제외)
+        cursor = None
+        if offset:
+            cursor = paginator.encode_cursor(ordered[offset - 1])
+
+        def cursor_page():
+            paginator.page(cursor)
+
+        offset_ms = timed(offset_page, args.repeat) * 1000
+        cursor_ms = timed(cursor_page, args.repeat) * 1000
+        print(f'{page_number:>8} | {offset_ms:>12.2f} | {cursor_ms:>12.2f}')
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--enrollments', type=int, default=1_000_000)
+    parser.add_argument('--users', type=int, default=5000)
+    parser.add_argument('--courses', type=int, default=200_000)
+    parser.add_argument('--wishes', type=int, default=100_000, help='찜 목록을 측정할 유저 한 명의 찜 수')
+    parser.add_argument('--page-size', type=int, default=20)
+    parser.add_argument('--pages', type=int, nargs='+', default=[1, 100, 1000, 10000, 40000])
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--db', help='임시 SQLite DB 파일 경로 (기본값: 임시 폴더)')
+    args = parser.parse_args()
+
+    setup_django()
+    from django.db import connection
+
+    from courses.models import Course, Enrollment, WishedCourses
+
+    with temporary_database(args.db):
+        print(f'과외 {args.courses}개, 수강 기록 {args.enrollments}건 생성 중...')
+        populate(n_users=args.users, n_courses=args.courses, n_enrollments=args.enrollments)
+        # 인기 점수를 0~100 사이 0.01 단위로 뿌려서 점수가 같은 과외가 많도록 함 (동점 정렬 확인)
+        with connection.cursor() as cursor:
+            cursor.execute('UPDATE courses_course SET popularity_score = abs(random() % 10000) / 100.0')
+
+        # 찜 목록은 한 유저가 많은 과외를 찜한 경우를 측정함
+        user_id = Enrollment.objects.values_list('user_id', flat=True).first()
+        course_ids = list(Course.objects.order_by('pk').values_list('pk', flat=True)[:args.wishes])
+        for start in range(0, len(course_ids), 5000):
+            WishedCourses.objects.bulk_create(
+                [WishedCourses(user_id=user_id, course_id=course_id) for course_id in course_ids[start:start + 5000]]
+            )
+        with connection.cursor() as cursor:
+            cursor.execute('ANALYZE')
+
+        category_id = Course.objects.values_list('category_id', flat=True).first()
+        compare('수강 기록 전체', Enrollment.objects.all(), '-pk', args)
+        compare('과외 최신순', Course.objects.select_related('tutor', 'category'), '-created_at', args)
+        compare('카테고리별 과외 인기순', Course.objects.filter(category_id=category_id), '-popularity_score', args)
+        compare('찜 목록 최신순', WishedCourses.objects.filter(user_id=user_id).select_related('course'),
+                '-created_at', args)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,70 @@
+'''
+상호작용(수강 + 찜) 100만 건에서 추천 테이블 전체 계산/증분 갱신 시간과 추천 조회 시간을 측정합니다.
+
+    $ python -m benchmarks.bench_recommendations --enrollments 600000 --wishes 400000
+'''
+import argparse
+import random
+import time
+from datetime import timedelta
+
+from benchmarks.common import measure, populate, setup_django, temporary_database
+
+
+def add_interactions(n, seed):
+    # 워터마크 이후에 들어온 새 찜 n건
+    from courses.models import Course, WishedCourses
+    from accounts.models import User
+
+    rng = random.Random(seed)
+    user_ids = list(User.objects.values_list('pk', flat=True))
+    course_ids = list(Course.objects.values_list('pk', flat=True))
+    objs = [WishedCourses(user_id=rng.choice(user_ids), course_id=rng.choice(course_ids)) for _ in range(n)]
+    WishedCourses.objects.bulk_create(objs, ignore_conflicts=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--users', type=int, default=50000)
+    parser.add_argument('--courses', type=int, default=5000)
+    parser.add_argument('--enrollments', type=int, default=600000)
+    parser.add_argument('--wishes', type=int, default=400000)
+    parser.add_argument('--new-interactions', type=int, default=200, help='증분 갱신 전에 추가할 찜 수')
+    parser.add_argument('--top-k', type=int, default=20)
+    parser.add_argument('--lookups', type=int, default=1000, help='추천 조회 횟수')
+    args = parser.parse_args()
+
+    setup_django()
+    from courses.models import Course
+    from courses.recommendations import build_recommendations, get_recommendations
+
+    with temporary_database():
+        started = time.perf_counter()
+        populate(n_users=args.users, n_courses=args.courses, n_enrollments=args.enrollments, n_wishes=args.wishes)
+        print(f'데이터 생성: 상호작용 {args.enrollments + args.wishes}건, {time.perf_counter() - started:.1f}초')
+
+        started = time.perf_counter()
+        # 방금 만든 데이터이므로 워터마크 지연 없이 계산
+        full_count = build_recommendations(full=True, top_k=args.top_k, lag=timedelta(0))
+        print(f'전체 계산: 과외 {full_count}개, {time.perf_counter() - started:.2f}초')
+
+        add_interactions(args.new_interactions, seed=1)
+        started = time.perf_counter()
+        incremental_count = build_recommendations(top_k=args.top_k, lag=timedelta(0))
+        print(f'증분 갱신 (새 찜 {args.new_interactions}건): 과외 {incremental_count}개, '
+              f'{time.perf_counter() - started:.2f}초')
+
+        rng = random.Random(2)
+        course_ids = list(Course.objects.values_list('pk', flat=True))
+        lookup_ids = [rng.choice(course_ids) for _ in range(args.lookups)]
+
+        def lookups():
+            for course_id in lookup_ids:
+                get_recommendations(course_id)
+
+        elapsed, queries = measure(lookups)
+        print(f'추천 조회 {args.lookups}회: 평균 {elapsed / args.lookups * 1000:.3f}ms, 조회당 쿼리 {queries / args.lookups:.0f}번')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,127 @@
+'''
+벤치마크 공통 도구
+
+벤치마크는 back-end 폴더에서 모듈로 실행합니다.
+    $ python -m benchmarks.bench_cached_fields
+
+실제 db.sqlite3를 건드리지 않도록 Django 테스트 DB 생성 기능으로 임시 DB 파일을 만들어 사용합니다.
+'''
+import contextlib
+import os
+import random
+import tempfile
+import time
+from decimal import Decimal
+
+import django
+
+
+def setup_django():
+    # seed_all_data.py와 같은 settings 모듈을 사용합니다.
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'yunissaem_api.settings')
+    django.setup()
+
+
+@contextlib.contextmanager
+def temporary_database(name=None):
+    '''
+    마이그레이션이 적용된 임시 SQLite DB 파일을 만들고, 블록이 끝나면 삭제합니다.
+    (인메모리 DB는 연결이 닫히지 않아 다음 벤치마크에 데이터가 남으므로 파일을 사용합니다.)
+    '''
+    from django.db import connection
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        connection.settings_dict['TEST']['NAME'] = name or os.path.join(tmp_dir, 'benchmark.sqlite3')
+        old_name = connection.creation.create_test_db(verbosity=0, autoclobber=True)
+        try:
+            yield connection
+        finally:
+            connection.creation.destroy_test_db(old_name, verbosity=0)
+
+
+def populate(n_users, n_courses, n_enrollments=0, n_wishes=0, n_reviews=0, seed=0, batch_size=5000):
+    '''
+    벤치마크용 데이터를 bulk_create로 빠르게 생성합니다.
+    (user, course) 쌍은 Enrollment, WishedCourses 각각에서 중복되지 않습니다.
+    '''
+    from accounts.models import User
+    from courses.models import Category, Course, Enrollment, WishedCourses
+    from reviews.models import Review
+
+    rng = random.Random(seed)
+
+    categories = Category.objects.bulk_create(
+        [Category(name=name) for name in ['음악', '운동', '예술', '프로그래밍', '금융/재테크', '외국어']]
+    )
+    category_ids = [category.pk for category in categories]
+
+    User.objects.bulk_create(
+        [User(username=f'bench{i}', password='!', name=f'유저{i}') for i in range(n_users)],
+        batch_size=batch_size,
+    )
+    user_ids = list(User.objects.order_by('pk').values_list('pk', flat=True))
+
+    Course.objects.bulk_create(
+        [
+            Course(
+                title=f'벤치마크 과외 {i}',
+                thumbnail_image_url='http://dummyimage.com/200x200.png',
+                description='',
+                curriculum='',
+                max_tutees=rng.randint(5, 30),
+                category_id=rng.choice(category_ids),
+                tutor_id=rng.choice(user_ids),
+            )
+            for i in range(n_courses)
+        ],
+        batch_size=batch_size,
+    )
+    course_ids = list(Course.objects.order_by('pk').values_list('pk', flat=True))
+
+    def sample_pairs(k):
+        # 전체 (user, course) 조합 공간에서 중복 없이 k개를 뽑습니다.
+        keys = rng.sample(range(len(user_ids) * len(course_ids)), k)
+        return [(user_ids[key // len(course_ids)], course_ids[key % len(course_ids)]) for key in keys]
+
+    def bulk_insert(model, make, pairs):
+        # 객체를 한꺼번에 만들지 않고 batch_size만큼씩 만들어서 메모리 사용량을 줄입니다.
+        for start in range(0, len(pairs), batch_size):
+            model.objects.bulk_create([make(user_id, course_id) for user_id, course_id in pairs[start:start + batch_size]])
+
+    if n_enrollments:
+        bulk_insert(
+            Enrollment,
+            lambda user_id, course_id: Enrollment(
+                user_id=user_id, course_id=course_id, start_date='2025-11-01', end_date='2025-12-31'
+            ),
+            sample_pairs(n_enrollments),
+        )
+    if n_wishes:
+        bulk_insert(
+            WishedCourses,
+            lambda user_id, course_id: WishedCourses(user_id=user_id, course_id=course_id),
+            sample_pairs(n_wishes),
+        )
+    if n_reviews:
+        enrollment_ids = Enrollment.objects.order_by('pk').values_list('pk', flat=True)[:n_reviews]
+        Review.objects.bulk_create(
+            [
+                Review(enrollment_id=enrollment_id, rating=Decimal(rng.randint(1, 10)) / 2)
+                for enrollment_id in enrollment_ids
+            ],
+            batch_size=batch_size,
+        )
+
+
+def measure(func, *args, **kwargs):
+    '''func 실행 시간(초)과 실행된 쿼리 수를 반환합니다.'''
+    from django.db import connection, reset_queries
+    from django.test.utils import CaptureQueriesContext
+
+    # 쿼리 기록은 최대 9000개까지만 남으므로, 앞선 작업의 기록이 쌓여 있으면 쿼리 수가 틀어짐
+    reset_queries()
+    with CaptureQueriesContext(connection) as queries:
+        started = time.perf_counter()
+        func(*args, **kwargs)
+        elapsed = time.perf_counter() - started
+    return elapsed, len(queries)
@@ -0,0 +1,119 @@
+'''
+읽기 API(courses/api_urls.py)의 sync/ 경로와 async/ 경로에 같은 부하를 주고
+초당 요청 수(RPS)와 지연 시간(p50, p99)을 비교합니다.
+
+로컬 서버를 먼저 띄운 뒤 실행합니다. (두 경로 모두 같은 ASGI 서버에서 비교)
+    $ uvicorn yunissaem_api.asgi:application --port 8000
+    $ python -m benchmarks.load_test --base-url http://127.0.0.1:8000/api --concurrency 32 --duration 20
+
+각 요청은 과외 상세 / 카테고리별 목록 / 찜 목록 / 수강 목록 중 하나를 임의의 ID로 호출합니다.
+Django 설정 없이 표준 라이브러리(http.client)만 사용하며, 스레드마다 keep-alive 연결을 하나씩 씁니다.
+'''
+import argparse
+import http.client
+import random
+import statistics
+import threading
+import time
+from urllib.parse import urlsplit
+
+ENDPOINTS = {
+    'course': 'courses/{course_id}/',
+    'category': 'categories/{category_id}/courses/',
+    'wishlist': 'users/{user_id}/wishlist/',
+    'enrollments': 'users/{user_id}/enrollments/',
+}
+
+
+def percentile(values, q):
+    if not values:
+        return 0.0
+    values = sorted(values)
+    index = min(len(values) - 1, max(0, int(round(q / 100 * len(values))) - 1))
+    return values[index]
+
+
+def worker(base_url, mode, args, seed, deadline, latencies, errors, lock):
+    parts = urlsplit(base_url)
+    connection_class = http.client.HTTPSConnection if parts.scheme == 'https' else http.client.HTTPConnection
+    conn = connection_class(parts.netloc, timeout=30)
+    rng = random.Random(seed)
+    endpoints = [ENDPOINTS[name] for name in args.endpoints]
+    my_latencies, my_errors = [], 0
+
+    while time.perf_counter() < deadline:
+        path = rng.choice(endpoints).format(
+            course_id=rng.randint(1, args.max_course_id),
+            category_id=rng.randint(1, args.max_category_id),
+            user_id=rng.randint(1, args.max_user_id),
+        )
+        started = time.perf_counter()
+        try:
+            conn.request('GET', f'{parts.path.rstrip("/")}/{mode}/{path}')
+            response = conn.getresponse()
+            response.read()
+            # 존재하지 않는 ID(404)는 정상 응답으로 봄
+            if response.status >= 500:
+                my_errors += 1
+        except (OSError, http.client.HTTPException):
+            my_errors += 1
+            conn.close()
+            conn = connection_class(parts.netloc, timeout=30)
+            continue
+        my_latencies.append(time.perf_counter() - started)
+    conn.close()
+
+    with lock:
+        latencies.extend(my_latencies)
+        errors[0] += my_errors
+
+
+def run(base_url, mode, args):
+    latencies, errors, lock = [], [0], threading.Lock()
+    deadline = time.perf_counter() + args.duration
+    threads = [
+        threading.Thread(target=worker, args=(base_url, mode, args, seed, deadline, latencies, errors, lock))
+        for seed in range(args.concurrency)
+    ]
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+    return {
+        'requests': len(latencies),
+        'errors': errors[0],
+        'rps': len(latencies) / elapsed if elapsed else 0.0,
+        'p50': percentile(latencies, 50) * 1000,
+        'p99': percentile(latencies, 99) * 1000,
+        'mean': statistics.fmean(latencies) * 1000 if latencies else 0.0,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--base-url', default='http://127.0.0.1:8000/api')
+    parser.add_argument('--modes', nargs='+', choices=['sync', 'async'], default=['sync', 'async'])
+    parser.add_argument('--endpoints', nargs='+', choices=ENDPOINTS, default=list(ENDPOINTS))
+    parser.add_argument('--concurrency', type=int, default=32, help='동시 연결 수 (기본값: 32)')
+    parser.add_argument('--duration', type=float, default=20, help='경로별 측정 시간(초) (기본값: 20)')
+    parser.add_argument('--warmup', type=float, default=2, help='측정 전 예열 시간(초) (기본값: 2)')
+    parser.add_argument('--max-course-id', type=int, default=1000)
+    parser.add_argument('--max-category-id', type=int, default=6)
+    parser.add_argument('--max-user-id', type=int, default=1000)
+    args = parser.parse_args()
+
+    print(f'{args.base_url} - 동시 연결 {args.concurrency}개, 경로별 {args.duration}초, 엔드포인트 {args.endpoints}')
+    print(f"{'경로':<8} {'요청':>8} {'오류':>6} {'RPS':>10} {'평균(ms)':>10} {'p50(ms)':>10} {'p99(ms)':>10}")
+    for mode in args.modes:
+        if args.warmup:
+            warmup = argparse.Namespace(**{**vars(args), 'duration': args.warmup})
+            run(args.base_url, mode, warmup)
+        result = run(args.base_url, mode, args)
+        print(f"{mode:<8} {result['requests']:>8} {result['errors']:>6} {result['rps']:>10.1f} "
+              f"{result['mean']:>10.2f} {result['p50']:>10.2f} {result['p99']:>10.2f}")
+
+
+if __name__ == '__main__':
+    main()
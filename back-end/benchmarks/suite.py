@@ -0,0 +1,282 @@
+'''
+courses 데이터 모델 벤치마크 모음
+
+크기를 지정한 임시 SQLite DB를 만들고 주요 작업의 시간/쿼리 수를 측정해서 JSON으로 저장하거나,
+저장해 둔 기준값(baseline)과 비교해서 느려진 작업을 표시합니다.
+
+    $ python -m benchmarks.suite --scale small --save-baseline baseline_small.json
+    (courses/models.py, seed_all_data.py 등 수정 후)
+    $ python -m benchmarks.suite --scale small --compare baseline_small.json
+
+작업마다 한 번 워밍업한 뒤 --repeat(기본 15)번 측정합니다. --compare에서는 현재 중앙값을 기준값의 중앙값과 비교해서
+--threshold(기본 20%) 이상 그리고 --noise-floor-ms(기본 2ms) 이상 느려진 작업을, 그 작업만 새 DB에서
+--confirm-runs(기본 2)번 더 측정해서 매번 느렸을 때만 느려진 것으로 봅니다. (한 번의 흔들림으로는 실패하지 않음)
+쿼리 수가 늘어난 작업은 기계와 무관하므로 바로 느려진 것으로 봅니다. 느려진 작업이 있으면 종료 코드 1을 반환합니다.
+기준값은 같은 기계에서 만든 것과 비교해야 의미가 있습니다.
+
+시딩(seeding)은 seed_all_data.py --bulk --fast-users --fast-reset과 같은 경로(fast_clear_data + run_seed)로
+data/의 고정된 작은 CSV를 적재하는 시간입니다. 나머지 작업은 그 뒤에 --scale 크기로 만든 데이터에서 측정합니다.
+'''
+import argparse
+import contextlib
+import io
+import json
+import platform
+import random
+import statistics
+import time
+
+from benchmarks.common import measure, populate, setup_django, temporary_database
+
+SCALES = {
+    'small': {'users': 1000, 'courses': 200, 'enrollments': 5000, 'wishes': 5000, 'reviews': 2000},
+    'medium': {'users': 10000, 'courses': 2000, 'enrollments': 50000, 'wishes': 50000, 'reviews': 20000},
+    'large': {'users': 100000, 'courses': 20000, 'enrollments': 500000, 'wishes': 500000, 'reviews': 200000},
+}
+
+DEFAULT_THRESHOLD = 0.2
+DEFAULT_REPEAT = 15
+DEFAULT_NOISE_FLOOR_MS = 2.0
+DEFAULT_CONFIRM_RUNS = 2
+
+
+# --- 측정할 작업 ---
+# 각 함수는 데이터가 준비된 DB에서 한 번 실행할 작업(인자 없는 함수)을 반환합니다.
+
+def _sample(values, k, seed=0):
+    values = list(values)
+    return random.Random(seed).sample(values, min(k, len(values)))
+
+
+def seeding_op():
+    import seed_all_data
+
+    def run():
+        # 시딩 스크립트의 진행 메시지는 숨김
+        with contextlib.redirect_stdout(io.StringIO()):
+            seed_all_data.fast_clear_data()
+            seed_all_data.run_seed(bulk=True, fast_users=True)
+    return run
+
+
+def recompute_cached_fields_op():
+    from courses.cached_fields import recompute_cached_fields
+
+    return recompute_cached_fields
+
+
+def wishlist_listing_op():
+    from accounts.models import User
+    from courses.pagination import paginate_wishlist
+
+    users = list(User.objects.filter(pk__in=_sample(User.objects.values_list('pk', flat=True), 100)))
+
+    def run():
+        for user in users:
+            paginate_wishlist(user)
+    return run
+
+
+def enrollment_listing_op():
+    from accounts.models import User
+    from courses.pagination import paginate_enrollments
+
+    users = list(User.objects.filter(pk__in=_sample(User.objects.values_list('pk', flat=True), 100)))
+
+    def run():
+        for user in users:
+            paginate_enrollments(user)
+    return run
+
+
+def top_courses_by_category_op():
+    from courses.models import Category, Course
+
+    category_ids = list(Category.objects.values_list('pk', flat=True))
+
+    def run():
+        for category_id in category_ids:
+            list(Course.objects.top_popular(10, category=category_id))
+            list(Course.objects.top_recruiting(10, category=category_id))
+    return run
+
+
+def review_aggregation_op():
+    from courses.models import Course
+
+    courses = list(Course.objects.filter(pk__in=_sample(Course.objects.values_list('pk', flat=True), 100)))
+
+    def run():
+        for course in courses:
+            course.update_review_metrics()
+    return run
+
+
+# 데이터를 새로 적재하는 작업 - --scale 크기의 데이터를 만들기 전에 측정함
+SEED_OPERATIONS = {
+    'seeding': seeding_op,
+}
+
+OPERATIONS = {
+    'recompute_cached_fields': recompute_cached_fields_op,
+    'wishlist_listing_x100': wishlist_listing_op,
+    'enrollment_listing_x100': enrollment_listing_op,
+    'top_courses_by_category': top_courses_by_category_op,
+    'review_aggregation_x100': review_aggregation_op,
+}
+
+
+def _measure_operation(make, repeat):
+    func = make()
+    # 첫 실행은 캐시/연결 준비 비용이 섞이므로 측정에서 제외
+    func()
+    timings = []
+    for _ in range(repeat):
+        elapsed, queries = measure(func)
+        timings.append(elapsed)
+    return {'min': min(timings), 'median': statistics.median(timings), 'queries': queries}
+
+
+def run_suite(config, repeat, operations=None):
+    '''config 크기의 DB를 만들어 작업별 {min, median, queries}를 측정하고 결과 dict를 반환합니다.'''
+    results = {}
+    with temporary_database():
+        for name, make in SEED_OPERATIONS.items():
+            if not operations or name in operations:
+                results[name] = _measure_operation(make, repeat)
+
+        remaining = [name for name in OPERATIONS if not operations or name in operations]
+        if not remaining:
+            return results
+
+        import seed_all_data
+        with contextlib.redirect_stdout(io.StringIO()):
+            seed_all_data.fast_clear_data()
+        populate(
+            n_users=config['users'],
+            n_courses=config['courses'],
+            n_enrollments=config['enrollments'],
+            n_wishes=config['wishes'],
+            n_reviews=config['reviews'],
+        )
+        for name in remaining:
+            results[name] = _measure_operation(OPERATIONS[name], repeat)
+    return results
+
+
+def is_slower(result, base, threshold, noise_floor=DEFAULT_NOISE_FLOOR_MS / 1000):
+    '''현재 중앙값이 기준값의 중앙값보다 threshold 비율과 noise_floor(초)를 모두 넘게 늘어났는지'''
+    return (
+        result['median'] > base['median'] * (1 + threshold) and
+        result['median'] - base['median'] > noise_floor
+    )
+
+
+def compare(results, baseline, threshold, noise_floor=DEFAULT_NOISE_FLOOR_MS / 1000):
+    '''
+    기준값 대비 중앙값 변화율을 출력하고, (시간이 느려진 작업, 쿼리 수가 늘어난 작업) 이름 목록을 반환합니다.
+    '''
+    slower, more_queries = [], []
+    print(f"{'작업':<28} {'기준(ms)':>10} {'현재(ms)':>10} {'변화':>8} {'쿼리':>12}")
+    for name, result in results.items():
+        base = baseline['results'].get(name)
+        if base is None:
+            print(f"{name:<28} {'-':>10} {result['median'] * 1000:>10.2f} {'new':>8} {result['queries']:>12}")
+            continue
+        change = result['median'] / base['median'] - 1 if base['median'] else 0.0
+        mark = ''
+        # 쿼리 수는 기계와 무관하므로 늘어나면 항상 표시
+        if result['queries'] > base['queries']:
+            more_queries.append(name)
+            mark = '  <- 쿼리 증가'
+        elif is_slower(result, base, threshold, noise_floor):
+            slower.append(name)
+            mark = '  <- 느려짐?'
+        queries = f"{base['queries']}->{result['queries']}"
+        print(f"{name:<28} {base['median'] * 1000:>10.2f} {result['median'] * 1000:>10.2f} "
+              f"{change:>+8.1%} {queries:>12}{mark}")
+    return slower, more_queries
+
+
+def confirm_regressions(names, baseline, config, repeat, threshold, noise_floor, runs):
+    '''느려진 것으로 보이는 작업만 새 DB에서 runs번 다시 측정해서, 매번 느렸던 작업 이름 목록을 반환합니다.'''
+    for attempt in range(runs):
+        if not names:
+            break
+        results = run_suite(config, repeat, names)
+        names = [name for name in names if is_slower(results[name], baseline['results'][name], threshold, noise_floor)]
+        print(f"재측정 {attempt + 1}/{runs}: " + (', '.join(
+            f"{name} {results[name]['median'] * 1000:.2f}ms" for name in results
+        )))
+    return names
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--scale', choices=SCALES, default='small', help='데이터 크기 프리셋 (기본값: small)')
+    for field in SCALES['small']:
+        parser.add_argument(f'--{field}', type=int, help=f'{field} 수 (프리셋 값을 덮어씀)')
+    parser.add_argument('--repeat', type=int, default=DEFAULT_REPEAT,
+                        help=f'작업별 반복 측정 횟수 (기본값: {DEFAULT_REPEAT})')
+    parser.add_argument('--only', nargs='+', choices=[*SEED_OPERATIONS, *OPERATIONS], help='해당 작업만 측정합니다.')
+    parser.add_argument('--output', help='측정 결과 JSON 저장 경로')
+    parser.add_argument('--save-baseline', metavar='PATH', help='측정 결과를 기준값 JSON으로 저장합니다.')
+    parser.add_argument('--compare', metavar='PATH', help='기준값 JSON과 비교해서 느려진 작업을 표시합니다.')
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help=f'느려짐으로 판단할 중앙값 증가율 (기본값: {DEFAULT_THRESHOLD})')
+    parser.add_argument('--noise-floor-ms', type=float, default=DEFAULT_NOISE_FLOOR_MS,
+                        help=f'이보다 적게 늘어난 시간은 무시합니다. (기본값: {DEFAULT_NOISE_FLOOR_MS}ms)')
+    parser.add_argument('--confirm-runs', type=int, default=DEFAULT_CONFIRM_RUNS,
+                        help=f'느려진 것으로 보이는 작업을 다시 측정할 횟수 (기본값: {DEFAULT_CONFIRM_RUNS})')
+    args = parser.parse_args()
+
+    setup_django()
+    import django
+
+    config = dict(SCALES[args.scale])
+    for field in config:
+        if getattr(args, field) is not None:
+            config[field] = getattr(args, field)
+
+    started = time.perf_counter()
+    results = run_suite(config, args.repeat, args.only)
+    report = {
+        'config': config,
+        'repeat': args.repeat,
+        'environment': {
+            'python': platform.python_version(),
+            'django': django.get_version(),
+            'machine': platform.machine(),
+            'platform': platform.platform(),
+        },
+        'results': results,
+    }
+    print(f'측정 완료 ({time.perf_counter() - started:.1f}초), 데이터 크기: {config}')
+
+    for path in filter(None, [args.output, args.save_baseline]):
+        with open(path, 'w', encoding='utf-8') as file:
+            json.dump(report, file, ensure_ascii=False, indent=2)
+        print(f'결과 저장: {path}')
+
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as file:
+            baseline = json.load(file)
+        if baseline.get('config') != config:
+            print(f"경고: 기준값의 데이터 크기가 다릅니다. (기준값: {baseline.get('config')})")
+        noise_floor = args.noise_floor_ms / 1000
+        slower, more_queries = compare(results, baseline, args.threshold, noise_floor)
+        slower = confirm_regressions(slower, baseline, config, args.repeat, args.threshold, noise_floor,
+                                     args.confirm_runs)
+        regressions = more_queries + slower
+        if regressions:
+            print(f"느려진 작업: {', '.join(regressions)}")
+            raise SystemExit(1)
+        print('느려진 작업 없음')
+    else:
+        for name, result in results.items():
+            print(f"{name:<28} 중앙값 {result['median'] * 1000:>10.2f}ms  최솟값 {result['min'] * 1000:>10.2f}ms  "
+                  f"쿼리 {result['queries']}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,218 @@
+'''
+일/주 단위 수강 신청/찜 수 집계 (CourseActivityRollup, CategoryActivityRollup)
+
+튜터 대시보드의 "일별 수강 신청 수", "과외별 찜 추이" 같은 기간 조회를 원본 테이블 GROUP BY 없이
+구간 수에 비례하는 시간으로 처리합니다.
+
+- 집계 기준: Enrollment.created_at, WishedCourses.created_at (settings.TIME_ZONE 기준 날짜)
+- 증분 갱신: update_activity_rollups() - 워터마크(ActivityRollupState) 이후에 생성된 행만 pk 구간(batch_size)
+  단위로 읽어 기존 구간 값에 더합니다. 구간마다 집계 반영과 워터마크 이동을 한 트랜잭션으로 처리하므로
+  중간에 멈춰도 다시 실행하면 이어서 진행합니다.
+- 전체 채우기: backfill_activity_rollups() - 과외 묶음 단위로 전체 기록을 집계해서, 묶음마다 한 트랜잭션 안에서
+  기존 집계를 교체합니다. (채우는 동안에도 조회하는 쪽은 비어 있는 집계를 보지 않음)
+  중간에 실패하면 일부 과외만 교체된 상태이므로 다시 전체 채우기를 실행해야 하고, 증분 갱신과 동시에 실행하면 안 됩니다.
+- 삭제된 수강 신청/찜은 빼지 않습니다. (생성 건수 집계) 현재 남아 있는 행 기준으로 맞추려면 전체를 다시 채웁니다.
+
+⭐️ 워터마크 지연: PostgreSQL 등에서는 작은 pk를 받은 트랜잭션이 큰 pk보다 늦게 커밋될 수 있으므로,
+Max(pk)를 상한으로 쓰면 아직 커밋되지 않은 행을 건너뛴 채 워터마크가 지나가 버립니다.
+그래서 생성된 지 WATERMARK_LAG(기본 5분)가 지난 행 중 가장 큰 pk까지만 반영하고, 최근 행은 다음 실행에서 반영합니다.
+WATERMARK_LAG보다 오래 열려 있는 쓰기 트랜잭션의 행은 여전히 빠질 수 있으므로, 그런 경우에는 전체를 다시 채웁니다.
+(설정: settings.ACTIVITY_ROLLUP_WATERMARK_LAG = 300  # 초, 다른 쓰기가 없는 시딩 등에서는 lag=timedelta(0))
+'''
+from collections import defaultdict
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Count, Sum
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+
+from courses.cached_fields import iter_course_id_batches
+from courses.models import (
+    ActivityRollupState,
+    CategoryActivityRollup,
+    Course,
+    CourseActivityRollup,
+    Enrollment,
+    WishedCourses,
+)
+
+Period = CourseActivityRollup.PeriodChoices
+
+# 원본 모델 -> (집계 필드, 워터마크 필드)
+SOURCES = [
+    (Enrollment, 'enrollment_count', 'last_enrollment_id'),
+    (WishedCourses, 'wish_count', 'last_wish_id'),
+]
+COUNT_FIELDS = [field for _, field, _ in SOURCES]
+
+PERIOD_DAYS = {Period.DAY: 1, Period.WEEK: 7}
+
+WATERMARK_LAG = timedelta(seconds=getattr(settings, 'ACTIVITY_ROLLUP_WATERMARK_LAG', 300))
+
+
+def bucket_start(period, day):
+    '''날짜가 속한 구간의 시작일 (week는 월요일)'''
+    if period == Period.WEEK:
+        return day - timedelta(days=day.weekday())
+    return day
+
+
+def _new_deltas():
+    return defaultdict(lambda: defaultdict(int))
+
+
+def _collect_deltas(queryset, field, course_deltas, category_deltas=None):
+    '''queryset의 행을 과외(와 카테고리)별 일/주 구간 증가량에 더하고, 읽은 행 수를 반환합니다.'''
+    rows = (
+        queryset.annotate(day=TruncDate('created_at'))
+        .values('course_id', 'course__category_id', 'day')
+        .annotate(count=Count('id'))
+        .order_by()
+    )
+    row_count = 0
+    for row in rows:
+        row_count += row['count']
+        for period in PERIOD_DAYS:
+            bucket = bucket_start(period, row['day'])
+            course_deltas[row['course_id'], period, bucket][field] += row['count']
+            if category_deltas is not None:
+                category_deltas[row['course__category_id'], period, bucket][field] += row['count']
+    return row_count
+
+
+def _add_deltas(model, scope_field, deltas, batch_size):
+    # 기존 구간 값을 읽어서 더한 뒤 INSERT ... ON CONFLICT DO UPDATE로 한 번에 저장
+    if not deltas:
+        return
+    buckets = [bucket for _, _, bucket in deltas]
+    existing = {
+        (scope_id, period, bucket): counts
+        for scope_id, period, bucket, *counts in model.objects.filter(
+            **{f'{scope_field}_id__in': {scope_id for scope_id, _, _ in deltas}},
+            bucket__range=(min(buckets), max(buckets)),
+        ).values_list(f'{scope_field}_id', 'period', 'bucket', *COUNT_FIELDS)
+    }
+    rollups = []
+    for key, counts in deltas.items():
+        scope_id, period, bucket = key
+        totals = dict(zip(COUNT_FIELDS, existing.get(key, [0] * len(COUNT_FIELDS))))
+        for field, count in counts.items():
+            totals[field] += count
+        rollups.append(model(**{f'{scope_field}_id': scope_id}, period=period, bucket=bucket, **totals))
+    model.objects.bulk_create(
+        rollups,
+        batch_size=batch_size,
+        update_conflicts=True,
+        unique_fields=[scope_field, 'period', 'bucket'],
+        update_fields=COUNT_FIELDS,
+    )
+
+
+def _high_watermark(model, lag=WATERMARK_LAG):
+    '''생성된 지 lag가 지난 행 중 가장 큰 pk (pk 역순으로 최근 행만 건너뛰며 찾음)'''
+    cutoff = timezone.now() - lag
+    return model.objects.filter(created_at__lte=cutoff).order_by('-pk').values_list('pk', flat=True).first() or 0
+
+
+def update_activity_rollups(batch_size=5000, lag=WATERMARK_LAG):
+    '''워터마크 이후에 생성된 수강 신청/찜을 pk 구간 단위로 집계 테이블에 더하고, 반영한 행 수를 반환합니다.'''
+    state = ActivityRollupState.load()
+    processed = 0
+    for model, field, watermark in SOURCES:
+        # 집계 도중에 추가되는 행과 아직 커밋되지 않았을 수 있는 최근 행은 다음 실행에서 반영되도록 상한을 먼저 고정함
+        high = _high_watermark(model, lag)
+        low = getattr(state, watermark)
+        while low < high:
+            chunk_high = min(low + batch_size, high)
+            course_deltas, category_deltas = _new_deltas(), _new_deltas()
+            processed += _collect_deltas(
+                model.objects.filter(pk__gt=low, pk__lte=chunk_high), field, course_deltas, category_deltas,
+            )
+            with transaction.atomic():
+                _add_deltas(CourseActivityRollup, 'course', course_deltas, batch_size)
+                _add_deltas(CategoryActivityRollup, 'category', category_deltas, batch_size)
+                setattr(state, watermark, chunk_high)
+                state.updated_at = timezone.now()
+                state.save()
+            low = chunk_high
+    return processed
+
+
+def backfill_activity_rollups(course_batch_size=200, batch_size=5000, lag=WATERMARK_LAG):
+    '''
+    전체 기록으로 집계 테이블을 다시 만든 뒤, 반영한 행 수를 반환합니다.
+    과외 course_batch_size개씩 GROUP BY 해서 묶음마다 과외 집계를 교체하고,
+    카테고리 집계는 과외 집계를 다시 묶어서 워터마크와 함께 한 트랜잭션으로 교체합니다.
+    '''
+    highs = {watermark: _high_watermark(model, lag) for model, _, watermark in SOURCES}
+
+    processed = 0
+    for course_ids in iter_course_id_batches(Course.objects.all(), course_batch_size):
+        course_deltas = _new_deltas()
+        for model, field, watermark in SOURCES:
+            processed += _collect_deltas(
+                model.objects.filter(course_id__in=course_ids, pk__lte=highs[watermark]), field, course_deltas,
+            )
+        with transaction.atomic():
+            CourseActivityRollup.objects.filter(course_id__in=course_ids).delete()
+            CourseActivityRollup.objects.bulk_create(
+                [
+                    CourseActivityRollup(course_id=course_id, period=period, bucket=bucket, **counts)
+                    for (course_id, period, bucket), counts in course_deltas.items()
+                ],
+                batch_size=batch_size,
+            )
+
+    category_rollups = (
+        CourseActivityRollup.objects.values('course__category_id', 'period', 'bucket')
+        .annotate(**{field: Sum(field) for field in COUNT_FIELDS})
+        .order_by()
+    )
+    with transaction.atomic():
+        CategoryActivityRollup.objects.all().delete()
+        CategoryActivityRollup.objects.bulk_create(
+            [
+                CategoryActivityRollup(
+                    category_id=row['course__category_id'], period=row['period'], bucket=row['bucket'],
+                    **{field: row[field] for field in COUNT_FIELDS},
+                )
+                for row in category_rollups
+            ],
+            batch_size=batch_size,
+        )
+        state = ActivityRollupState.load()
+        for watermark, high in highs.items():
+            setattr(state, watermark, high)
+        state.updated_at = timezone.now()
+        state.save()
+    return processed
+
+
+def activity_series(period, start, end, course_id=None, category_id=None):
+    '''
+    과외(course_id) 또는 카테고리(category_id)의 [start, end] 기간 구간별 수강 신청/찜 수
+    [{'bucket': date, 'enrollments': int, 'wishes': int}, ...] - 값이 없는 구간은 0으로 채움
+    '''
+    if (course_id is None) == (category_id is None):
+        raise ValueError('course_id와 category_id 중 하나만 지정해야 합니다.')
+    if course_id is not None:
+        rollups = CourseActivityRollup.objects.filter(course_id=course_id)
+    else:
+        rollups = CategoryActivityRollup.objects.filter(category_id=category_id)
+
+    start, end = bucket_start(period, start), bucket_start(period, end)
+    counts = {
+        bucket: (enrollments, wishes)
+        for bucket, enrollments, wishes in rollups.filter(period=period, bucket__range=(start, end))
+        .values_list('bucket', 'enrollment_count', 'wish_count')
+    }
+    series = []
+    step = timedelta(days=PERIOD_DAYS[period])
+    bucket = start
+    while bucket <= end:
+        enrollments, wishes = counts.get(bucket, (0, 0))
+        series.append({'bucket': bucket, 'enrollments': enrollments, 'wishes': wishes})
+        bucket += step
+    return series
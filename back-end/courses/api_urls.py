@@ -0,0 +1,24 @@
+'''
+읽기 API URL - 프로젝트 urls.py에서 include 합니다.
+
+    path('api/', include('courses.api_urls')),
+
+sync/ 와 async/ 는 같은 응답을 주며, 부하 테스트(benchmarks/load_test.py)로 두 경로를 비교할 수 있습니다.
+'''
+from django.urls import path
+
+from courses import api_views
+
+app_name = 'courses_api'
+
+urlpatterns = [
+    path('sync/courses/<int:course_id>/', api_views.course_detail, name='course-detail'),
+    path('sync/categories/<int:category_id>/courses/', api_views.category_courses, name='category-courses'),
+    path('sync/users/<int:user_id>/wishlist/', api_views.user_wishlist, name='user-wishlist'),
+    path('sync/users/<int:user_id>/enrollments/', api_views.user_enrollments, name='user-enrollments'),
+
+    path('async/courses/<int:course_id>/', api_views.acourse_detail, name='acourse-detail'),
+    path('async/categories/<int:category_id>/courses/', api_views.acategory_courses, name='acategory-courses'),
+    path('async/users/<int:user_id>/wishlist/', api_views.auser_wishlist, name='auser-wishlist'),
+    path('async/users/<int:user_id>/enrollments/', api_views.auser_enrollments, name='auser-enrollments'),
+]
@@ -0,0 +1,113 @@
+'''
+과외/찜/수강 목록 읽기 API (JSON)
+
+같은 응답을 주는 동기 뷰와 async 뷰를 함께 둡니다. (courses/api_urls.py에서 sync/, async/ 경로로 연결)
+ASGI 서버(asgi.py)에서는 async 뷰가 DB를 기다리는 동안 워커 스레드를 점유하지 않습니다.
+
+    GET courses/<course_id>/
+    GET categories/<category_id>/courses/?cursor=...&page_size=20&status=recruiting
+    GET users/<user_id>/wishlist/?cursor=...
+    GET users/<user_id>/enrollments/?cursor=...&status=enrolled
+'''
+from django.http import JsonResponse
+
+from courses import read_queries
+from courses.models import Category, Course, Enrollment
+from courses.pagination import InvalidCursor
+
+MAX_PAGE_SIZE = 100
+
+
+def _page_params(request):
+    try:
+        page_size = int(request.GET.get('page_size', read_queries.DEFAULT_PAGE_SIZE))
+    except ValueError:
+        page_size = read_queries.DEFAULT_PAGE_SIZE
+    return request.GET.get('cursor') or None, max(1, min(page_size, MAX_PAGE_SIZE))
+
+
+def _status_param(request, choices):
+    status = request.GET.get('status')
+    return status if status in choices.values else None
+
+
+def _error(message, status):
+    return JsonResponse({'detail': message}, status=status, json_dumps_params={'ensure_ascii': False})
+
+
+def _ok(data):
+    return JsonResponse(data, json_dumps_params={'ensure_ascii': False})
+
+
+# --- 동기 뷰 ---
+
+def course_detail(request, course_id):
+    try:
+        return _ok(read_queries.course_detail(course_id))
+    except Course.DoesNotExist:
+        return _error('과외를 찾을 수 없습니다.', 404)
+
+
+def category_courses(request, category_id):
+    cursor, page_size = _page_params(request)
+    status = _status_param(request, Course.StatusChoices)
+    try:
+        return _ok(read_queries.category_page(category_id, cursor, page_size, status))
+    except Category.DoesNotExist:
+        return _error('카테고리를 찾을 수 없습니다.', 404)
+    except InvalidCursor as e:
+        return _error(str(e), 400)
+
+
+def user_wishlist(request, user_id):
+    cursor, page_size = _page_params(request)
+    try:
+        return _ok(read_queries.wishlist_page(user_id, cursor, page_size))
+    except InvalidCursor as e:
+        return _error(str(e), 400)
+
+
+def user_enrollments(request, user_id):
+    cursor, page_size = _page_params(request)
+    status = _status_param(request, Enrollment.StatusChoices)
+    try:
+        return _ok(read_queries.enrollments_page(user_id, cursor, page_size, status))
+    except InvalidCursor as e:
+        return _error(str(e), 400)
+
+
+# --- async 뷰 ---
+
+async def acourse_detail(request, course_id):
+    try:
+        return _ok(await read_queries.acourse_detail(course_id))
+    except Course.DoesNotExist:
+        return _error('과외를 찾을 수 없습니다.', 404)
+
+
+async def acategory_courses(request, category_id):
+    cursor, page_size = _page_params(request)
+    status = _status_param(request, Course.StatusChoices)
+    try:
+        return _ok(await read_queries.acategory_page(category_id, cursor, page_size, status))
+    except Category.DoesNotExist:
+        return _error('카테고리를 찾을 수 없습니다.', 404)
+    except InvalidCursor as e:
+        return _error(str(e), 400)
+
+
+async def auser_wishlist(request, user_id):
+    cursor, page_size = _page_params(request)
+    try:
+        return _ok(await read_queries.awishlist_page(user_id, cursor, page_size))
+    except InvalidCursor as e:
+        return _error(str(e), 400)
+
+
+async def auser_enrollments(request, user_id):
+    cursor, page_size = _page_params(request)
+    status = _status_param(request, Enrollment.StatusChoices)
+    try:
+        return _ok(await read_queries.aenrollments_page(user_id, cursor, page_size, status))
+    except InvalidCursor as e:
+        return _error(str(e), 400)
@@ -0,0 +1,199 @@
+'''
+과외 상세/카테고리 목록 read-through 캐시
+
+- course_records: 과외 ID -> 직렬화된 과외 정보 (튜터 username, 카테고리 이름, 캐싱 필드 포함)
+- category_course_ids: 카테고리 ID -> 과외 ID 목록 (최신순)
+
+캐시는 프로세스 메모리에 LRU + TTL로 보관하며, Course/Category/Enrollment/WishedCourses/Review/User의
+save/delete 시그널에서 무효화합니다. (courses/signals.py 참고)
+트랜잭션 안에서 무효화하면 커밋 전에 다른 요청이 이전 값을 다시 캐시할 수 있으므로, 커밋 후에 한 번 더 무효화합니다.
+다른 프로세스에서 일어난 변경이나 QuerySet.update로 바뀐 값(예: 조회수)은 TTL이 지나야 반영됩니다.
+조회 함수는 캐시된 값의 복사본을 반환하므로 호출한 쪽에서 고쳐도 캐시에는 영향이 없습니다.
+
+설정 (settings.py, 선택)
+    COURSE_CACHE_MAXSIZE = 10000
+    COURSE_CACHE_TTL = 60  # 초
+'''
+import threading
+import time
+from collections import OrderedDict
+
+from django.conf import settings
+from django.db import transaction
+
+from courses.models import Course
+
+
+class LRUCache:
+
+    def __init__(self, maxsize=1024, ttl=60):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._data = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key, default=None):
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None:
+                expires_at, value = entry
+                if expires_at > time.monotonic():
+                    self._data.move_to_end(key)
+                    self.hits += 1
+                    return value
+                del self._data[key]
+            self.misses += 1
+            return default
+
+    def set(self, key, value):
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def get_or_load(self, key, loader):
+        value = self.get(key)
+        if value is None:
+            value = loader()
+            # 존재하지 않는 값(None)은 캐시하지 않음
+            if value is not None:
+                self.set(key, value)
+        return value
+
+    def invalidate(self, key):
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def stats(self):
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                'size': len(self._data),
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'hit_rate': self.hits / total if total else 0.0,
+            }
+
+
+_maxsize = getattr(settings, 'COURSE_CACHE_MAXSIZE', 10000)
+_ttl = getattr(settings, 'COURSE_CACHE_TTL', 60)
+
+course_records = LRUCache(_maxsize, _ttl)
+category_course_ids = LRUCache(_maxsize, _ttl)
+
+
+def serialize_course(course):
+    # course는 select_related('tutor', 'category')로 조회한 객체여야 추가 쿼리가 없음
+    return {
+        'id': course.id,
+        'title': course.title,
+        'thumbnail_image_url': course.thumbnail_image_url,
+        'description': course.description,
+        'curriculum': course.curriculum,
+        'max_tutees': course.max_tutees,
+        'status': course.status,
+        'view_count': course.view_count,
+        'category_id': course.category_id,
+        'category_name': course.category.name,
+        'tutor_id': course.tutor_id,
+        'tutor_username': course.tutor.username,
+        'current_tutees_count': course.current_tutees_count,
+        'wishlist_count': course.wishlist_count,
+        'review_count': course.review_count,
+        'average_rating': course.average_rating,
+        'popularity_score': course.popularity_score,
+        'created_at': course.created_at,
+        'updated_at': course.updated_at,
+    }
+
+
+def get_course_record(course_id):
+    def load():
+        course = Course.objects.select_related('tutor', 'category').filter(pk=course_id).first()
+        return serialize_course(course) if course is not None else None
+
+    record = course_records.get_or_load(course_id, load)
+    return dict(record) if record is not None else None
+
+
+def get_course_records(course_ids):
+    '''여러 과외를 순서대로 반환합니다. 캐시에 없는 과외만 쿼리 한 번으로 모아서 조회합니다.'''
+    records = {}
+    missing = []
+    for course_id in course_ids:
+        record = course_records.get(course_id)
+        if record is None:
+            missing.append(course_id)
+        else:
+            records[course_id] = record
+
+    if missing:
+        for course in Course.objects.select_related('tutor', 'category').filter(pk__in=missing):
+            record = serialize_course(course)
+            course_records.set(course.id, record)
+            records[course.id] = record
+    return [dict(records[course_id]) for course_id in course_ids if course_id in records]
+
+
+def get_category_course_ids(category_id):
+    def load():
+        return list(
+            Course.objects.filter(category_id=category_id)
+            .order_by('-created_at', '-pk')
+            .values_list('pk', flat=True)
+        )
+
+    return list(category_course_ids.get_or_load(category_id, load))
+
+
+def get_category_courses(category_id):
+    return get_course_records(get_category_course_ids(category_id))
+
+
+def _now_and_on_commit(func, *args):
+    # 트랜잭션 밖이면 on_commit은 바로 실행됨
+    func(*args)
+    transaction.on_commit(lambda: func(*args))
+
+
+def invalidate_course(course_id):
+    _now_and_on_commit(course_records.invalidate, course_id)
+
+
+def invalidate_courses(course_ids):
+    course_ids = list(course_ids)
+
+    def invalidate():
+        for course_id in course_ids:
+            course_records.invalidate(course_id)
+
+    _now_and_on_commit(invalidate)
+
+
+def invalidate_category(category_id):
+    _now_and_on_commit(category_course_ids.invalidate, category_id)
+
+
+def clear_course_records():
+    _now_and_on_commit(course_records.clear)
+
+
+def clear_category_course_ids():
+    _now_and_on_commit(category_course_ids.clear)
+
+
+def cache_stats():
+    return {
+        'course_records': course_records.stats(),
+        'category_course_ids': category_course_ids.stats(),
+    }
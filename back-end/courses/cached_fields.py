@@ -0,0 +1,259 @@
+'''
+Course의 캐싱 필드(current_tutees_count, wishlist_count, review_count, average_rating, popularity_score,
+평점 합계/히스토그램)를 집계 쿼리로 한 번에 다시 계산합니다.
+
+과외마다 update_* 메서드를 호출하면 과외 1개당 4번 이상의 쿼리가 발생하지만,
+여기서는 과외 ID 배치마다 UPDATE 2번만 실행합니다.
+- 1번: 수강 인원/찜 수/평점별 리뷰 수를 집계 서브쿼리로 채움
+- 2번: 리뷰 수/포인트 합계/평균/인기 점수를 1번에서 저장한 히스토그램으로 계산
+(bulk_update는 행마다 CASE WHEN 식을 만들어서 과외 수 * 필드 수에 비례해 느려지므로 사용하지 않음)
+'''
+from collections import defaultdict
+from decimal import Decimal
+
+from django.db.models import (
+    Case,
+    Count,
+    ExpressionWrapper,
+    F,
+    FloatField,
+    IntegerField,
+    OuterRef,
+    Subquery,
+    Value,
+    When,
+)
+from django.db.models.functions import Coalesce
+
+from courses.models import Course, Enrollment, WishedCourses
+from courses.popularity import compute_popularity, popularity_expression
+from courses.ratings import POINTS_PER_STAR, RATING_BUCKET_FIELDS, stats_from_counts, to_points
+from reviews.models import Review
+
+CACHED_FIELDS = [
+    'current_tutees_count', 'wishlist_count', 'review_count', 'average_rating', 'popularity_score',
+    'rating_points_sum', *RATING_BUCKET_FIELDS.values(),
+]
+
+
+# --- 증분 갱신용 UPDATE 식 ---
+# Course.objects.filter(pk=...).update(**식)으로 사용하며, 한 번의 UPDATE 안에서
+# 오른쪽 식의 F()는 모두 갱신 전 값을 가리킵니다.
+
+def tutee_count_updates(delta):
+    new_count = F('current_tutees_count') + delta
+    return {
+        'current_tutees_count': new_count,
+        'popularity_score': popularity_expression(tutees=new_count),
+    }
+
+
+def wish_count_updates(delta):
+    new_count = F('wishlist_count') + delta
+    return {
+        'wishlist_count': new_count,
+        'popularity_score': popularity_expression(wishes=new_count),
+    }
+
+
+def _rating_updates(count_delta, points_delta, bucket_deltas):
+    # 리뷰 수/포인트 합계/히스토그램을 정수로 증감하고, 평균은 갱신 후의 합계로 다시 나눔
+    new_count = F('review_count') + count_delta
+    new_points = F('rating_points_sum') + points_delta
+    new_average = Case(
+        # 마지막 리뷰가 삭제되면 평균은 0
+        When(review_count__lte=-count_delta, then=Value(0.0)),
+        default=ExpressionWrapper(new_points * 1.0 / (new_count * POINTS_PER_STAR), output_field=FloatField()),
+        output_field=FloatField(),
+    )
+    updates = {
+        'review_count': new_count,
+        'rating_points_sum': new_points,
+        'average_rating': new_average,
+        'popularity_score': popularity_expression(reviews=new_count, rating=new_average),
+    }
+    # 같은 구간에서 빼고 더한 경우처럼 순증감이 0인 구간은 갱신하지 않음
+    net_deltas = defaultdict(int)
+    for points, delta in bucket_deltas:
+        net_deltas[points] += delta
+    for points, delta in net_deltas.items():
+        if delta:
+            field = RATING_BUCKET_FIELDS[points]
+            updates[field] = F(field) + delta
+    return updates
+
+
+def review_updates(rating, delta):
+    '''리뷰 하나가 추가(delta=1)/삭제(delta=-1)될 때 리뷰 전체를 읽지 않고 평점 통계를 갱신합니다.'''
+    points = to_points(rating)
+    return _rating_updates(delta, delta * points, [(points, delta)])
+
+
+def review_rating_change_updates(old_rating, new_rating):
+    '''리뷰의 평점이 수정될 때 - 리뷰 수는 그대로, 합계와 히스토그램만 옮김'''
+    old_points, new_points = to_points(old_rating), to_points(new_rating)
+    return _rating_updates(0, new_points - old_points, [(old_points, -1), (new_points, 1)])
+
+
+def _count_by_course(model, course_ids):
+    rows = (
+        model.objects.filter(course_id__in=course_ids)
+        .values('course_id')
+        .annotate(n=Count('id'))
+        .values_list('course_id', 'n')
+    )
+    return dict(rows)
+
+
+def _review_stats_by_course(course_ids):
+    # Review는 Enrollment를 통해 Course와 연결됨 - 과외별, 평점별 개수를 한 번에 집계
+    rows = (
+        Review.objects.filter(enrollment__course_id__in=course_ids)
+        .values('enrollment__course_id', 'rating')
+        .annotate(n=Count('id'))
+        .values_list('enrollment__course_id', 'rating', 'n')
+    )
+    counts = defaultdict(dict)
+    for course_id, rating, n in rows:
+        counts[course_id][to_points(rating)] = n
+    return {course_id: stats_from_counts(course_counts) for course_id, course_counts in counts.items()}
+
+
+def aggregate_cached_fields(course_ids):
+    '''과외 ID 목록에 대해 실제 테이블에서 집계한 캐싱 필드 값을 {course_id: {field: value}}로 반환합니다.'''
+    tutees = _count_by_course(Enrollment, course_ids)
+    wishes = _count_by_course(WishedCourses, course_ids)
+    reviews = _review_stats_by_course(course_ids)
+
+    no_reviews = stats_from_counts({})
+    result = {}
+    for course_id in course_ids:
+        rating_stats = reviews.get(course_id, no_reviews)
+        tutee_count = tutees.get(course_id, 0)
+        wish_count = wishes.get(course_id, 0)
+        result[course_id] = {
+            'current_tutees_count': tutee_count,
+            'wishlist_count': wish_count,
+            **rating_stats,
+            'popularity_score': compute_popularity(
+                tutee_count, wish_count, rating_stats['review_count'], rating_stats['average_rating'],
+            ),
+        }
+    return result
+
+
+def iter_course_id_batches(queryset, batch_size):
+    '''
+    pk 순서대로 과외 ID를 batch_size개씩 잘라서 반환합니다.
+    SQLite에서는 순회 중인 테이블을 수정하면 안 되므로 .iterator() 대신 pk 기준으로 끊어서 조회합니다.
+    '''
+    last_id = 0
+    while True:
+        ids = list(
+            queryset.filter(pk__gt=last_id)
+            .order_by('pk')
+            .values_list('pk', flat=True)[:batch_size]
+        )
+        if not ids:
+            return
+        yield ids
+        last_id = ids[-1]
+
+
+def _count_subquery(queryset, course_field):
+    # 과외(OuterRef)별 행 수 - 없으면 0
+    rows = (
+        queryset.filter(**{course_field: OuterRef('pk')})
+        .order_by()
+        .values(course_field)
+        .annotate(n=Count('id'))
+        .values('n')
+    )
+    return Coalesce(Subquery(rows, output_field=IntegerField()), 0)
+
+
+def _rating_bucket_updates():
+    # 평점별 리뷰 수 (Review는 Enrollment를 통해 Course와 연결됨)
+    return {
+        field: _count_subquery(
+            Review.objects.filter(rating=Decimal(points) / POINTS_PER_STAR), 'enrollment__course',
+        )
+        for points, field in RATING_BUCKET_FIELDS.items()
+    }
+
+
+def _rating_summary_updates():
+    # 저장된 히스토그램으로 리뷰 수/합계/평균/인기 점수를 계산 (같은 UPDATE 안의 F()는 갱신 전 값)
+    review_count = sum((F(field) for field in RATING_BUCKET_FIELDS.values()), Value(0))
+    points_sum = sum((F(field) * points for points, field in RATING_BUCKET_FIELDS.items()), Value(0))
+    average = Case(
+        # 모든 구간이 0이면 리뷰가 없음
+        When(**{field: 0 for field in RATING_BUCKET_FIELDS.values()}, then=Value(0.0)),
+        default=ExpressionWrapper(points_sum * 1.0 / (review_count * POINTS_PER_STAR), output_field=FloatField()),
+        output_field=FloatField(),
+    )
+    return {
+        'review_count': review_count,
+        'rating_points_sum': points_sum,
+        'average_rating': average,
+        'popularity_score': popularity_expression(reviews=review_count, rating=average),
+    }
+
+
+def recompute_cached_fields(queryset=None, batch_size=500):
+    '''모든 과외(또는 queryset의 과외)의 캐싱 필드를 다시 계산하여 저장하고, 갱신한 과외 수를 반환합니다.'''
+    if queryset is None:
+        queryset = Course.objects.all()
+
+    updated = 0
+    for course_ids in iter_course_id_batches(queryset, batch_size):
+        courses = Course.objects.filter(pk__in=course_ids)
+        courses.update(
+            current_tutees_count=_count_subquery(Enrollment.objects.all(), 'course'),
+            wishlist_count=_count_subquery(WishedCourses.objects.all(), 'course'),
+            **_rating_bucket_updates(),
+        )
+        courses.update(**_rating_summary_updates())
+        updated += len(course_ids)
+    return updated
+
+
+def rebuild_rating_stats(queryset=None, batch_size=500):
+    '''리뷰 수/평점 합계/히스토그램/평균과 인기 점수만 다시 계산하고, 갱신한 과외 수를 반환합니다.'''
+    if queryset is None:
+        queryset = Course.objects.all()
+
+    updated = 0
+    for course_ids in iter_course_id_batches(queryset, batch_size):
+        courses = Course.objects.filter(pk__in=course_ids)
+        courses.update(**_rating_bucket_updates())
+        courses.update(**_rating_summary_updates())
+        updated += len(course_ids)
+    return updated
+
+
+def find_counter_drift(queryset=None, batch_size=500, tolerance=1e-6):
+    '''
+    저장된 캐싱 필드와 실제 집계 값이 다른 과외를 찾습니다.
+    (course_id, 필드명, 저장된 값, 실제 값) 목록을 반환합니다.
+    '''
+    if queryset is None:
+        queryset = Course.objects.all()
+
+    drift = []
+    for course_ids in iter_course_id_batches(queryset, batch_size):
+        actual = aggregate_cached_fields(course_ids)
+        stored = Course.objects.filter(pk__in=course_ids).values('pk', *CACHED_FIELDS)
+        for row in stored:
+            for field in CACHED_FIELDS:
+                expected = actual[row['pk']][field]
+                if abs(row[field] - expected) > tolerance:
+                    drift.append((row['pk'], field, row[field], expected))
+    return drift
+
+
+def refresh_popularity_scores(queryset=None):
+    '''저장된 캐싱 필드로 인기 점수를 UPDATE 한 번에 다시 계산합니다. (가중치 변경 후 사용)'''
+    if queryset is None:
+        queryset = Course.objects.all()
+    return queryset.update(popularity_score=popularity_expression())
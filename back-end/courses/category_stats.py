@@ -0,0 +1,135 @@
+'''
+카테고리 집계 스냅샷 (CategoryStats)과 인기 과외 순위표 (CategoryLeaderboardEntry)
+
+카테고리 페이지는 Course를 매번 GROUP BY 하지 않고 미리 계산된 행을 읽습니다.
+
+- 변경 표시: 과외가 생성/수정/삭제되거나 카운터(수강/찜/리뷰)가 바뀌면 시그널이 해당 카테고리의
+  is_dirty를 켭니다. (courses/signals.py)
+- 갱신: refresh_category_stats() - is_dirty인 카테고리(또는 전체)만 스레드 풀에서 다시 계산하고,
+  결과는 한 트랜잭션으로 저장합니다.
+  백그라운드에서는 `manage.py refresh_category_stats --interval 60`으로 주기적으로 실행합니다.
+- 계산 전에 is_dirty를 먼저 끄므로, 계산 도중에 바뀐 카테고리는 다음 실행에서 다시 계산됩니다.
+'''
+from concurrent.futures import ThreadPoolExecutor
+
+from django.db import connection, transaction
+from django.db.models import Count, Q, Sum
+from django.utils import timezone
+
+from courses.models import Category, CategoryLeaderboardEntry, CategoryStats, Course
+from courses.ratings import average_from_points
+
+DEFAULT_TOP_N = 10
+DEFAULT_WORKERS = 4
+
+STATS_FIELDS = ['course_count', 'recruiting_count', 'review_count', 'average_rating']
+
+
+def mark_categories_dirty(category_ids=None):
+    '''카테고리(기본값: 전체)를 다음 갱신 대상으로 표시합니다.'''
+    queryset = CategoryStats.objects.filter(is_dirty=False)
+    if category_ids is not None:
+        queryset = queryset.filter(category_id__in=list(category_ids))
+    return queryset.update(is_dirty=True)
+
+
+def mark_courses_dirty(course_ids):
+    '''과외들이 속한 카테고리를 다음 갱신 대상으로 표시합니다. (UPDATE 한 번)'''
+    return CategoryStats.objects.filter(
+        is_dirty=False,
+        category_id__in=Course.objects.filter(pk__in=list(course_ids)).values('category_id'),
+    ).update(is_dirty=True)
+
+
+def compute_category_stats(category_id):
+    '''카테고리 하나의 집계 값을 Course 테이블에서 계산합니다.'''
+    totals = Course.objects.filter(category_id=category_id).aggregate(
+        course_count=Count('id'),
+        recruiting_count=Count('id', filter=Q(status=Course.StatusChoices.RECRUITING)),
+        review_count=Sum('review_count'),
+        rating_points_sum=Sum('rating_points_sum'),
+    )
+    review_count = totals['review_count'] or 0
+    return {
+        'course_count': totals['course_count'],
+        'recruiting_count': totals['recruiting_count'],
+        'review_count': review_count,
+        # 과외별 평균의 평균이 아니라 카테고리 전체 리뷰의 평균
+        'average_rating': average_from_points(totals['rating_points_sum'] or 0, review_count),
+    }
+
+
+def compute_category_snapshot(category_id, top_n=DEFAULT_TOP_N):
+    '''카테고리 하나의 (집계 값, [(과외 ID, 인기 점수), ...])를 계산합니다. (스레드 풀 워커에서 실행)'''
+    try:
+        stats = compute_category_stats(category_id)
+        top_courses = list(
+            Course.objects.top_popular(top_n, category=category_id).values_list('pk', 'popularity_score')
+        )
+        return category_id, stats, top_courses
+    finally:
+        # 워커 스레드마다 열린 연결을 정리함
+        connection.close()
+
+
+def _save_snapshots(snapshots):
+    # 쓰기는 호출한 스레드에서 한 트랜잭션으로 모아서 실행 (SQLite는 동시에 하나만 쓸 수 있음)
+    refreshed_at = timezone.now()
+    with transaction.atomic():
+        CategoryStats.objects.bulk_create(
+            [
+                CategoryStats(category_id=category_id, is_dirty=False, refreshed_at=refreshed_at, **stats)
+                for category_id, stats, _ in snapshots
+            ],
+            update_conflicts=True,
+            unique_fields=['category'],
+            update_fields=[*STATS_FIELDS, 'refreshed_at'],
+        )
+        CategoryLeaderboardEntry.objects.filter(
+            category_id__in=[category_id for category_id, _, _ in snapshots],
+        ).delete()
+        CategoryLeaderboardEntry.objects.bulk_create([
+            CategoryLeaderboardEntry(category_id=category_id, rank=rank, course_id=course_id, popularity_score=score)
+            for category_id, _, top_courses in snapshots
+            for rank, (course_id, score) in enumerate(top_courses)
+        ])
+
+
+def dirty_category_ids():
+    '''is_dirty인 카테고리와 아직 스냅샷이 없는 카테고리'''
+    dirty = set(CategoryStats.objects.filter(is_dirty=True).values_list('category_id', flat=True))
+    missing = set(Category.objects.filter(stats__isnull=True).values_list('pk', flat=True))
+    return sorted(dirty | missing)
+
+
+def refresh_category_stats(full=False, workers=DEFAULT_WORKERS, top_n=DEFAULT_TOP_N):
+    '''
+    바뀐 카테고리(full=True면 전체)의 집계를 스레드 풀에서 계산해서 저장하고, 계산한 카테고리 ID 목록을 반환합니다.
+    집계 쿼리는 카테고리마다 워커 스레드에서 동시에 실행하고, 저장은 마지막에 한 번만 합니다.
+    '''
+    if full:
+        category_ids = list(Category.objects.order_by('pk').values_list('pk', flat=True))
+    else:
+        category_ids = dirty_category_ids()
+    if not category_ids:
+        return []
+
+    # 계산 전에 표시를 끔 - 계산 도중에 바뀌면 시그널이 다시 켜서 다음 실행에서 다시 계산됨
+    CategoryStats.objects.filter(category_id__in=category_ids).update(is_dirty=False)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        snapshots = list(executor.map(lambda category_id: compute_category_snapshot(category_id, top_n), category_ids))
+    _save_snapshots(snapshots)
+    return category_ids
+
+
+def get_category_stats(category_id):
+    return CategoryStats.objects.filter(pk=category_id).first()
+
+
+def get_leaderboard(category_id, limit=DEFAULT_TOP_N):
+    '''미리 계산된 카테고리 인기 과외 순위 (과외 정보 포함, 쿼리 1번)'''
+    return list(
+        CategoryLeaderboardEntry.objects.filter(category_id=category_id)
+        .select_related('course')
+        .order_by('rank')[:limit]
+    )
@@ -0,0 +1,42 @@
+'''
+DB 연결 재사용 설정
+
+settings.py에서 DATABASES를 정의한 뒤 호출합니다. (모델을 import하지 않으므로 settings.py에서 사용 가능)
+
+    from courses.db_settings import configure_connections
+
+    DATABASES = {'default': {...}}
+    DATABASES['default'] = configure_connections(DATABASES['default'], asgi=True)
+
+- WSGI(runserver, gunicorn): CONN_MAX_AGE로 요청 사이에 연결을 재사용하고, CONN_HEALTH_CHECKS로 끊긴 연결은 다시 엶
+- ASGI + PostgreSQL: async 뷰는 요청마다 연결이 닫히므로 psycopg 연결 풀을 사용 (Django 5.1+, pip install "psycopg[pool]")
+  연결 풀은 CONN_MAX_AGE와 함께 쓸 수 없으므로 CONN_MAX_AGE는 0으로 둡니다.
+  psycopg_pool이 설치되어 있지 않으면 WSGI와 같은 설정을 사용합니다.
+'''
+import importlib.util
+
+DEFAULT_CONN_MAX_AGE = 60
+DEFAULT_POOL_MIN_SIZE = 4
+DEFAULT_POOL_MAX_SIZE = 16
+
+POSTGRESQL_ENGINE = 'django.db.backends.postgresql'
+
+
+def _has_psycopg_pool():
+    return importlib.util.find_spec('psycopg_pool') is not None
+
+
+def configure_connections(database, asgi=False, conn_max_age=DEFAULT_CONN_MAX_AGE,
+                          pool_min_size=DEFAULT_POOL_MIN_SIZE, pool_max_size=DEFAULT_POOL_MAX_SIZE):
+    '''연결 재사용 설정을 추가한 DATABASES 항목의 복사본을 반환합니다. (이미 OPTIONS에 있는 pool 설정은 유지)'''
+    database = dict(database)
+    options = dict(database.get('OPTIONS', {}))
+    if asgi and database.get('ENGINE') == POSTGRESQL_ENGINE and _has_psycopg_pool():
+        options.setdefault('pool', {'min_size': pool_min_size, 'max_size': pool_max_size})
+        database['CONN_MAX_AGE'] = 0
+    else:
+        options.pop('pool', None)
+        database['CONN_MAX_AGE'] = conn_max_age
+        database['CONN_HEALTH_CHECKS'] = True
+    database['OPTIONS'] = options
+    return database
@@ -0,0 +1,82 @@
+'''
+정원을 넘지 않는 수강 신청 (좌석 예약)
+
+먼저 조회하고 나중에 저장하는 방식(read-then-write)은 동시에 신청이 몰리면 정원을 초과하고,
+과외 행을 잠그고 확인하면 신청이 한 줄로 늘어서게 됩니다.
+여기서는 조건부 UPDATE 한 번으로 좌석을 예약합니다.
+
+    UPDATE course SET current_tutees_count = current_tutees_count + 1, ...
+    WHERE id = %s AND status = 'recruiting' AND current_tutees_count < max_tutees
+
+갱신된 행이 1개면 좌석을 얻은 것이고, 같은 트랜잭션 안에서 Enrollment를 생성합니다.
+마지막 좌석이 채워지면 과외 상태를 recruiting -> in_progress로 바꿉니다.
+'''
+from django.db import IntegrityError, transaction
+from django.db.models import F
+
+from courses import cache, category_stats
+from courses.cached_fields import tutee_count_updates
+from courses.models import Course, Enrollment
+
+
+class EnrollmentError(Exception):
+    '''수강 신청 실패'''
+
+
+class CourseNotRecruiting(EnrollmentError):
+    '''모집중이 아닌 과외'''
+
+
+class CourseFull(EnrollmentError):
+    '''정원이 가득 찬 과외'''
+
+
+class AlreadyEnrolled(EnrollmentError):
+    '''이미 수강 신청한 과외'''
+
+
+def _reservation_failure(course_id):
+    # 좌석 예약 UPDATE가 0행이면 실패 원인을 확인함 (실패 경로에서만 조회)
+    course = Course.objects.filter(pk=course_id).values('status', 'current_tutees_count', 'max_tutees').first()
+    if course is None:
+        return Course.DoesNotExist(f'과외(id={course_id})가 존재하지 않습니다.')
+    if course['status'] != Course.StatusChoices.RECRUITING:
+        return CourseNotRecruiting(f'모집중인 과외가 아닙니다. (id={course_id}, status={course["status"]})')
+    return CourseFull(f'정원이 가득 찼습니다. (id={course_id}, 정원 {course["max_tutees"]}명)')
+
+
+def enroll(user_id, course_id, start_date, end_date):
+    '''
+    좌석을 예약하고 Enrollment를 생성해서 반환합니다.
+    실패하면 CourseFull / CourseNotRecruiting / AlreadyEnrolled / Course.DoesNotExist를 발생시키고,
+    예약한 좌석은 트랜잭션 롤백으로 함께 취소됩니다.
+    '''
+    with transaction.atomic():
+        reserved = Course.objects.filter(
+            pk=course_id,
+            status=Course.StatusChoices.RECRUITING,
+            current_tutees_count__lt=F('max_tutees'),
+        ).update(**tutee_count_updates(1))
+        if not reserved:
+            raise _reservation_failure(course_id)
+
+        enrollment = Enrollment(user_id=user_id, course_id=course_id, start_date=start_date, end_date=end_date)
+        # 좌석 예약에서 이미 current_tutees_count를 올렸으므로 시그널에서는 과외 카운터를 건너뜀
+        enrollment._seat_reserved = True
+        try:
+            with transaction.atomic():
+                enrollment.save()
+        except IntegrityError:
+            raise AlreadyEnrolled(f'이미 수강 신청한 과외입니다. (user={user_id}, course={course_id})')
+
+        # 마지막 좌석이었으면 모집 마감
+        Course.objects.filter(
+            pk=course_id,
+            status=Course.StatusChoices.RECRUITING,
+            current_tutees_count__gte=F('max_tutees'),
+        ).update(status=Course.StatusChoices.IN_PROGRESS)
+
+    # 좌석 예약 경로는 시그널의 과외 카운터 갱신(_apply)을 건너뛰므로 카테고리 집계 갱신 표시도 여기서 함
+    category_stats.mark_courses_dirty([course_id])
+    cache.invalidate_course(course_id)
+    return enrollment
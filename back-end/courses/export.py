@@ -0,0 +1,286 @@
+'''
+오프라인 작업(분석, 추천, 데이터 검사)용 컬럼 스냅샷 내보내기
+
+User, Course, Enrollment, WishedCourses, Review를 모델 인스턴스 없이 values_list().iterator()로 chunk_size행씩 읽어
+컬럼마다 NumPy .npy 파일로 저장합니다. 다운스트림 작업은 라이브 DB를 조회하지 않고
+np.load(mmap_mode='r')로 필요한 컬럼만 메모리 매핑해서 읽습니다. (load_part 참고)
+
+    <경로>/manifest.json
+    <경로>/<테이블>/part-00000/id.npy, course_id.npy, ...
+    <경로>/<테이블>/part-00000/title.offsets.npy, title.data.npy   (문자열: UTF-8 바이트 + 시작 위치)
+
+- 전체 내보내기: 테이블의 모든 행을 새 part 하나로 저장하고 이전 part는 지웁니다.
+- 증분 내보내기: manifest의 워터마크(created_at, Course는 updated_at) 이후의 행만 새 part로 추가합니다.
+  같은 ID가 여러 part에 있으면 마지막 part의 값이 최신입니다. (load_table은 ID마다 마지막 값만 남김)
+  QuerySet.update로 바뀐 값(캐싱 카운터, 상태 변경 등)은 updated_at이 바뀌지 않으므로 전체 내보내기에서 반영됩니다.
+  Enrollment는 created_at 기준이므로 enrolled -> completed 같은 상태 변경(courses/status_transitions.py)도
+  증분 part에는 들어가지 않습니다. 상태가 필요한 작업은 전체 내보내기 이후의 값을 사용합니다.
+- 워터마크 지연: 타임스탬프가 커밋 순서와 다를 수 있으므로(먼저 시작해서 늦게 커밋된 트랜잭션),
+  값이 WATERMARK_LAG(기본 5분) 이전인 행까지만 내보내고 최근 행은 다음 실행에서 내보냅니다.
+  (설정: settings.EXPORT_WATERMARK_LAG = 300  # 초)
+- 날짜/시각은 datetime64[D] / datetime64[us](UTC)로 저장합니다.
+'''
+import json
+import os
+import shutil
+from datetime import timedelta, timezone as dt_timezone
+from itertools import islice
+
+import numpy as np
+from django.apps import apps
+from django.conf import settings
+from django.db.models import Max
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+MANIFEST_NAME = 'manifest.json'
+MANIFEST_VERSION = 1
+DEFAULT_CHUNK_SIZE = 10000
+WATERMARK_LAG = timedelta(seconds=getattr(settings, 'EXPORT_WATERMARK_LAG', 300))
+
+KIND_DTYPES = {
+    'int': np.int64,
+    'float': np.float64,
+    'bool': np.bool_,
+    'date': np.dtype('datetime64[D]'),
+    'datetime': np.dtype('datetime64[us]'),
+}
+
+# 테이블 이름 -> (모델, 워터마크 필드, [(컬럼, 종류), ...])
+EXPORT_TABLES = {
+    'user': (settings.AUTH_USER_MODEL, 'created_at', [
+        ('id', 'int'), ('username', 'str'), ('name', 'str'), ('is_active', 'bool'), ('created_at', 'datetime'),
+    ]),
+    'course': ('courses.Course', 'updated_at', [
+        ('id', 'int'), ('tutor_id', 'int'), ('category_id', 'int'), ('status', 'str'), ('title', 'str'),
+        ('max_tutees', 'int'), ('current_tutees_count', 'int'), ('wishlist_count', 'int'), ('review_count', 'int'),
+        ('rating_points_sum', 'int'), ('average_rating', 'float'), ('popularity_score', 'float'),
+        ('created_at', 'datetime'), ('updated_at', 'datetime'),
+    ]),
+    'enrollment': ('courses.Enrollment', 'created_at', [
+        ('id', 'int'), ('user_id', 'int'), ('course_id', 'int'), ('status', 'str'),
+        ('start_date', 'date'), ('end_date', 'date'), ('created_at', 'datetime'),
+    ]),
+    'wish': ('courses.WishedCourses', 'created_at', [
+        ('id', 'int'), ('user_id', 'int'), ('course_id', 'int'), ('created_at', 'datetime'),
+    ]),
+    'review': ('reviews.Review', 'created_at', [
+        ('id', 'int'), ('enrollment_id', 'int'), ('rating', 'float'), ('created_at', 'datetime'),
+    ]),
+}
+
+
+def _to_utc_naive(value):
+    # numpy datetime64는 시간대를 저장하지 않으므로 UTC로 바꿔서 저장함
+    if value is not None and timezone.is_aware(value):
+        return value.astimezone(dt_timezone.utc).replace(tzinfo=None)
+    return value
+
+
+class _NpyWriter:
+    '''길이를 모르는 1차원 배열을 조각 단위로 이어 쓰고, 마지막에 .npy 헤더를 붙입니다.'''
+
+    def __init__(self, path, dtype):
+        self.path = path
+        self.dtype = np.dtype(dtype)
+        self.length = 0
+        self._raw = open(f'{path}.raw', 'wb')
+
+    def append(self, array):
+        array = np.ascontiguousarray(array, dtype=self.dtype)
+        self._raw.write(array.tobytes())
+        self.length += len(array)
+
+    def close(self):
+        self._raw.close()
+        header = {'descr': np.lib.format.dtype_to_descr(self.dtype), 'fortran_order': False, 'shape': (self.length,)}
+        with open(self.path, 'wb') as out, open(f'{self.path}.raw', 'rb') as raw:
+            np.lib.format.write_array_header_1_0(out, header)
+            shutil.copyfileobj(raw, out, 1 << 20)
+        os.remove(f'{self.path}.raw')
+
+
+class _StringWriter:
+    '''문자열 컬럼: UTF-8 바이트를 이어 붙인 data와 행별 시작 위치 offsets(행 수 + 1개)'''
+
+    def __init__(self, path):
+        self.offsets = _NpyWriter(f'{path}.offsets.npy', np.int64)
+        self.data = _NpyWriter(f'{path}.data.npy', np.uint8)
+        self.offsets.append([0])
+
+    @property
+    def length(self):
+        return self.offsets.length - 1
+
+    def append(self, values):
+        encoded = [(value or '').encode('utf-8') for value in values]
+        lengths = np.fromiter((len(item) for item in encoded), dtype=np.int64, count=len(encoded))
+        self.offsets.append(self.data.length + np.cumsum(lengths))
+        self.data.append(np.frombuffer(b''.join(encoded), dtype=np.uint8))
+
+    def close(self):
+        self.offsets.close()
+        self.data.close()
+
+
+class StringColumn:
+    '''메모리 매핑된 문자열 컬럼 - column[i]로 i번째 행의 문자열을 읽습니다.'''
+
+    def __init__(self, offsets, data):
+        self.offsets = offsets
+        self.data = data
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def __getitem__(self, index):
+        return bytes(self.data[self.offsets[index]:self.offsets[index + 1]]).decode('utf-8')
+
+
+def _column_writer(part_dir, column, kind):
+    if kind == 'str':
+        return _StringWriter(os.path.join(part_dir, column))
+    return _NpyWriter(os.path.join(part_dir, f'{column}.npy'), KIND_DTYPES[kind])
+
+
+def _write_part(queryset, columns, part_dir, chunk_size):
+    '''queryset을 chunk_size행씩 읽어 컬럼 파일로 저장하고 행 수를 반환합니다.'''
+    os.makedirs(part_dir)
+    writers = [_column_writer(part_dir, column, kind) for column, kind in columns]
+    rows = queryset.values_list(*[column for column, _ in columns]).order_by('pk').iterator(chunk_size=chunk_size)
+    while True:
+        chunk = list(islice(rows, chunk_size))
+        if not chunk:
+            break
+        for writer, (_, kind), values in zip(writers, columns, zip(*chunk)):
+            if kind == 'datetime':
+                values = [_to_utc_naive(value) for value in values]
+            elif kind == 'float':
+                # DecimalField(Review.rating)도 float로 저장함
+                values = [float(value) for value in values]
+            writer.append(values)
+    for writer in writers:
+        writer.close()
+    return writers[0].length
+
+
+def load_manifest(path):
+    manifest_path = os.path.join(path, MANIFEST_NAME)
+    if not os.path.exists(manifest_path):
+        return {'version': MANIFEST_VERSION, 'tables': {}}
+    with open(manifest_path, encoding='utf-8') as file:
+        return json.load(file)
+
+
+def _save_manifest(path, manifest):
+    # 다운스트림 작업이 쓰다 만 manifest를 읽지 않도록 임시 파일에 쓰고 바꿔치기함
+    manifest_path = os.path.join(path, MANIFEST_NAME)
+    with open(f'{manifest_path}.tmp', 'w', encoding='utf-8') as file:
+        json.dump(manifest, file, ensure_ascii=False, indent=2)
+    os.replace(f'{manifest_path}.tmp', manifest_path)
+
+
+def export_table(path, table, manifest, full=False, chunk_size=DEFAULT_CHUNK_SIZE, lag=WATERMARK_LAG):
+    '''테이블 하나를 새 part로 내보내고 manifest를 갱신합니다. 내보낸 행 수를 반환합니다.'''
+    model_label, watermark_field, columns = EXPORT_TABLES[table]
+    model = apps.get_model(model_label)
+    previous = manifest['tables'].get(table) or {'watermark': None, 'parts': []}
+    full = full or not previous['parts']
+    watermark = None if full else previous['watermark']
+
+    # 내보내는 도중에 추가되는 행과 아직 커밋되지 않았을 수 있는 최근 행은 다음 실행에서 반영되도록 상한을 먼저 고정함
+    cutoff = timezone.now() - lag
+    high = model.objects.filter(**{f'{watermark_field}__lte': cutoff}).aggregate(high=Max(watermark_field))['high']
+    queryset = model.objects.all()
+    if high is not None:
+        queryset = queryset.filter(**{f'{watermark_field}__lte': high})
+    else:
+        # 지연 시간보다 오래된 행이 없음
+        queryset = queryset.none()
+    if watermark is not None:
+        queryset = queryset.filter(**{f'{watermark_field}__gt': parse_datetime(watermark)})
+
+    # part 이름은 이전 part와 겹치지 않게 계속 늘려 감 (전체 내보내기 중에도 이전 part를 읽을 수 있음)
+    index = max((int(part['name'].split('-')[1]) for part in previous['parts']), default=-1) + 1
+    part_name = f'part-{index:05d}'
+    table_dir = os.path.join(path, table)
+    tmp_dir = os.path.join(table_dir, f'.{part_name}.tmp')
+    shutil.rmtree(tmp_dir, ignore_errors=True)
+    rows = _write_part(queryset, columns, tmp_dir, chunk_size)
+
+    parts = [] if full else list(previous['parts'])
+    if rows or full:
+        os.replace(tmp_dir, os.path.join(table_dir, part_name))
+        parts.append({'name': part_name, 'rows': rows, 'full': full, 'exported_at': timezone.now().isoformat()})
+    else:
+        # 새 행이 없으면 빈 part를 만들지 않음
+        shutil.rmtree(tmp_dir)
+    manifest['tables'][table] = {
+        'watermark_field': watermark_field,
+        'watermark': high.isoformat() if high is not None else watermark,
+        'columns': dict(columns),
+        'parts': parts,
+    }
+    _save_manifest(path, manifest)
+
+    # manifest가 새 part를 가리킨 뒤에 이전 part를 지움
+    if full:
+        for part in previous['parts']:
+            shutil.rmtree(os.path.join(table_dir, part['name']), ignore_errors=True)
+    return rows
+
+
+def export_snapshot(path, tables=None, full=False, chunk_size=DEFAULT_CHUNK_SIZE, lag=WATERMARK_LAG):
+    '''테이블들을 내보내고 {테이블: 내보낸 행 수}를 반환합니다.'''
+    os.makedirs(path, exist_ok=True)
+    manifest = load_manifest(path)
+    return {
+        table: export_table(path, table, manifest, full=full, chunk_size=chunk_size, lag=lag)
+        for table in (tables or EXPORT_TABLES)
+    }
+
+
+def load_part(path, table, part_name):
+    '''part 하나의 컬럼들을 메모리 매핑해서 {컬럼: 배열 또는 StringColumn}으로 반환합니다.'''
+    part_dir = os.path.join(path, table, part_name)
+    columns = {}
+    for column, kind in EXPORT_TABLES[table][2]:
+        if kind == 'str':
+            columns[column] = StringColumn(
+                np.load(os.path.join(part_dir, f'{column}.offsets.npy'), mmap_mode='r'),
+                np.load(os.path.join(part_dir, f'{column}.data.npy'), mmap_mode='r'),
+            )
+        else:
+            columns[column] = np.load(os.path.join(part_dir, f'{column}.npy'), mmap_mode='r')
+    return columns
+
+
+def iter_parts(path, table):
+    '''manifest 순서(오래된 것부터)대로 테이블의 part를 메모리 매핑해서 반환합니다.'''
+    for part in load_manifest(path)['tables'].get(table, {}).get('parts', []):
+        yield part, load_part(path, table, part['name'])
+
+
+def load_table(path, table, columns=None):
+    '''
+    모든 part를 합쳐 ID마다 마지막 part의 값만 남긴 {컬럼: 배열}을 ID 순서로 반환합니다.
+    메모리에 모두 읽으므로 문자열 컬럼은 object 배열이 됩니다. (columns로 필요한 컬럼만 지정)
+    '''
+    kinds = dict(EXPORT_TABLES[table][2])
+    columns = list(columns or kinds)
+    chunks = {column: [] for column in ['id', *columns]}
+    for _, part in iter_parts(path, table):
+        for column in chunks:
+            values = part[column]
+            if kinds[column] == 'str':
+                values = np.array([values[i] for i in range(len(values))], dtype=object)
+            chunks[column].append(np.asarray(values))
+    if not chunks['id']:
+        return {column: np.empty(0, dtype=object if kinds[column] == 'str' else KIND_DTYPES[kinds[column]])
+                for column in columns}
+
+    ids = np.concatenate(chunks['id'])
+    # 뒤집어서 np.unique의 첫 위치를 구하면 원래 순서에서 마지막(가장 최근 part) 위치가 됨
+    _, last_from_end = np.unique(ids[::-1], return_index=True)
+    keep = len(ids) - 1 - last_from_end
+    return {column: np.concatenate(chunks[column])[keep] for column in columns}
@@ -0,0 +1,210 @@
+'''
+쿼리 수 / DB 시간 / 처리 행 수 계측
+
+    from courses import instrumentation
+
+    instrumentation.enable(detect_n_plus_one=True)
+
+    @instrumentation.instrumented('seed_courses')
+    def seed_courses(file_path):
+        for row in reader:
+            instrumentation.count_rows()
+            ...
+
+    instrumentation.write_report('seed_report.json')
+
+- 계측은 기본적으로 꺼져 있고, 꺼져 있으면 instrumented / stage()는 원래 함수만 실행합니다.
+- connection.execute_wrapper를 사용하므로 DEBUG=False에서도 동작하며, 현재 스레드의 기본 DB 연결만 기록합니다.
+- 같은 이름의 단계가 여러 번 실행되면(모델 메서드 등) 합산해서 보고합니다.
+- N+1 감지: 한 번의 실행 안에서 같은 SQL(파라미터 제외)이 threshold번 이상 실행되면 보고서에 남깁니다.
+  (예: 행마다 User.objects.get(id=...)을 호출하는 시딩 루프)
+'''
+import contextlib
+import functools
+import json
+import threading
+import time
+from collections import Counter
+
+from django.db import connection
+
+DEFAULT_N_PLUS_ONE_THRESHOLD = 10
+
+# 트랜잭션 제어 문은 반복되어도 N+1이 아님
+_TRANSACTION_STATEMENTS = ('BEGIN', 'COMMIT', 'ROLLBACK', 'SAVEPOINT', 'RELEASE')
+
+
+class _Invocation:
+    # 단계 한 번 실행 동안의 기록
+    def __init__(self, name, track_sql):
+        self.name = name
+        self.queries = 0
+        self.db_time = 0.0
+        self.rows = 0
+        self.sql = Counter() if track_sql else None
+
+
+class StageStats:
+    '''같은 이름의 단계를 모두 합산한 통계'''
+
+    def __init__(self, name):
+        self.name = name
+        self.calls = 0
+        self.queries = 0
+        self.db_time = 0.0
+        self.wall_time = 0.0
+        self.rows = 0
+        # N+1 의심 SQL -> 한 번의 실행 안에서 반복된 최대 횟수
+        self.repeated_queries = {}
+
+    def add(self, invocation, wall_time, threshold):
+        self.calls += 1
+        self.queries += invocation.queries
+        self.db_time += invocation.db_time
+        self.wall_time += wall_time
+        self.rows += invocation.rows
+        if invocation.sql is not None:
+            for sql, count in invocation.sql.items():
+                if count >= threshold and not sql.lstrip().upper().startswith(_TRANSACTION_STATEMENTS):
+                    self.repeated_queries[sql] = max(count, self.repeated_queries.get(sql, 0))
+
+    def as_dict(self):
+        return {
+            'name': self.name,
+            'calls': self.calls,
+            'queries': self.queries,
+            'queries_per_call': self.queries / self.calls if self.calls else 0,
+            'db_time': round(self.db_time, 6),
+            'wall_time': round(self.wall_time, 6),
+            'rows': self.rows,
+            'rows_per_sec': round(self.rows / self.wall_time, 1) if self.rows and self.wall_time else None,
+        }
+
+
+class Instrumentation:
+    def __init__(self):
+        self.enabled = False
+        self.detect_n_plus_one = False
+        self.n_plus_one_threshold = DEFAULT_N_PLUS_ONE_THRESHOLD
+        self.stats = {}
+        self._local = threading.local()
+
+    def enable(self, detect_n_plus_one=False, threshold=DEFAULT_N_PLUS_ONE_THRESHOLD):
+        self.enabled = True
+        self.detect_n_plus_one = detect_n_plus_one
+        self.n_plus_one_threshold = threshold
+
+    def disable(self):
+        self.enabled = False
+
+    def reset(self):
+        self.stats = {}
+
+    def _stack(self):
+        stack = getattr(self._local, 'stack', None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def _record(self, execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            elapsed = time.perf_counter() - started
+            # 중첩된 단계는 바깥 단계에도 함께 기록됨
+            for invocation in self._stack():
+                invocation.queries += 1
+                invocation.db_time += elapsed
+                if invocation.sql is not None:
+                    invocation.sql[sql] += 1
+
+    @contextlib.contextmanager
+    def stage(self, name):
+        '''블록 안에서 실행된 쿼리 수, DB 시간, 전체 시간, count_rows()로 센 행 수를 name으로 기록합니다.'''
+        if not self.enabled:
+            yield None
+            return
+
+        stack = self._stack()
+        invocation = _Invocation(name, self.detect_n_plus_one)
+        stack.append(invocation)
+        started = time.perf_counter()
+        try:
+            if len(stack) == 1:
+                # 가장 바깥 단계에서만 wrapper를 등록함
+                with connection.execute_wrapper(self._record):
+                    yield invocation
+            else:
+                yield invocation
+        finally:
+            wall_time = time.perf_counter() - started
+            stack.pop()
+            stats = self.stats.get(name)
+            if stats is None:
+                stats = self.stats[name] = StageStats(name)
+            stats.add(invocation, wall_time, self.n_plus_one_threshold)
+
+    def count_rows(self, n=1):
+        '''실행 중인 단계(중첩된 바깥 단계 포함)의 처리 행 수에 n을 더합니다.'''
+        if not self.enabled:
+            return
+        for invocation in self._stack():
+            invocation.rows += n
+
+    def instrumented(self, name=None):
+        '''함수/메서드 실행을 하나의 단계로 기록하는 데코레이터'''
+        def decorator(func):
+            stage_name = name or func.__qualname__
+
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                if not self.enabled:
+                    return func(*args, **kwargs)
+                with self.stage(stage_name):
+                    return func(*args, **kwargs)
+            return wrapper
+        return decorator
+
+    def report(self):
+        '''단계별 통계와 N+1 의심 쿼리를 JSON으로 저장할 수 있는 dict로 반환합니다.'''
+        n_plus_one = [
+            {'stage': stats.name, 'sql': sql, 'max_repeats': count}
+            for stats in self.stats.values()
+            for sql, count in sorted(stats.repeated_queries.items(), key=lambda item: -item[1])
+        ]
+        return {
+            'stages': [stats.as_dict() for stats in self.stats.values()],
+            'n_plus_one_threshold': self.n_plus_one_threshold if self.detect_n_plus_one else None,
+            'n_plus_one': n_plus_one,
+        }
+
+    def write_report(self, path):
+        with open(path, 'w', encoding='utf-8') as file:
+            json.dump(self.report(), file, ensure_ascii=False, indent=2)
+
+    def summary_lines(self):
+        '''사람이 읽을 수 있는 단계별 요약'''
+        lines = [f"{'단계':<32} {'호출':>6} {'쿼리':>8} {'DB(s)':>8} {'전체(s)':>8} {'행':>8} {'행/s':>10}"]
+        for stats in self.stats.values():
+            data = stats.as_dict()
+            rows_per_sec = f"{data['rows_per_sec']:.1f}" if data['rows_per_sec'] is not None else '-'
+            lines.append(
+                f"{stats.name:<32} {stats.calls:>6} {stats.queries:>8} {stats.db_time:>8.3f} "
+                f"{stats.wall_time:>8.3f} {stats.rows:>8} {rows_per_sec:>10}"
+            )
+        return lines
+
+
+# 프로세스 전체에서 사용하는 기본 인스턴스
+recorder = Instrumentation()
+
+enable = recorder.enable
+disable = recorder.disable
+reset = recorder.reset
+stage = recorder.stage
+count_rows = recorder.count_rows
+instrumented = recorder.instrumented
+report = recorder.report
+write_report = recorder.write_report
+summary_lines = recorder.summary_lines
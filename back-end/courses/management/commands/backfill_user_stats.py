@@ -0,0 +1,29 @@
+from django.core.management.base import BaseCommand
+
+from courses.user_stats import backfill_user_stats, find_user_stats_drift
+
+
+class Command(BaseCommand):
+    help = '유저별 대시보드 카운터(개설/수강/찜한 과외 수)를 실제 값으로 채우거나 어긋난 값을 찾습니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=1000,
+                            help='한 번에 처리할 유저 수 (기본값: 1000)')
+        parser.add_argument('--audit', action='store_true',
+                            help='값을 바꾸지 않고 어긋난 카운터만 출력합니다.')
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        if not options['audit']:
+            count = backfill_user_stats(batch_size)
+            self.stdout.write(self.style.SUCCESS(f'유저 {count}명의 카운터를 채웠습니다.'))
+            return
+
+        drift = find_user_stats_drift(batch_size)
+        for user_id, field, stored, actual in drift:
+            self.stdout.write(f'유저 {user_id}: {field} 저장값={stored} 실제값={actual}')
+        if drift:
+            users = len({user_id for user_id, *_ in drift})
+            self.stdout.write(self.style.WARNING(f'유저 {users}명의 카운터가 어긋나 있습니다.'))
+        else:
+            self.stdout.write(self.style.SUCCESS('어긋난 카운터가 없습니다.'))
@@ -0,0 +1,30 @@
+import time
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+
+from courses.recommendations import DEFAULT_TOP_K, WATERMARK_LAG, build_recommendations
+
+
+class Command(BaseCommand):
+    help = '찜/수강 동시 발생 행렬로 과외별 추천 top K를 계산합니다. (기본: 마지막 계산 이후의 찜/수강만 읽는 증분 갱신)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--full', action='store_true',
+                            help='워터마크를 무시하고 모든 과외의 추천을 다시 계산합니다. (삭제된 찜/수강 반영)')
+        parser.add_argument('--top-k', type=int, default=DEFAULT_TOP_K,
+                            help=f'과외별로 저장할 추천 수 (기본값: {DEFAULT_TOP_K})')
+        parser.add_argument('--batch-size', type=int, default=500,
+                            help='한 번에 계산/저장할 과외 수 (기본값: 500)')
+        parser.add_argument('--lag', type=float, default=WATERMARK_LAG.total_seconds(),
+                            help=f'생성된 지 이 시간(초)이 지나지 않은 찜/수강은 다음 실행에서 반영합니다. '
+                                 f'(기본값: {WATERMARK_LAG.total_seconds():g})')
+
+    def handle(self, *args, **options):
+        started = time.perf_counter()
+        updated = build_recommendations(
+            full=options['full'], top_k=options['top_k'], batch_size=options['batch_size'],
+            lag=timedelta(seconds=options['lag']),
+        )
+        elapsed = time.perf_counter() - started
+        self.stdout.write(self.style.SUCCESS(f'과외 {updated}개의 추천을 갱신했습니다. ({elapsed:.2f}초)'))
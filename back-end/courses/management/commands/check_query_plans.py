@@ -0,0 +1,91 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.utils import timezone
+
+from courses.models import Course, Enrollment, WishedCourses
+from courses.pagination import KeysetPaginator
+
+
+def keyset_page(queryset, ordering, value, pk=1):
+    # 커서(value, pk) 다음 페이지를 조회하는 쿼리셋
+    paginator = KeysetPaginator(queryset, ordering)
+    return queryset.order_by(*paginator._order_by()).filter(paginator._after(value, pk))[:paginator.page_size + 1]
+
+
+def hot_queries():
+    '''
+    (이름, 쿼리셋, 사용해야 하는 인덱스) 목록
+    값은 실행 계획만 확인하므로 실제 데이터가 없어도 됩니다.
+    '''
+    now = timezone.now()
+    return [
+        ('내 찜 목록 (최신순)',
+         WishedCourses.objects.filter(user_id=1).order_by('-created_at'),
+         'wished_user_created_idx'),
+        ('내 수강 목록 (최신순)',
+         Enrollment.objects.filter(user_id=1).order_by('-created_at'),
+         'enrollment_user_created_idx'),
+        ('과외별 수강중인 수강생',
+         Enrollment.objects.filter(course_id=1, status=Enrollment.StatusChoices.ENROLLED),
+         'enrollment_course_status_idx'),
+        ('수강 기간이 끝난 수강 신청',
+         Enrollment.objects.filter(status=Enrollment.StatusChoices.ENROLLED, end_date__lt='2025-01-01')
+         .order_by('end_date'),
+         'enrollment_status_end_idx'),
+        ('카테고리별 모집중 인기 과외',
+         Course.objects.top_recruiting(10, category=1),
+         'course_cat_status_pop_idx'),
+        ('모집중 인기 과외',
+         Course.objects.top_recruiting(10),
+         'course_status_pop_idx'),
+        # 커서 페이지네이션 - (정렬 키, id) 동점 정렬까지 인덱스로 처리해야 함
+        ('과외 최신순 다음 페이지',
+         keyset_page(Course.objects.all(), '-created_at', now),
+         'course_created_idx'),
+        ('카테고리별 과외 최신순 다음 페이지',
+         keyset_page(Course.objects.filter(category_id=1), '-created_at', now),
+         'course_cat_created_idx'),
+        ('카테고리별 과외 인기순 다음 페이지',
+         keyset_page(Course.objects.filter(category_id=1), '-popularity_score', 1.0),
+         'course_cat_pop_idx'),
+        ('카테고리별 모집중 과외 인기순 다음 페이지',
+         keyset_page(Course.objects.filter(category_id=1, status=Course.StatusChoices.RECRUITING),
+                     '-popularity_score', 1.0),
+         'course_cat_status_pop_idx'),
+        ('내 찜 목록 다음 페이지',
+         keyset_page(WishedCourses.objects.filter(user_id=1), '-created_at', now),
+         'wished_user_created_idx'),
+        ('내 수강 목록 다음 페이지',
+         keyset_page(Enrollment.objects.filter(user_id=1), '-created_at', now),
+         'enrollment_user_created_idx'),
+    ]
+
+
+class Command(BaseCommand):
+    help = '자주 실행되는 목록 쿼리의 실행 계획(EXPLAIN)을 확인하여 인덱스를 사용하는지 검사합니다. (SQLite 기준)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--verbose-plan', action='store_true', help='실행 계획 전체를 출력합니다.')
+
+    def handle(self, *args, **options):
+        if connection.vendor != 'sqlite':
+            self.stdout.write(self.style.WARNING(
+                f'{connection.vendor}에서는 데이터 양에 따라 실행 계획이 달라질 수 있습니다. SQLite 기준으로 검사합니다.'
+            ))
+
+        failures = []
+        for name, queryset, index_name in hot_queries():
+            plan = queryset.explain()
+            if options['verbose_plan']:
+                self.stdout.write(plan)
+
+            # 인덱스를 사용하지 않거나, 정렬을 위해 임시 B-TREE를 만들면 실패로 처리함
+            if index_name not in plan:
+                failures.append(f'{name}: {index_name} 인덱스를 사용하지 않습니다.')
+            elif 'TEMP B-TREE' in plan:
+                failures.append(f'{name}: 정렬을 위해 임시 B-TREE를 사용합니다.')
+            else:
+                self.stdout.write(self.style.SUCCESS(f'{name}: {index_name} 사용'))
+
+        if failures:
+            raise CommandError('\n'.join(failures))
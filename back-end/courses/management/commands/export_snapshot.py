@@ -0,0 +1,31 @@
+import time
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+
+from courses.export import DEFAULT_CHUNK_SIZE, EXPORT_TABLES, WATERMARK_LAG, export_snapshot
+
+
+class Command(BaseCommand):
+    help = '유저/과외/수강 신청/찜/리뷰를 오프라인 작업용 NumPy 컬럼 스냅샷으로 내보냅니다. (기본: 마지막 내보내기 이후 증분)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', help='스냅샷 폴더 (manifest.json이 있으면 이어서 증분 내보내기)')
+        parser.add_argument('--full', action='store_true', help='워터마크를 무시하고 모든 행을 다시 내보냅니다.')
+        parser.add_argument('--tables', nargs='+', choices=EXPORT_TABLES, help='해당 테이블만 내보냅니다.')
+        parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE,
+                            help=f'한 번에 읽어서 쓸 행 수 (기본값: {DEFAULT_CHUNK_SIZE})')
+        parser.add_argument('--lag', type=float, default=WATERMARK_LAG.total_seconds(),
+                            help=f'워터마크 값이 이 시간(초) 안쪽인 최근 행은 다음 실행에서 내보냅니다. '
+                                 f'(기본값: {WATERMARK_LAG.total_seconds():g})')
+
+    def handle(self, *args, **options):
+        for table in options['tables'] or EXPORT_TABLES:
+            started = time.perf_counter()
+            rows = export_snapshot(
+                options['path'], [table], full=options['full'], chunk_size=options['chunk_size'],
+                lag=timedelta(seconds=options['lag']),
+            )[table]
+            elapsed = time.perf_counter() - started
+            rate = rows / elapsed if elapsed else 0.0
+            self.stdout.write(self.style.SUCCESS(f'{table}: {rows}행 ({elapsed:.2f}초, {rate:,.0f}행/초)'))
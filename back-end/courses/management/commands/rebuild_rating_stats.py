@@ -0,0 +1,21 @@
+from django.core.management.base import BaseCommand
+
+from courses.cached_fields import rebuild_rating_stats
+from courses.models import Course
+
+
+class Command(BaseCommand):
+    help = '과외별 리뷰 수, 평점 합계, 평점 히스토그램, 평균 평점을 리뷰 테이블에서 다시 집계합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=500,
+                            help='한 번에 집계/갱신할 과외 수 (기본값: 500)')
+        parser.add_argument('--course', type=int, nargs='+', help='해당 ID의 과외만 다시 집계합니다.')
+
+    def handle(self, *args, **options):
+        queryset = Course.objects.all()
+        if options['course']:
+            queryset = queryset.filter(pk__in=options['course'])
+
+        updated = rebuild_rating_stats(queryset, batch_size=options['batch_size'])
+        self.stdout.write(self.style.SUCCESS(f'과외 {updated}개의 평점 통계를 다시 집계했습니다.'))
@@ -0,0 +1,21 @@
+from django.core.management.base import BaseCommand
+
+from courses.models import Course
+from courses.search import rebuild_search_index
+
+
+class Command(BaseCommand):
+    help = '과외 제목/소개/커리큘럼 검색 색인을 다시 만듭니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=500,
+                            help='한 번에 색인할 과외 수 (기본값: 500)')
+        parser.add_argument('--course', type=int, nargs='+', help='해당 ID의 과외만 다시 색인합니다.')
+
+    def handle(self, *args, **options):
+        queryset = Course.objects.all()
+        if options['course']:
+            queryset = queryset.filter(pk__in=options['course'])
+
+        indexed = rebuild_search_index(queryset, batch_size=options['batch_size'])
+        self.stdout.write(self.style.SUCCESS(f'과외 {indexed}개의 검색 색인을 만들었습니다.'))
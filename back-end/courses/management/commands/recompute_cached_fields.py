@@ -0,0 +1,25 @@
+from django.core.management.base import BaseCommand
+
+from courses.cached_fields import recompute_cached_fields
+from courses.models import Course
+
+
+class Command(BaseCommand):
+    help = '과외의 캐싱 필드(수강 인원, 리뷰 수, 평균 평점, 인기 점수)를 집계 쿼리로 다시 계산합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=500,
+                            help='한 번에 집계/갱신할 과외 수 (기본값: 500)')
+        parser.add_argument('--category', type=int, help='해당 카테고리 ID의 과외만 갱신합니다.')
+        parser.add_argument('--status', choices=Course.StatusChoices.values,
+                            help='해당 상태의 과외만 갱신합니다.')
+
+    def handle(self, *args, **options):
+        queryset = Course.objects.all()
+        if options['category'] is not None:
+            queryset = queryset.filter(category_id=options['category'])
+        if options['status']:
+            queryset = queryset.filter(status=options['status'])
+
+        updated = recompute_cached_fields(queryset, batch_size=options['batch_size'])
+        self.stdout.write(self.style.SUCCESS(f'과외 {updated}개의 캐싱 필드를 갱신했습니다.'))
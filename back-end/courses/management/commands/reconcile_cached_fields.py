@@ -0,0 +1,32 @@
+from django.core.management.base import BaseCommand
+
+from courses.cached_fields import find_counter_drift, recompute_cached_fields
+from courses.models import Course
+
+
+class Command(BaseCommand):
+    help = '저장된 캐싱 필드와 실제 집계 값을 비교하여 어긋난 과외를 찾습니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=500,
+                            help='한 번에 비교할 과외 수 (기본값: 500)')
+        parser.add_argument('--fix', action='store_true',
+                            help='어긋난 과외의 캐싱 필드를 다시 계산하여 저장합니다.')
+
+    def handle(self, *args, **options):
+        drift = find_counter_drift(batch_size=options['batch_size'])
+        for course_id, field, stored, actual in drift:
+            self.stdout.write(f'과외 {course_id}: {field} 저장값={stored} 실제값={actual}')
+
+        if not drift:
+            self.stdout.write(self.style.SUCCESS('어긋난 캐싱 필드가 없습니다.'))
+            return
+
+        course_ids = sorted({course_id for course_id, *_ in drift})
+        self.stdout.write(self.style.WARNING(f'과외 {len(course_ids)}개의 캐싱 필드가 어긋나 있습니다.'))
+        if options['fix']:
+            batch_size = options['batch_size']
+            for start in range(0, len(course_ids), batch_size):
+                chunk = course_ids[start:start + batch_size]
+                recompute_cached_fields(Course.objects.filter(pk__in=chunk), batch_size=batch_size)
+            self.stdout.write(self.style.SUCCESS('어긋난 캐싱 필드를 다시 계산했습니다.'))
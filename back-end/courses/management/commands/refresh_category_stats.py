@@ -0,0 +1,33 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from courses.category_stats import DEFAULT_TOP_N, DEFAULT_WORKERS, refresh_category_stats
+
+
+class Command(BaseCommand):
+    help = '바뀐 카테고리의 집계 스냅샷과 인기 과외 순위표를 다시 계산합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--full', action='store_true', help='바뀌지 않은 카테고리까지 모두 다시 계산합니다.')
+        parser.add_argument('--workers', type=int, default=DEFAULT_WORKERS,
+                            help=f'동시에 계산할 카테고리 수 (기본값: {DEFAULT_WORKERS})')
+        parser.add_argument('--top-n', type=int, default=DEFAULT_TOP_N,
+                            help=f'카테고리별 순위표 크기 (기본값: {DEFAULT_TOP_N})')
+        parser.add_argument('--interval', type=float,
+                            help='지정하면 종료하지 않고 N초마다 바뀐 카테고리를 다시 계산합니다. (백그라운드 실행용)')
+
+    def handle(self, *args, **options):
+        full = options['full']
+        while True:
+            started = time.perf_counter()
+            refreshed = refresh_category_stats(full=full, workers=options['workers'], top_n=options['top_n'])
+            if refreshed or options['interval'] is None:
+                self.stdout.write(self.style.SUCCESS(
+                    f'카테고리 {len(refreshed)}개를 다시 계산했습니다. ({time.perf_counter() - started:.2f}초)'
+                ))
+            if options['interval'] is None:
+                return
+            # --full은 첫 실행에만 적용
+            full = False
+            time.sleep(options['interval'])
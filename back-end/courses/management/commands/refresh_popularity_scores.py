@@ -0,0 +1,13 @@
+from django.core.management.base import BaseCommand
+
+from courses.cached_fields import refresh_popularity_scores
+from courses.popularity import get_popularity_weights
+
+
+class Command(BaseCommand):
+    help = '현재 가중치(settings.COURSE_POPULARITY_WEIGHTS)로 모든 과외의 인기 점수를 다시 계산합니다.'
+
+    def handle(self, *args, **options):
+        self.stdout.write(f'가중치: {get_popularity_weights()}')
+        updated = refresh_popularity_scores()
+        self.stdout.write(self.style.SUCCESS(f'과외 {updated}개의 인기 점수를 갱신했습니다.'))
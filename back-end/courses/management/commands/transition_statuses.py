@@ -0,0 +1,33 @@
+import time
+from datetime import date
+
+from django.core.management.base import BaseCommand
+
+from courses.status_transitions import DEFAULT_BATCH_SIZE, complete_expired_enrollments, finish_completed_courses
+
+
+class Command(BaseCommand):
+    help = '수강 기간이 끝난 수강 신청을 completed로, 수강이 모두 끝난 과외를 finished로 바꿉니다. (매일 실행)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--date', type=date.fromisoformat,
+                            help='기준 날짜 (YYYY-MM-DD, 기본값: 오늘) - 종료일이 이 날짜 이전인 수강 신청을 완료 처리합니다.')
+        parser.add_argument('--batch-size', type=int, default=DEFAULT_BATCH_SIZE,
+                            help=f'UPDATE 한 번에 바꿀 행 수 (기본값: {DEFAULT_BATCH_SIZE})')
+        parser.add_argument('--pause', type=float, default=0,
+                            help='묶음 사이에 쉴 시간(초) - 운영 중 부하를 줄일 때 사용 (기본값: 0)')
+
+    def _report(self, label, rows, elapsed):
+        rate = rows / elapsed if elapsed else 0.0
+        self.stdout.write(self.style.SUCCESS(f'{label} {rows}건 ({elapsed:.2f}초, {rate:,.0f}행/초)'))
+
+    def handle(self, *args, **options):
+        started = time.perf_counter()
+        completed = complete_expired_enrollments(
+            today=options['date'], batch_size=options['batch_size'], pause=options['pause'],
+        )
+        self._report('수강 완료 처리:', completed, time.perf_counter() - started)
+
+        started = time.perf_counter()
+        finished = finish_completed_courses(batch_size=options['batch_size'], pause=options['pause'])
+        self._report('과외 종료 처리:', finished, time.perf_counter() - started)
@@ -0,0 +1,33 @@
+import time
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+
+from courses.activity_rollups import WATERMARK_LAG, backfill_activity_rollups, update_activity_rollups
+
+
+class Command(BaseCommand):
+    help = '마지막 집계 이후 생성된 수강 신청/찜을 일/주 단위 집계 테이블에 반영합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--full', action='store_true',
+                            help='전체 기록으로 집계 테이블을 다시 만듭니다. (삭제된 수강 신청/찜 반영)')
+        parser.add_argument('--batch-size', type=int, default=5000,
+                            help='증분 갱신에서 한 번에 읽어서 반영할 pk 구간 크기 (기본값: 5000)')
+        parser.add_argument('--course-batch-size', type=int, default=200,
+                            help='--full에서 한 번에 집계할 과외 수 (기본값: 200)')
+        parser.add_argument('--lag', type=float, default=WATERMARK_LAG.total_seconds(),
+                            help=f'생성된 지 이 시간(초)이 지나지 않은 행은 다음 실행에서 반영합니다. '
+                                 f'(기본값: {WATERMARK_LAG.total_seconds():g})')
+
+    def handle(self, *args, **options):
+        started = time.perf_counter()
+        lag = timedelta(seconds=options['lag'])
+        if options['full']:
+            processed = backfill_activity_rollups(
+                course_batch_size=options['course_batch_size'], batch_size=options['batch_size'], lag=lag,
+            )
+        else:
+            processed = update_activity_rollups(batch_size=options['batch_size'], lag=lag)
+        elapsed = time.perf_counter() - started
+        self.stdout.write(self.style.SUCCESS(f'수강 신청/찜 {processed}건을 집계했습니다. ({elapsed:.2f}초)'))
@@ -0,0 +1,74 @@
+from django.db import migrations, models
+from django.db.models import Count, ExpressionWrapper, F, FloatField, IntegerField, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+# 이 마이그레이션 시점의 인기 점수 가중치 (courses.popularity를 import하면 이후 코드/설정 변경에 따라
+# 마이그레이션 결과가 달라지므로 복사해 둠 - 설정한 가중치는 refresh_popularity_scores로 다시 반영)
+POPULARITY_WEIGHTS = {
+    'tutees': 0.5,
+    'wishes': 0.3,
+    'reviews': 0.15,
+    'rating': 0.05,
+}
+
+
+def popularity_expression():
+    return ExpressionWrapper(
+        F('current_tutees_count') * POPULARITY_WEIGHTS['tutees'] +
+        F('wishlist_count') * POPULARITY_WEIGHTS['wishes'] +
+        F('review_count') * POPULARITY_WEIGHTS['reviews'] +
+        F('average_rating') * POPULARITY_WEIGHTS['rating'],
+        output_field=FloatField(),
+    )
+
+
+def backfill_wishlist_count(apps, schema_editor):
+    Course = apps.get_model('courses', 'Course')
+    WishedCourses = apps.get_model('courses', 'WishedCourses')
+
+    wish_count = (
+        WishedCourses.objects.filter(course=OuterRef('pk'))
+        .values('course')
+        .annotate(n=Count('id'))
+        .values('n')
+    )
+    Course.objects.update(
+        wishlist_count=Coalesce(Subquery(wish_count, output_field=IntegerField()), 0)
+    )
+    Course.objects.update(popularity_score=popularity_expression())
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('courses', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='course',
+            name='wishlist_count',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.RunPython(backfill_wishlist_count, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='course',
+            index=models.Index(fields=['status', '-popularity_score', '-id'], name='course_status_pop_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='course',
+            index=models.Index(fields=['category', 'status', '-popularity_score', '-id'], name='course_cat_status_pop_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='course',
+            index=models.Index(fields=['category', '-popularity_score', '-id'], name='course_cat_pop_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='course',
+            index=models.Index(fields=['-created_at', '-id'], name='course_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='course',
+            index=models.Index(fields=['category', '-created_at', '-id'], name='course_cat_created_idx'),
+        ),
+    ]
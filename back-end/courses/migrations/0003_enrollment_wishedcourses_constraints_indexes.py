@@ -0,0 +1,62 @@
+from django.db import migrations, models
+from django.db.models import Count, Min
+
+
+def remove_duplicate_pairs(apps, schema_editor):
+    # 유니크 제약 조건을 추가하기 전에 (user, course) 중복 행을 한 행만 남기고 삭제합니다.
+    # - 찜: 가장 먼저 생성된 행을 남김
+    # - 수강 신청: 리뷰가 있는 행 중 가장 먼저 생성된 행을 남김 (리뷰가 없으면 가장 먼저 생성된 행)
+    #   수강 신청을 지우면 리뷰도 CASCADE로 지워지므로 리뷰가 달린 행을 남깁니다.
+    #   리뷰는 수강 신청당 하나뿐이라, 같은 유저가 같은 과외에 단 두 번째 이후의 리뷰만 함께 삭제됩니다.
+    # ⭐️ 참고: 마이그레이션에서는 시그널이 실행되지 않으므로, 삭제된 행이 있다면
+    #    이후 `python manage.py reconcile_cached_fields --fix`로 캐싱 필드를 바로잡아야 합니다.
+    Review = apps.get_model('reviews', 'Review')
+    for model_name in ['WishedCourses', 'Enrollment']:
+        model = apps.get_model('courses', model_name)
+        duplicates = (
+            model.objects.values('user_id', 'course_id')
+            .annotate(n=Count('id'), keep_id=Min('id'))
+            .filter(n__gt=1)
+        )
+        for row in list(duplicates):
+            rows = model.objects.filter(user_id=row['user_id'], course_id=row['course_id'])
+            keep_id = row['keep_id']
+            if model_name == 'Enrollment':
+                reviewed_ids = sorted(
+                    Review.objects.filter(enrollment__in=rows).values_list('enrollment_id', flat=True)
+                )
+                if reviewed_ids:
+                    keep_id = reviewed_ids[0]
+            rows.exclude(id=keep_id).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('courses', '0002_course_wishlist_count_popularity_indexes'),
+        ('reviews', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.RunPython(remove_duplicate_pairs, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='wishedcourses',
+            constraint=models.UniqueConstraint(fields=['user', 'course'], name='unique_wish_user_course'),
+        ),
+        migrations.AddIndex(
+            model_name='wishedcourses',
+            index=models.Index(fields=['user', '-created_at', '-id'], name='wished_user_created_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='enrollment',
+            constraint=models.UniqueConstraint(fields=['user', 'course'], name='unique_enrollment_user_course'),
+        ),
+        migrations.AddIndex(
+            model_name='enrollment',
+            index=models.Index(fields=['user', '-created_at', '-id'], name='enrollment_user_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='enrollment',
+            index=models.Index(fields=['course', 'status'], name='enrollment_course_status_idx'),
+        ),
+    ]
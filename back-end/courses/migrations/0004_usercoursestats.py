@@ -0,0 +1,23 @@
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('courses', '0003_enrollment_wishedcourses_constraints_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='UserCourseStats',
+            fields=[
+                ('user', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='course_stats', serialize=False, to=settings.AUTH_USER_MODEL)),
+                ('created_courses_count', models.IntegerField(default=0)),
+                ('attending_courses_count', models.IntegerField(default=0)),
+                ('wished_courses_count', models.IntegerField(default=0)),
+            ],
+        ),
+    ]
@@ -0,0 +1,24 @@
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('courses', '0005_courserecommendation_recommendationbuildstate'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CourseSearchToken',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('token', models.CharField(max_length=30)),
+                ('weight', models.FloatField()),
+                ('course', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='search_tokens', to='courses.course')),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('token', 'course'), name='unique_search_token_course')],
+            },
+        ),
+    ]
@@ -0,0 +1,126 @@
+from collections import defaultdict
+from decimal import Decimal
+
+from django.db import migrations, models
+from django.db.models import Count, ExpressionWrapper, F, FloatField
+
+# 이 마이그레이션 시점의 평점 포인트/인기 점수 계산 (courses.ratings, courses.popularity를 import하면
+# 이후 코드/설정 변경에 따라 마이그레이션 결과가 달라지므로 복사해 둠)
+POINTS_PER_STAR = 2
+RATING_BUCKET_FIELDS = {points: f'rating_{points * 5:02d}_count' for points in range(1, 11)}
+RATING_FIELDS = ['review_count', 'rating_points_sum', *RATING_BUCKET_FIELDS.values(), 'average_rating']
+
+POPULARITY_WEIGHTS = {
+    'tutees': 0.5,
+    'wishes': 0.3,
+    'reviews': 0.15,
+    'rating': 0.05,
+}
+
+
+def popularity_expression():
+    return ExpressionWrapper(
+        F('current_tutees_count') * POPULARITY_WEIGHTS['tutees'] +
+        F('wishlist_count') * POPULARITY_WEIGHTS['wishes'] +
+        F('review_count') * POPULARITY_WEIGHTS['reviews'] +
+        F('average_rating') * POPULARITY_WEIGHTS['rating'],
+        output_field=FloatField(),
+    )
+
+
+def to_points(rating):
+    return int(Decimal(str(rating)) * POINTS_PER_STAR)
+
+
+def stats_from_counts(counts):
+    review_count = sum(counts.values())
+    points_sum = sum(points * count for points, count in counts.items())
+    stats = {'review_count': review_count, 'rating_points_sum': points_sum}
+    for points, field in RATING_BUCKET_FIELDS.items():
+        stats[field] = counts.get(points, 0)
+    stats['average_rating'] = points_sum / (POINTS_PER_STAR * review_count) if review_count else 0.0
+    return stats
+
+
+def backfill_rating_stats(apps, schema_editor):
+    Course = apps.get_model('courses', 'Course')
+    Review = apps.get_model('reviews', 'Review')
+
+    counts = defaultdict(dict)
+    rows = (
+        Review.objects.values('enrollment__course_id', 'rating')
+        .annotate(n=Count('id'))
+        .values_list('enrollment__course_id', 'rating', 'n')
+    )
+    for course_id, rating, n in rows:
+        counts[course_id][to_points(rating)] = n
+    courses = [Course(pk=course_id, **stats_from_counts(course_counts)) for course_id, course_counts in counts.items()]
+    Course.objects.bulk_update(courses, RATING_FIELDS, batch_size=500)
+    Course.objects.update(popularity_score=popularity_expression())
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('courses', '0006_coursesearchtoken'),
+        ('reviews', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='course',
+            name='rating_05_count',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='course',
+            name='rating_10_count',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='course',
+            name='rating_15_count',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='course',
+            name='rating_20_count',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='course',
+            name='rating_25_count',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='course',
+            name='rating_30_count',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='course',
+            name='rating_35_count',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='course',
+            name='rating_40_count',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='course',
+            name='rating_45_count',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='course',
+            name='rating_50_count',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='course',
+            name='rating_points_sum',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.RunPython(backfill_rating_stats, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,37 @@
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('courses', '0007_course_rating_stats'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CategoryStats',
+            fields=[
+                ('category', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='stats', serialize=False, to='courses.category')),
+                ('course_count', models.IntegerField(default=0)),
+                ('recruiting_count', models.IntegerField(default=0)),
+                ('review_count', models.IntegerField(default=0)),
+                ('average_rating', models.FloatField(default=0.0)),
+                ('is_dirty', models.BooleanField(default=True)),
+                ('refreshed_at', models.DateTimeField(null=True)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='CategoryLeaderboardEntry',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('rank', models.PositiveSmallIntegerField()),
+                ('popularity_score', models.FloatField()),
+                ('category', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='leaderboard', to='courses.category')),
+                ('course', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='courses.course')),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('category', 'rank'), name='unique_leaderboard_category_rank')],
+            },
+        ),
+    ]
@@ -0,0 +1,49 @@
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('courses', '0008_category_stats_leaderboard'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ActivityRollupState',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('last_enrollment_id', models.IntegerField(default=0)),
+                ('last_wish_id', models.IntegerField(default=0)),
+                ('updated_at', models.DateTimeField(null=True)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='CategoryActivityRollup',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('period', models.CharField(choices=[('day', '일'), ('week', '주')], max_length=4)),
+                ('bucket', models.DateField()),
+                ('enrollment_count', models.IntegerField(default=0)),
+                ('wish_count', models.IntegerField(default=0)),
+                ('category', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='activity_rollups', to='courses.category')),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('category', 'period', 'bucket'), name='unique_category_activity_bucket')],
+            },
+        ),
+        migrations.CreateModel(
+            name='CourseActivityRollup',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('period', models.CharField(choices=[('day', '일'), ('week', '주')], max_length=4)),
+                ('bucket', models.DateField()),
+                ('enrollment_count', models.IntegerField(default=0)),
+                ('wish_count', models.IntegerField(default=0)),
+                ('course', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='activity_rollups', to='courses.course')),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('course', 'period', 'bucket'), name='unique_course_activity_bucket')],
+            },
+        ),
+    ]
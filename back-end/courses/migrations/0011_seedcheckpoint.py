@@ -0,0 +1,23 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('courses', '0010_enrollment_status_end_idx'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SeedCheckpoint',
+            fields=[
+                ('stage', models.CharField(max_length=50, primary_key=True, serialize=False)),
+                ('file', models.CharField(max_length=500)),
+                ('offset', models.BigIntegerField(default=0)),
+                ('row', models.IntegerField(default=0)),
+                ('batch', models.IntegerField(default=0)),
+                ('done', models.BooleanField(default=False)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+        ),
+    ]
@@ -0,0 +1,21 @@
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('courses', '0011_seedcheckpoint'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CourseCooccurrence',
+            fields=[
+                ('course', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='+', serialize=False, to='courses.course')),
+                ('other_ids', models.BinaryField()),
+                ('weights', models.BinaryField()),
+                ('norm_sq', models.FloatField()),
+            ],
+        ),
+    ]
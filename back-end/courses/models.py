@@ -1,6 +1,9 @@
 from django.db import models
 from accounts.models import User
 from reviews.models import Review
+from courses.popularity import compute_popularity
+from courses.instrumentation import instrumented
+from courses.ratings import RATING_FIELDS, stats_from_counts, to_points
 
 # 음악, 운동, 예술, 프로그래밍, 금융/재테크, 외국어 카테고리가 존재한다.
 class Category(models.Model):
@@ -9,6 +12,21 @@ class Category(models.Model):
     def __str__(self):
         return self.name
 
+class CourseQuerySet(models.QuerySet):
+    # (category, status, -popularity_score) 인덱스를 그대로 타도록 정렬은 popularity_score 하나로 함
+    def top_popular(self, limit=10, category=None, status=None):
+        queryset = self
+        if category is not None:
+            queryset = queryset.filter(category=category)
+        if status is not None:
+            queryset = queryset.filter(status=status)
+        return queryset.order_by('-popularity_score')[:limit]
+
+    # 모집중인 과외 인기순 top N - "카테고리 X에서 모집중인 인기 과외"
+    def top_recruiting(self, limit=10, category=None):
+        return self.top_popular(limit, category=category, status=Course.StatusChoices.RECRUITING)
+
+
 class Course(models.Model):
     '''
     아래는 erd 기반 수정사항
@@ -31,7 +49,9 @@ class Course(models.Model):
     current_tutees_count: 현재 수강 중인 인원
     review_count: 리뷰 개수 (캐싱 필드)
     wishlist_count: 찜 수 (캐싱 필드)
-    average_rating: 평균 평점 (캐싱 필드)
+    average_rating: 평균 평점 (캐싱 필드) = rating_points_sum / (2 * review_count)
+    rating_points_sum: 리뷰 평점 합계 * 2 (캐싱 필드, 0.5점 = 1포인트)
+    rating_05_count ~ rating_50_count: 평점별 리뷰 수 (캐싱 필드, courses/ratings.py 참고)
     popularity_score: 인기 점수 (가중치 기반)
 
     - is_active: 과외 활성화 여부 -> status
@@ -73,14 +93,43 @@ class Course(models.Model):
     
     current_tutees_count = models.IntegerField(default=0)
     review_count = models.IntegerField(default=0)
+    wishlist_count = models.IntegerField(default=0)
     average_rating = models.FloatField(default=0.0)
     popularity_score = models.FloatField(default=0.0)
 
+    # 평점 통계 - 정수로만 더하고 빼므로 평균이 어긋나지 않음
+    rating_points_sum = models.IntegerField(default=0)
+    rating_05_count = models.IntegerField(default=0)
+    rating_10_count = models.IntegerField(default=0)
+    rating_15_count = models.IntegerField(default=0)
+    rating_20_count = models.IntegerField(default=0)
+    rating_25_count = models.IntegerField(default=0)
+    rating_30_count = models.IntegerField(default=0)
+    rating_35_count = models.IntegerField(default=0)
+    rating_40_count = models.IntegerField(default=0)
+    rating_45_count = models.IntegerField(default=0)
+    rating_50_count = models.IntegerField(default=0)
+
+    objects = CourseQuerySet.as_manager()
+
+    class Meta:
+        indexes = [
+            # 인기순 정렬 - 상태별 / 카테고리+상태별 top N을 인덱스 범위 스캔으로 조회
+            # 끝의 -id는 커서 페이지네이션의 동점 정렬(courses/pagination.py)까지 인덱스로 처리하기 위함
+            models.Index(fields=['status', '-popularity_score', '-id'], name='course_status_pop_idx'),
+            models.Index(fields=['category', 'status', '-popularity_score', '-id'], name='course_cat_status_pop_idx'),
+            models.Index(fields=['category', '-popularity_score', '-id'], name='course_cat_pop_idx'),
+            # 최신순 목록 - 전체 / 카테고리별
+            models.Index(fields=['-created_at', '-id'], name='course_created_idx'),
+            models.Index(fields=['category', '-created_at', '-id'], name='course_cat_created_idx'),
+        ]
+
     # print 함수 실행시 '[강사명]: 강좌명' 반환
     def __str__(self):
         return f'[{self.tutor.username}] {self.title}'
     
     # current_tutees_count를 update
+    @instrumented('Course.update_tutee_count')
     def update_tutee_count(self):
         count = self.tutees.count()
         self.current_tutees_count = count
@@ -89,19 +138,35 @@ class Course(models.Model):
     # 리뷰와의 관계를 고려함    
     # 이 과목에 달린 총 리뷰 개수 및 평균 평점 구하고 저장함
     # 여기서 enrollment는 Review에 정의된 정보를 의미함
+    # Review는 Course가 아닌 Enrollment를 참조하므로 enrollment__course로 조회함
+    # 평점별 개수를 한 번에 집계해서 합계/히스토그램/평균을 함께 저장함
+    @instrumented('Course.update_review_metrics')
     def update_review_metrics(self):
-        reviews = self.review_set.all() # reviews.models impor 대신 사용함
-        self.review_count = reviews.count()
-        self.average_rating = reviews.aggregate(models.Avg('rating'))['rating__avg'] or 0
-        self.save(update_fields=['review_count', 'average_rating'])
+        counts = (
+            Review.objects.filter(enrollment__course=self)
+            .values('rating')
+            .annotate(n=models.Count('id'))
+            .values_list('rating', 'n')
+        )
+        stats = stats_from_counts({to_points(rating): n for rating, n in counts})
+        for field, value in stats.items():
+            setattr(self, field, value)
+        self.save(update_fields=RATING_FIELDS)
+
+    # wishlist_count를 update
+    @instrumented('Course.update_wishlist_count')
+    def update_wishlist_count(self):
+        self.wishlist_count = self.wish_users.count()
+        self.save(update_fields=['wishlist_count'])
 
-    # 가중치 계산 결과를 popularity_score에 저장함
+    # 가중치 계산 결과를 popularity_score에 저장함 (가중치는 courses/popularity.py 참고)
+    @instrumented('Course.update_popularity_score')
     def update_popularity_score(self):
-        self.popularity_score = (
-            self.current_students * 0.5 +
-            self.wishlist_count * 0.3 +
-            self.review_count * 0.15 +
-            self.average_rating * 0.05
+        self.popularity_score = compute_popularity(
+            self.current_tutees_count,
+            self.wishlist_count,
+            self.review_count,
+            self.average_rating,
         )
         self.save(update_fields=['popularity_score'])
 
@@ -119,6 +184,16 @@ class WishedCourses(models.Model):
     # 수정 지점: 최신 찜목록부터 보여주기 위해 created_at 컬럼을 추가함
     created_at = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        constraints = [
+            # 같은 과외를 두 번 찜할 수 없음
+            models.UniqueConstraint(fields=['user', 'course'], name='unique_wish_user_course'),
+        ]
+        indexes = [
+            # 내 찜 목록 (최신순, 같은 시각은 id 역순)
+            models.Index(fields=['user', '-created_at', '-id'], name='wished_user_created_idx'),
+        ]
+
 # 이름 AttendingCourses -> Enrollment로 변경!
 # 관련 사항 모두 수정해야 함
 class Enrollment(models.Model):
@@ -143,4 +218,209 @@ class Enrollment(models.Model):
     # status 기본 값은 수강중
     status = models.CharField(max_length=10, choices=StatusChoices.choices, default=StatusChoices.ENROLLED)
     start_date = models.DateField()
-    end_date = models.DateField()
\ No newline at end of file
+    end_date = models.DateField()
+
+    class Meta:
+        constraints = [
+            # 같은 과외를 두 번 수강 신청할 수 없음
+            models.UniqueConstraint(fields=['user', 'course'], name='unique_enrollment_user_course'),
+        ]
+        indexes = [
+            # 내 수강 목록 (최신순, 같은 시각은 id 역순)
+            models.Index(fields=['user', '-created_at', '-id'], name='enrollment_user_created_idx'),
+            # 과외별 수강생 목록 (상태별)
+            models.Index(fields=['course', 'status'], name='enrollment_course_status_idx'),
+            # 수강 기간이 끝난 수강 신청을 종료일 순으로 찾음 (courses/status_transitions.py)
+            models.Index(fields=['status', 'end_date'], name='enrollment_status_end_idx'),
+        ]
+
+
+
+# 유저 프로필의 "개설한 과외 / 수강 중인 과외 / 찜한 과외" 수를 COUNT 없이 보여주기 위한 캐싱 테이블
+# accounts.User와 1:1 - User.objects.select_related('course_stats')로 한 번에 조회
+class UserCourseStats(models.Model):
+    '''
+    user_id: 유저 (기본 키)
+    created_courses_count: 개설한 과외 수 (created_courses)
+    attending_courses_count: 수강 신청한 과외 수 (attending_courses)
+    wished_courses_count: 찜한 과외 수 (wished_courses)
+    '''
+    user = models.OneToOneField(User, on_delete=models.CASCADE, primary_key=True, related_name='course_stats')
+    created_courses_count = models.IntegerField(default=0)
+    attending_courses_count = models.IntegerField(default=0)
+    wished_courses_count = models.IntegerField(default=0)
+
+
+# "이 과외를 찜/수강한 학생들이 함께 본 과외" - 미리 계산한 과외별 추천 top K (courses/recommendations.py)
+class CourseRecommendation(models.Model):
+    '''
+    course_id: 기준 과외
+    recommended_course_id: 추천 과외
+    rank: 추천 순위 (0부터)
+    score: 유사도 (가중치 코사인 유사도)
+    '''
+    course = models.ForeignKey(Course, on_delete=models.CASCADE, related_name='recommendations')
+    recommended_course = models.ForeignKey(Course, on_delete=models.CASCADE, related_name='+')
+    rank = models.PositiveSmallIntegerField()
+    score = models.FloatField()
+
+    class Meta:
+        constraints = [
+            # (course, rank) 인덱스 범위 스캔으로 K개만 읽음
+            models.UniqueConstraint(fields=['course', 'rank'], name='unique_recommendation_course_rank'),
+        ]
+
+
+# 과외별 동시 발생 행 (X.T @ X의 행 하나) - 추천 증분 갱신은 바뀐 과외의 행만 읽어서 고침 (courses/recommendations.py)
+class CourseCooccurrence(models.Model):
+    '''
+    course_id: 기준 과외
+    other_ids: 함께 상호작용한 과외 ID 배열 (numpy int64 바이트, 자기 자신 제외)
+    weights: other_ids 순서의 동시 발생 값 배열 (numpy float64 바이트)
+    norm_sq: 자기 자신과의 동시 발생 값 = 과외 벡터 크기의 제곱 |X[:, j]|²
+    '''
+    course = models.OneToOneField(Course, on_delete=models.CASCADE, primary_key=True, related_name='+')
+    other_ids = models.BinaryField()
+    weights = models.BinaryField()
+    norm_sq = models.FloatField()
+
+
+# 추천 테이블을 마지막으로 계산한 시점의 워터마크 (행 1개)
+# 증분 갱신은 이 ID 이후에 생긴 Enrollment / WishedCourses만 반영함
+# built_at이 없으면 전체 계산이 끝난 적이 없으므로(또는 중간에 실패) 증분 갱신 대신 전체 계산을 함
+class RecommendationBuildState(models.Model):
+    last_enrollment_id = models.IntegerField(default=0)
+    last_wish_id = models.IntegerField(default=0)
+    built_at = models.DateTimeField(null=True)
+
+    @classmethod
+    def load(cls):
+        state, _ = cls.objects.get_or_create(pk=1)
+        return state
+
+
+# 과외 검색용 역색인 - 제목/소개/커리큘럼의 토큰(한글 2-gram, 영문/숫자 단어)별 가중치 (courses/search.py)
+class CourseSearchToken(models.Model):
+    '''
+    token: 검색 토큰
+    course_id: 토큰이 등장하는 과외
+    weight: 필드 가중치(제목 > 소개 > 커리큘럼)를 반영한 토큰 빈도
+    '''
+    token = models.CharField(max_length=30)
+    course = models.ForeignKey(Course, on_delete=models.CASCADE, related_name='search_tokens')
+    weight = models.FloatField()
+
+    class Meta:
+        constraints = [
+            # 토큰으로 과외 목록을 찾는 인덱스를 겸함
+            models.UniqueConstraint(fields=['token', 'course'], name='unique_search_token_course'),
+        ]
+
+
+# 카테고리 페이지용 집계 스냅샷 - 백그라운드 작업이 다시 계산함 (courses/category_stats.py)
+class CategoryStats(models.Model):
+    '''
+    category_id: 카테고리 (기본 키)
+    course_count: 과외 수
+    recruiting_count: 모집중인 과외 수
+    review_count: 리뷰 수 (과외 합계)
+    average_rating: 카테고리 전체 리뷰의 평균 평점
+    is_dirty: 마지막 계산 이후 과외/카운터가 바뀌었는지 여부 (다음 증분 갱신 대상)
+    refreshed_at: 마지막 계산 시각
+    '''
+    category = models.OneToOneField(Category, on_delete=models.CASCADE, primary_key=True, related_name='stats')
+    course_count = models.IntegerField(default=0)
+    recruiting_count = models.IntegerField(default=0)
+    review_count = models.IntegerField(default=0)
+    average_rating = models.FloatField(default=0.0)
+    is_dirty = models.BooleanField(default=True)
+    refreshed_at = models.DateTimeField(null=True)
+
+
+# 카테고리별 인기 과외 top N 스냅샷
+class CategoryLeaderboardEntry(models.Model):
+    '''
+    category_id: 카테고리
+    rank: 순위 (0부터)
+    course_id: 과외
+    popularity_score: 계산 시점의 인기 점수
+    '''
+    category = models.ForeignKey(Category, on_delete=models.CASCADE, related_name='leaderboard')
+    rank = models.PositiveSmallIntegerField()
+    course = models.ForeignKey(Course, on_delete=models.CASCADE, related_name='+')
+    popularity_score = models.FloatField()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['category', 'rank'], name='unique_leaderboard_category_rank'),
+        ]
+
+
+# 일/주 단위 수강 신청/찜 수 집계 - 튜터 대시보드의 기간별 추이 (courses/activity_rollups.py)
+class CourseActivityRollup(models.Model):
+    '''
+    course_id: 과외
+    period: 집계 단위 (day, week)
+    bucket: 구간 시작일 (week는 월요일)
+    enrollment_count: 구간 안에 생성된 수강 신청 수
+    wish_count: 구간 안에 생성된 찜 수
+    '''
+    class PeriodChoices(models.TextChoices):
+        DAY = 'day', '일'
+        WEEK = 'week', '주'
+
+    course = models.ForeignKey(Course, on_delete=models.CASCADE, related_name='activity_rollups')
+    period = models.CharField(max_length=4, choices=PeriodChoices.choices)
+    bucket = models.DateField()
+    enrollment_count = models.IntegerField(default=0)
+    wish_count = models.IntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            # (과외, 단위, 기간) 범위 조회 인덱스를 겸함
+            models.UniqueConstraint(fields=['course', 'period', 'bucket'], name='unique_course_activity_bucket'),
+        ]
+
+
+class CategoryActivityRollup(models.Model):
+    '''
+    category_id: 카테고리 (집계 시점에 과외가 속한 카테고리)
+    period, bucket, enrollment_count, wish_count: CourseActivityRollup과 같음
+    '''
+    category = models.ForeignKey(Category, on_delete=models.CASCADE, related_name='activity_rollups')
+    period = models.CharField(max_length=4, choices=CourseActivityRollup.PeriodChoices.choices)
+    bucket = models.DateField()
+    enrollment_count = models.IntegerField(default=0)
+    wish_count = models.IntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['category', 'period', 'bucket'], name='unique_category_activity_bucket'),
+        ]
+
+
+# 활동 집계가 반영한 마지막 수강 신청/찜 ID (한 행만 사용)
+class ActivityRollupState(models.Model):
+    last_enrollment_id = models.IntegerField(default=0)
+    last_wish_id = models.IntegerField(default=0)
+    updated_at = models.DateTimeField(null=True)
+
+    @classmethod
+    def load(cls):
+        state, _ = cls.objects.get_or_create(pk=1)
+        return state
+
+
+# 시드 스크립트(seed_all_data.py) 벌크 단계별 진행 위치 - 배치와 같은 트랜잭션에서 저장함
+class SeedCheckpoint(models.Model):
+    stage = models.CharField(max_length=50, primary_key=True)
+    file = models.CharField(max_length=500)
+    offset = models.BigIntegerField(default=0)
+    row = models.IntegerField(default=0)
+    batch = models.IntegerField(default=0)
+    done = models.BooleanField(default=False)
+    updated_at = models.DateTimeField(auto_now=True)
+
+
+# 캐싱 필드 증분 갱신 시그널 등록 (모델 정의가 모두 끝난 뒤에 import 해야 함)
+from courses import signals  # noqa: E402,F401
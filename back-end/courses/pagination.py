@@ -0,0 +1,129 @@
+'''
+커서(keyset) 기반 페이지네이션
+
+OFFSET 페이지네이션은 깊은 페이지일수록 앞의 행을 모두 건너뛰어야 하므로 점점 느려집니다.
+여기서는 마지막 행의 (정렬 키, id)를 커서로 넘기고 다음 페이지를
+    WHERE 정렬 키 <= 값 AND (정렬 키 < 값 OR id < 커서 id)  ORDER BY 정렬 키 DESC, id DESC  LIMIT 페이지 크기
+로 조회하므로, 페이지 깊이와 관계없이 페이지 크기만큼만 읽습니다.
+단, 필터 조건 + (정렬 키, id) 순서의 인덱스가 있어야 합니다. (models.py의 *_created_idx, *_pop_idx)
+
+    paginator = KeysetPaginator(WishedCourses.objects.filter(user=user), ordering='-created_at')
+    page = paginator.page(request.GET.get('cursor'))
+    page.items, page.next_cursor
+'''
+import base64
+import json
+
+from django.db.models import Q
+
+from courses.models import Course, Enrollment, WishedCourses
+
+
+class InvalidCursor(ValueError):
+    pass
+
+
+class CursorPage:
+    def __init__(self, items, next_cursor):
+        self.items = items
+        self.next_cursor = next_cursor
+
+    @property
+    def has_next(self):
+        return self.next_cursor is not None
+
+
+class KeysetPaginator:
+    '''
+    ordering: 정렬할 필드 하나 (예: '-created_at', '-popularity_score', '-pk')
+    같은 값의 행은 pk로 한 번 더 정렬하므로 페이지 사이에 행이 빠지거나 중복되지 않습니다.
+    '''
+
+    def __init__(self, queryset, ordering='-created_at', page_size=20):
+        self.queryset = queryset
+        self.descending = ordering.startswith('-')
+        self.field_name = ordering.lstrip('-')
+        self.page_size = page_size
+
+        model = queryset.model
+        if self.field_name in ('pk', model._meta.pk.name):
+            self.field_name = 'pk'
+            self.field = model._meta.pk
+        else:
+            self.field = model._meta.get_field(self.field_name)
+
+    def _order_by(self):
+        prefix = '-' if self.descending else ''
+        if self.field_name == 'pk':
+            return [f'{prefix}pk']
+        return [f'{prefix}{self.field_name}', f'{prefix}pk']
+
+    def encode_cursor(self, item):
+        # DjangoJSONEncoder는 datetime을 밀리초까지만 남기므로 필드의 문자열 변환을 그대로 사용함
+        value = self.field.value_to_string(item) if self.field_name != 'pk' else None
+        payload = json.dumps([value, item.pk])
+        return base64.urlsafe_b64encode(payload.encode()).decode()
+
+    def decode_cursor(self, cursor):
+        try:
+            value, pk = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+            if self.field_name != 'pk':
+                value = self.field.to_python(value)
+            return value, self.queryset.model._meta.pk.to_python(pk)
+        except Exception as e:
+            raise InvalidCursor(f'잘못된 커서입니다: {cursor}') from e
+
+    def _after(self, value, pk):
+        op = 'lt' if self.descending else 'gt'
+        if self.field_name == 'pk':
+            return Q(**{f'pk__{op}': pk})
+        # (정렬 키, pk) 튜플 비교를 풀어서 씀 - 앞의 범위 조건(lte/gte)으로 인덱스 범위 스캔을 시작할 수 있음
+        return Q(**{f'{self.field_name}__{op}e': value}) & (
+            Q(**{f'{self.field_name}__{op}': value}) | Q(**{f'pk__{op}': pk})
+        )
+
+    def _page_queryset(self, cursor):
+        queryset = self.queryset.order_by(*self._order_by())
+        if cursor:
+            queryset = queryset.filter(self._after(*self.decode_cursor(cursor)))
+        # 다음 페이지가 있는지 확인하기 위해 하나 더 가져옴
+        return queryset[:self.page_size + 1]
+
+    def _make_page(self, items):
+        next_cursor = None
+        if len(items) > self.page_size:
+            items = items[:self.page_size]
+            next_cursor = self.encode_cursor(items[-1])
+        return CursorPage(items, next_cursor)
+
+    def page(self, cursor=None):
+        return self._make_page(list(self._page_queryset(cursor)))
+
+    async def apage(self, cursor=None):
+        '''page()의 async 버전 (ASGI 뷰에서 사용)'''
+        return self._make_page([item async for item in self._page_queryset(cursor)])
+
+
+# --- 목록별 페이지네이션 ---
+
+def paginate_courses(cursor=None, ordering='-created_at', page_size=20, category=None, status=None):
+    # 최신순: (-created_at, -id) / (category, -created_at, -id)
+    # 인기순: (category, -popularity_score, -id) / (status, ...) / (category, status, ...) 인덱스 사용
+    queryset = Course.objects.select_related('tutor', 'category')
+    if category is not None:
+        queryset = queryset.filter(category=category)
+    if status is not None:
+        queryset = queryset.filter(status=status)
+    return KeysetPaginator(queryset, ordering, page_size).page(cursor)
+
+
+def paginate_wishlist(user, cursor=None, page_size=20):
+    # (user, -created_at, -id) 인덱스 사용
+    queryset = WishedCourses.objects.filter(user=user).select_related('course')
+    return KeysetPaginator(queryset, '-created_at', page_size).page(cursor)
+
+
+def paginate_enrollments(user, cursor=None, page_size=20):
+    # (user, -created_at, -id) 인덱스 사용
+    queryset = Enrollment.objects.filter(user=user).select_related('course')
+    return KeysetPaginator(queryset, '-created_at', page_size).page(cursor)
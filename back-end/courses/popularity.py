@@ -0,0 +1,50 @@
+'''
+과외 인기 점수(popularity_score) 계산
+
+    인기 점수 = 수강 인원 * w_tutees + 찜 수 * w_wishes + 리뷰 수 * w_reviews + 평균 평점 * w_rating
+
+가중치는 settings.COURSE_POPULARITY_WEIGHTS로 일부 또는 전체를 바꿀 수 있습니다.
+    COURSE_POPULARITY_WEIGHTS = {'wishes': 0.4}
+
+가중치를 바꾼 뒤에는 `python manage.py refresh_popularity_scores`로 저장된 점수를 다시 계산합니다.
+'''
+from django.conf import settings
+from django.db.models import ExpressionWrapper, F, FloatField
+
+DEFAULT_POPULARITY_WEIGHTS = {
+    'tutees': 0.5,
+    'wishes': 0.3,
+    'reviews': 0.15,
+    'rating': 0.05,
+}
+
+
+def get_popularity_weights():
+    weights = dict(DEFAULT_POPULARITY_WEIGHTS)
+    weights.update(getattr(settings, 'COURSE_POPULARITY_WEIGHTS', {}))
+    return weights
+
+
+def compute_popularity(tutees, wishes, reviews, rating):
+    weights = get_popularity_weights()
+    return (
+        tutees * weights['tutees'] +
+        wishes * weights['wishes'] +
+        reviews * weights['reviews'] +
+        rating * weights['rating']
+    )
+
+
+def popularity_expression(tutees=None, wishes=None, reviews=None, rating=None):
+    '''
+    캐싱 필드로부터 인기 점수를 계산하는 DB 식을 반환합니다.
+    인자를 주면 해당 항목만 다른 식(예: 증분 갱신 후의 값)으로 바꿔서 계산합니다.
+    '''
+    weights = get_popularity_weights()
+    expression = (
+        (F('current_tutees_count') if tutees is None else tutees) * weights['tutees'] +
+        (F('wishlist_count') if wishes is None else wishes) * weights['wishes'] +
+        (F('review_count') if reviews is None else reviews) * weights['reviews'] +
+        (F('average_rating') if rating is None else rating) * weights['rating']
+    )
+    return ExpressionWrapper(expression, output_field=FloatField())
@@ -0,0 +1,63 @@
+'''
+과외 평점 통계 (정수 합계 + 점수별 히스토그램)
+
+Review.rating은 0.5점 단위(0.5 ~ 5.0)이므로 2를 곱한 정수 "포인트"(1 ~ 10)로 저장합니다.
+
+    rating_points_sum: 리뷰 포인트 합계
+    rating_05_count ~ rating_50_count: 점수별 리뷰 수 (10개 구간)
+    average_rating = rating_points_sum / (2 * review_count)
+
+정수만 더하고 빼므로 리뷰가 생성/수정/삭제될 때 O(1) UPDATE로 갱신해도 평균이 어긋나지 않고,
+전체 리뷰를 읽지 않고도 정확한 평균과 분포를 알 수 있습니다. (courses/cached_fields.py, courses/signals.py)
+'''
+from decimal import Decimal
+from fractions import Fraction
+
+POINTS_PER_STAR = 2
+RATING_POINTS = range(1, 11)
+
+# 포인트 -> 히스토그램 필드 이름 (1 -> rating_05_count, 10 -> rating_50_count)
+RATING_BUCKET_FIELDS = {points: f'rating_{points * 5:02d}_count' for points in RATING_POINTS}
+
+RATING_FIELDS = ['review_count', 'rating_points_sum', *RATING_BUCKET_FIELDS.values(), 'average_rating']
+
+
+def to_points(rating):
+    '''평점(Decimal, float, str)을 정수 포인트로 바꿉니다. 0.5점 단위가 아니면 ValueError'''
+    points = Decimal(str(rating)) * POINTS_PER_STAR
+    if points != points.to_integral_value() or int(points) not in RATING_POINTS:
+        raise ValueError(f'평점은 0.5 ~ 5.0 사이의 0.5점 단위여야 합니다: {rating}')
+    return int(points)
+
+
+def average_from_points(points_sum, review_count):
+    '''포인트 합계로 평균 평점(float)을 계산합니다.'''
+    if not review_count:
+        return 0.0
+    return points_sum / (POINTS_PER_STAR * review_count)
+
+
+def exact_average(course):
+    '''저장된 합계로 계산한 정확한 평균 평점 (Fraction)'''
+    if not course.review_count:
+        return Fraction(0)
+    return Fraction(course.rating_points_sum, POINTS_PER_STAR * course.review_count)
+
+
+def rating_distribution(course):
+    '''{평점(Decimal): 리뷰 수} - 0.5점부터 5.0점까지 10개 구간'''
+    return {
+        (Decimal(points) / POINTS_PER_STAR).quantize(Decimal('0.1')): getattr(course, field)
+        for points, field in RATING_BUCKET_FIELDS.items()
+    }
+
+
+def stats_from_counts(counts):
+    '''{포인트: 리뷰 수}로부터 RATING_FIELDS 값을 만듭니다. (집계/재계산용)'''
+    review_count = sum(counts.values())
+    points_sum = sum(points * count for points, count in counts.items())
+    stats = {'review_count': review_count, 'rating_points_sum': points_sum}
+    for points, field in RATING_BUCKET_FIELDS.items():
+        stats[field] = counts.get(points, 0)
+    stats['average_rating'] = average_from_points(points_sum, review_count)
+    return stats
@@ -0,0 +1,233 @@
+'''
+목록 위주의 읽기 쿼리 (과외 상세, 카테고리별 과외, 찜 목록, 수강 목록)
+
+같은 결과를 반환하는 동기 함수와 async 함수(a 접두사)를 함께 둡니다.
+- 동기: WSGI 뷰, 관리 명령어 등
+- async: ASGI 뷰 - Django async ORM(aget, acount, async for)을 사용하고,
+  서로 의존하지 않는 쿼리(개수, 목록, 인기 과외 등)는 asyncio.gather로 함께 기다립니다.
+
+쿼리 구성(queryset)은 두 버전이 공유하므로 결과가 항상 같습니다.
+
+과외 상세는 read-through 캐시(courses/cache.py)를 거쳐 읽고, 조회수는 버퍼(courses/view_counter.py)에 기록합니다.
+캐시와 조회수 버퍼는 동기 코드이므로 async 버전은 sync_to_async로 감싸서 호출합니다.
+
+카테고리 페이지의 과외 수/평균 평점은 미리 계산된 스냅샷(CategoryStats, courses/category_stats.py)을 읽습니다.
+스냅샷이 아직 없거나 모집중 이외의 상태로 거른 경우에만 COUNT 쿼리를 실행합니다.
+'''
+import asyncio
+
+from asgiref.sync import sync_to_async
+
+from courses import cache
+from courses.view_counter import record_view
+from courses.models import Category, Course, Enrollment, WishedCourses
+from courses.pagination import KeysetPaginator
+
+DEFAULT_PAGE_SIZE = 20
+TOP_RECRUITING_SIZE = 5
+
+
+def serialize_course_summary(course):
+    '''목록용 과외 정보 (소개/커리큘럼 같은 긴 본문 제외)'''
+    return {
+        'id': course.id,
+        'title': course.title,
+        'thumbnail_image_url': course.thumbnail_image_url,
+        'status': course.status,
+        'category_id': course.category_id,
+        'tutor_id': course.tutor_id,
+        'max_tutees': course.max_tutees,
+        'current_tutees_count': course.current_tutees_count,
+        'wishlist_count': course.wishlist_count,
+        'review_count': course.review_count,
+        'average_rating': course.average_rating,
+        'popularity_score': course.popularity_score,
+    }
+
+
+def _summary_fields(prefix=''):
+    # 목록에서는 필요한 컬럼만 읽음 (description, curriculum 제외)
+    fields = ['id', 'title', 'thumbnail_image_url', 'status', 'category_id', 'tutor_id', 'max_tutees',
+              'current_tutees_count', 'wishlist_count', 'review_count', 'average_rating', 'popularity_score',
+              'created_at']
+    return [f'{prefix}{field}' for field in fields]
+
+
+# --- queryset 구성 (동기/async 공용) ---
+
+def _category_courses_queryset(category_id, status=None):
+    queryset = Course.objects.filter(category_id=category_id).only(*_summary_fields())
+    if status is not None:
+        queryset = queryset.filter(status=status)
+    return queryset
+
+
+def _top_recruiting_queryset(category_id):
+    return Course.objects.only(*_summary_fields()).top_recruiting(TOP_RECRUITING_SIZE, category=category_id)
+
+
+def _wishlist_queryset(user_id):
+    return WishedCourses.objects.filter(user_id=user_id).select_related('course').only(
+        'id', 'created_at', 'user_id', *_summary_fields('course__'),
+    )
+
+
+def _enrollments_queryset(user_id, status=None):
+    queryset = Enrollment.objects.filter(user_id=user_id).select_related('course').only(
+        'id', 'created_at', 'user_id', 'status', 'start_date', 'end_date', *_summary_fields('course__'),
+    )
+    if status is not None:
+        queryset = queryset.filter(status=status)
+    return queryset
+
+
+# --- 결과 구성 (동기/async 공용) ---
+
+def _category_stats(category):
+    try:
+        return category.stats
+    except Category.stats.RelatedObjectDoesNotExist:
+        return None
+
+
+def _precomputed_total(category, status):
+    stats = _category_stats(category)
+    if stats is None:
+        return None
+    if status is None:
+        return stats.course_count
+    if status == Course.StatusChoices.RECRUITING:
+        return stats.recruiting_count
+    return None
+
+
+def _serialize_category_stats(stats):
+    if stats is None:
+        return None
+    return {
+        'course_count': stats.course_count,
+        'recruiting_count': stats.recruiting_count,
+        'review_count': stats.review_count,
+        'average_rating': stats.average_rating,
+        'refreshed_at': stats.refreshed_at,
+    }
+
+
+def _category_result(category, total, top_recruiting, page):
+    return {
+        'category': {'id': category.id, 'name': category.name},
+        'stats': _serialize_category_stats(_category_stats(category)),
+        'total': total,
+        'top_recruiting': [serialize_course_summary(course) for course in top_recruiting],
+        'courses': [serialize_course_summary(course) for course in page.items],
+        'next_cursor': page.next_cursor,
+    }
+
+
+def _wishlist_result(total, page):
+    return {
+        'total': total,
+        'items': [
+            {'created_at': wish.created_at, 'course': serialize_course_summary(wish.course)}
+            for wish in page.items
+        ],
+        'next_cursor': page.next_cursor,
+    }
+
+
+def _enrollments_result(total, page):
+    return {
+        'total': total,
+        'items': [
+            {
+                'created_at': enrollment.created_at,
+                'status': enrollment.status,
+                'start_date': enrollment.start_date,
+                'end_date': enrollment.end_date,
+                'course': serialize_course_summary(enrollment.course),
+            }
+            for enrollment in page.items
+        ],
+        'next_cursor': page.next_cursor,
+    }
+
+
+# --- 동기 ---
+
+def course_detail(course_id):
+    '''
+    캐시된 과외 정보를 반환하고 조회수를 1 올립니다. 과외가 없으면 Course.DoesNotExist
+    (응답의 view_count는 캐시 TTL과 조회수 버퍼 반영 주기만큼 늦게 보일 수 있음)
+    '''
+    record = cache.get_course_record(course_id)
+    if record is None:
+        raise Course.DoesNotExist(f'과외를 찾을 수 없습니다: {course_id}')
+    record_view(course_id)
+    return record
+
+
+def category_page(category_id, cursor=None, page_size=DEFAULT_PAGE_SIZE, status=None):
+    category = Category.objects.select_related('stats').get(pk=category_id)
+    courses = _category_courses_queryset(category_id, status)
+    total = _precomputed_total(category, status)
+    if total is None:
+        total = courses.count()
+    top_recruiting = list(_top_recruiting_queryset(category_id))
+    page = KeysetPaginator(courses, '-popularity_score', page_size).page(cursor)
+    return _category_result(category, total, top_recruiting, page)
+
+
+def wishlist_page(user_id, cursor=None, page_size=DEFAULT_PAGE_SIZE):
+    wishes = _wishlist_queryset(user_id)
+    total = wishes.count()
+    page = KeysetPaginator(wishes, '-created_at', page_size).page(cursor)
+    return _wishlist_result(total, page)
+
+
+def enrollments_page(user_id, cursor=None, page_size=DEFAULT_PAGE_SIZE, status=None):
+    enrollments = _enrollments_queryset(user_id, status)
+    total = enrollments.count()
+    page = KeysetPaginator(enrollments, '-created_at', page_size).page(cursor)
+    return _enrollments_result(total, page)
+
+
+# --- async ---
+
+async def _alist(queryset):
+    return [item async for item in queryset]
+
+
+async def acourse_detail(course_id):
+    # 캐시 적중 시 쿼리가 없고, 조회수 버퍼는 임계값을 넘으면 바로 UPDATE 하므로 함께 스레드에서 실행
+    return await sync_to_async(course_detail)(course_id)
+
+
+async def acategory_page(category_id, cursor=None, page_size=DEFAULT_PAGE_SIZE, status=None):
+    courses = _category_courses_queryset(category_id, status)
+    category, top_recruiting, page = await asyncio.gather(
+        Category.objects.select_related('stats').aget(pk=category_id),
+        _alist(_top_recruiting_queryset(category_id)),
+        KeysetPaginator(courses, '-popularity_score', page_size).apage(cursor),
+    )
+    total = _precomputed_total(category, status)
+    if total is None:
+        total = await courses.acount()
+    return _category_result(category, total, top_recruiting, page)
+
+
+async def awishlist_page(user_id, cursor=None, page_size=DEFAULT_PAGE_SIZE):
+    wishes = _wishlist_queryset(user_id)
+    total, page = await asyncio.gather(
+        wishes.acount(),
+        KeysetPaginator(wishes, '-created_at', page_size).apage(cursor),
+    )
+    return _wishlist_result(total, page)
+
+
+async def aenrollments_page(user_id, cursor=None, page_size=DEFAULT_PAGE_SIZE, status=None):
+    enrollments = _enrollments_queryset(user_id, status)
+    total, page = await asyncio.gather(
+        enrollments.acount(),
+        KeysetPaginator(enrollments, '-created_at', page_size).apage(cursor),
+    )
+    return _enrollments_result(total, page)
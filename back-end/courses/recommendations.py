@@ -0,0 +1,352 @@
+'''
+찜/수강 동시 발생(co-occurrence) 기반 과외 추천
+
+유저 x 과외 상호작용 행렬 X(수강 1.0, 찜 0.5 가중치)를 scipy 희소 행렬로 만들고,
+과외 x 과외 동시 발생 행렬 C = X.T @ X를 코사인 유사도로 정규화해서 과외마다 상위 K개를 저장합니다.
+C의 행은 과외마다 CourseCooccurrence에 저장해 두고, 대각 성분(벡터 크기의 제곱)은 norm_sq에 따로 둡니다.
+
+- 전체 계산: build_recommendations(full=True) - 상호작용을 모두 읽고, 과외를 batch_size개씩 나눠서
+  X[:, batch].T @ X만 계산하므로 과외 x 과외 행렬 전체를 메모리에 올리지 않습니다.
+- 증분 갱신: build_recommendations() - 워터마크(RecommendationBuildState) 이후에 상호작용을 만든 유저 U의
+  상호작용만 읽습니다. U 밖의 유저 행은 그대로이므로
+      C_new = C_old - X_old[U].T @ X_old[U] + X_new[U].T @ X_new[U]
+  로 바뀐 과외의 C 행과 norm_sq만 고치고, 그 과외들의 추천만 다시 계산합니다.
+  바뀐 값은 과외 추천 행 전체와 워터마크까지 한 트랜잭션으로 저장하므로, 중간에 실패해도 두 번 더해지지 않습니다.
+  삭제된 찜/수강과, 벡터 크기가 바뀐 과외를 이웃으로 둔 다른 과외의 점수 변화는 전체 계산 때 반영됩니다.
+- 전체 계산이 끝난 적이 없으면(처음 실행, 전체 계산 도중 실패) 증분 갱신 대신 전체 계산을 합니다.
+- 과외별 추천은 과외 batch_size개 단위로 한 트랜잭션에서 바꿔 넣으므로, 전체 계산 도중에도 조회 결과가 비지 않습니다.
+- 조회: get_recommendations(course_id) - (course, rank) 인덱스로 K개만 읽습니다.
+
+⭐️ 워터마크 지연: 작은 pk를 받은 트랜잭션이 큰 pk보다 늦게 커밋될 수 있으므로, 생성된 지 WATERMARK_LAG(기본 5분)가
+지난 행 중 가장 큰 pk까지만 반영하고 최근 행은 다음 실행에서 반영합니다. (courses/activity_rollups.py와 같은 방식)
+(설정: settings.RECOMMENDATION_WATERMARK_LAG = 300  # 초)
+'''
+from datetime import timedelta
+
+import numpy as np
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+from scipy import sparse
+
+from courses.models import (
+    Course,
+    CourseCooccurrence,
+    CourseRecommendation,
+    Enrollment,
+    RecommendationBuildState,
+    WishedCourses,
+)
+
+DEFAULT_TOP_K = 20
+WATERMARK_LAG = timedelta(seconds=getattr(settings, 'RECOMMENDATION_WATERMARK_LAG', 300))
+
+# 수강이 찜보다 강한 신호 - 같은 유저가 찜과 수강을 모두 했으면 가중치를 더함
+INTERACTION_WEIGHTS = {
+    'enrollment': 1.0,
+    'wish': 0.5,
+}
+
+# SQLite의 쿼리 파라미터 수 제한보다 작게 user_id__in을 나눔
+USER_CHUNK_SIZE = 500
+
+
+def _high_watermark(model, lag=WATERMARK_LAG):
+    '''생성된 지 lag가 지난 행 중 가장 큰 pk'''
+    cutoff = timezone.now() - lag
+    return model.objects.filter(created_at__lte=cutoff).order_by('-pk').values_list('pk', flat=True).first() or 0
+
+
+def _to_table(rows):
+    return np.fromiter(rows, dtype=np.dtype((np.int64, 3))).reshape(-1, 3)
+
+
+def _load_interactions(model, max_id, chunk_size=50000):
+    '''pk <= max_id인 (pk, user_id, course_id)를 모델 인스턴스 없이 numpy 배열로 바로 읽습니다.'''
+    rows = model.objects.filter(pk__lte=max_id).values_list('pk', 'user_id', 'course_id').iterator(chunk_size=chunk_size)
+    table = _to_table(rows)
+    return table[:, 0], table[:, 1:]
+
+
+def _load_user_interactions(model, user_ids, max_id):
+    '''user_ids 유저들의 pk <= max_id인 (pk, user_id, course_id)'''
+    tables = [
+        _to_table(
+            model.objects.filter(user_id__in=user_ids[start:start + USER_CHUNK_SIZE], pk__lte=max_id)
+            .values_list('pk', 'user_id', 'course_id')
+        )
+        for start in range(0, len(user_ids), USER_CHUNK_SIZE)
+    ]
+    table = np.concatenate(tables) if tables else _to_table([])
+    return table[:, 0], table[:, 1:]
+
+
+def interaction_matrix(enrollment_pairs, wish_pairs, n_users, n_courses):
+    '''유저 ID를 행, 과외 ID를 열 번호로 쓰는 CSC 희소 행렬을 만듭니다. (ID가 비어 있는 행/열은 0)'''
+    pairs = np.concatenate([enrollment_pairs, wish_pairs])
+    weights = np.concatenate([
+        np.full(len(enrollment_pairs), INTERACTION_WEIGHTS['enrollment']),
+        np.full(len(wish_pairs), INTERACTION_WEIGHTS['wish']),
+    ])
+    # 중복된 (유저, 과외)는 더해짐
+    matrix = sparse.coo_matrix((weights, (pairs[:, 0], pairs[:, 1])), shape=(n_users, n_courses))
+    return matrix.tocsc()
+
+
+def _matrix_shape(*pair_arrays):
+    # 과외 수는 읽은 상호작용에서 구함 - Course의 Max(pk)를 따로 읽으면 그 사이에 삭제된 과외 때문에 열이 모자랄 수 있음
+    pairs = np.concatenate(pair_arrays)
+    if not len(pairs):
+        return 1, 1
+    return int(pairs[:, 0].max()) + 1, int(pairs[:, 1].max()) + 1
+
+
+def column_norms(matrix):
+    '''과외(열)별 벡터 크기 |X[:, j]| - 상호작용이 없는 과외는 1로 둠'''
+    norms = np.sqrt(np.asarray(matrix.multiply(matrix).sum(axis=0)).ravel())
+    norms[norms == 0] = 1.0
+    return norms
+
+
+def _lookup(values, ids):
+    # 배열 범위 밖의 ID(계산 이후에 생긴 과외)는 0
+    out = np.zeros(len(ids))
+    inside = ids < len(values)
+    out[inside] = values[ids[inside]]
+    return out
+
+
+def _neighbors(other_ids, weights, norm, norms, top_k):
+    '''동시 발생 행 하나로 top_k 추천 [(recommended_id, score), ...]을 만듭니다. (norms가 0인 과외는 제외)'''
+    other_norms = _lookup(norms, other_ids)
+    keep = other_norms > 0
+    columns = other_ids[keep]
+    scores = weights[keep] / (norm * other_norms[keep])
+    if len(scores) > top_k:
+        best = np.argpartition(-scores, top_k - 1)[:top_k]
+        columns, scores = columns[best], scores[best]
+    # 점수 내림차순, 같으면 과외 ID 오름차순
+    order = np.lexsort((columns, -scores))
+    return [(int(columns[i]), float(scores[i])) for i in order]
+
+
+def _split_row(course_id, ids, weights):
+    '''동시 발생 행을 (자기 자신을 뺀 ID 배열, 값 배열, 자기 자신과의 값)으로 나눕니다.'''
+    ids = np.asarray(ids, dtype=np.int64)
+    weights = np.asarray(weights, dtype=np.float64)
+    own = ids == course_id
+    norm_sq = float(weights[own].sum())
+    # 증분 갱신에서 빼고 더한 결과가 0인 이웃은 지움 (가중치가 0.5 단위라 부동소수점 오차 없이 0이 됨)
+    keep = ~own & (weights != 0)
+    return ids[keep], weights[keep], norm_sq
+
+
+def top_k_neighbors(matrix, course_ids, top_k=DEFAULT_TOP_K, norms=None):
+    '''
+    course_ids 각각과 가장 유사한 과외 top_k개를 {course_id: [(recommended_id, score), ...]}로 반환합니다.
+    유사도 = (X.T @ X)[i, j] / (|X[:, i]| * |X[:, j]|)
+    '''
+    course_ids = np.asarray(course_ids, dtype=np.int64)
+    if norms is None:
+        norms = column_norms(matrix)
+
+    cooccurrence = (matrix[:, course_ids].T @ matrix).tocsr()
+    neighbors = {}
+    for row, course_id in enumerate(course_ids):
+        start, end = cooccurrence.indptr[row], cooccurrence.indptr[row + 1]
+        other_ids, weights, _ = _split_row(course_id, cooccurrence.indices[start:end], cooccurrence.data[start:end])
+        neighbors[int(course_id)] = _neighbors(other_ids, weights, norms[course_id], norms, top_k)
+    return neighbors
+
+
+def _save_rows(rows, neighbors):
+    '''
+    rows: {course_id: (other_ids, weights, norm_sq)} - 과외별 동시 발생 행
+    neighbors: {course_id: [(recommended_id, score), ...]}
+    '''
+    course_ids = list(rows)
+    CourseCooccurrence.objects.filter(course_id__in=course_ids).delete()
+    CourseCooccurrence.objects.bulk_create([
+        CourseCooccurrence(course_id=course_id, other_ids=other_ids.tobytes(), weights=weights.tobytes(), norm_sq=norm_sq)
+        for course_id, (other_ids, weights, norm_sq) in rows.items()
+        if norm_sq > 0
+    ])
+    CourseRecommendation.objects.filter(course_id__in=course_ids).delete()
+    CourseRecommendation.objects.bulk_create([
+        CourseRecommendation(course_id=course_id, recommended_course_id=recommended_id, rank=rank, score=score)
+        for course_id, items in neighbors.items()
+        for rank, (recommended_id, score) in enumerate(items)
+    ])
+
+
+def _existing_course_mask(size):
+    # 계산을 시작할 때 남아 있는 과외 (삭제된 과외는 저장/추천하지 않음)
+    mask = np.zeros(size, dtype=bool)
+    ids = np.fromiter(Course.objects.filter(pk__lt=size).values_list('pk', flat=True).iterator(), dtype=np.int64)
+    mask[ids] = True
+    return mask
+
+
+def _build_full(state, top_k, batch_size, lag):
+    # 다 끝나기 전에는 증분 갱신이 이 결과 위에 더하지 않도록 완료 표시를 먼저 지움
+    state.built_at = None
+    state.save(update_fields=['built_at'])
+
+    max_enrollment_id = _high_watermark(Enrollment, lag)
+    max_wish_id = _high_watermark(WishedCourses, lag)
+    _, enrollment_pairs = _load_interactions(Enrollment, max_enrollment_id)
+    _, wish_pairs = _load_interactions(WishedCourses, max_wish_id)
+    matrix = interaction_matrix(enrollment_pairs, wish_pairs, *_matrix_shape(enrollment_pairs, wish_pairs))
+
+    norms = np.sqrt(np.asarray(matrix.multiply(matrix).sum(axis=0)).ravel())
+    norms[~_existing_course_mask(len(norms))] = 0
+    course_ids = np.flatnonzero(norms)
+
+    for start in range(0, len(course_ids), batch_size):
+        batch = course_ids[start:start + batch_size]
+        block = (matrix[:, batch].T @ matrix).tocsr()
+        rows, neighbors = {}, {}
+        for row, course_id in enumerate(batch.tolist()):
+            begin, end = block.indptr[row], block.indptr[row + 1]
+            rows[course_id] = _split_row(course_id, block.indices[begin:end], block.data[begin:end])
+            other_ids, weights, _ = rows[course_id]
+            neighbors[course_id] = _neighbors(other_ids, weights, norms[course_id], norms, top_k)
+        with transaction.atomic():
+            _save_rows(rows, neighbors)
+
+    # 상호작용이 모두 삭제된 과외의 이전 행/추천만 지움 (삭제된 과외의 행/추천은 CASCADE로 지워짐)
+    computed = set(course_ids.tolist())
+    for model in [CourseCooccurrence, CourseRecommendation]:
+        stale = [
+            course_id
+            for course_id in model.objects.values_list('course_id', flat=True).distinct()
+            if course_id not in computed
+        ]
+        for start in range(0, len(stale), batch_size):
+            model.objects.filter(course_id__in=stale[start:start + batch_size]).delete()
+
+    state.last_enrollment_id = max_enrollment_id
+    state.last_wish_id = max_wish_id
+    state.built_at = timezone.now()
+    state.save()
+    return len(course_ids)
+
+
+def _user_matrix(user_ids, enrollment_pairs, wish_pairs, n_courses):
+    # 행 번호를 user_ids 안의 순서로 바꿔서 유저 수만큼의 행렬을 만듦
+    def index(pairs):
+        return np.column_stack([np.searchsorted(user_ids, pairs[:, 0]), pairs[:, 1]]).reshape(-1, 2)
+
+    return interaction_matrix(index(enrollment_pairs), index(wish_pairs), len(user_ids), n_courses)
+
+
+def _load_rows(course_ids, batch_size):
+    rows = {}
+    for start in range(0, len(course_ids), batch_size):
+        for row in CourseCooccurrence.objects.filter(course_id__in=course_ids[start:start + batch_size]):
+            rows[row.course_id] = (
+                np.frombuffer(row.other_ids, dtype=np.int64), np.frombuffer(row.weights, dtype=np.float64), row.norm_sq,
+            )
+    return rows
+
+
+def _build_incremental(state, top_k, batch_size, lag):
+    max_enrollment_id = max(_high_watermark(Enrollment, lag), state.last_enrollment_id)
+    max_wish_id = max(_high_watermark(WishedCourses, lag), state.last_wish_id)
+
+    # 워터마크 이후에 상호작용을 만든 유저
+    user_ids = np.unique(np.concatenate([
+        np.fromiter(
+            model.objects.filter(pk__gt=low, pk__lte=high).values_list('user_id', flat=True).distinct().iterator(),
+            dtype=np.int64,
+        )
+        for model, low, high in [
+            (Enrollment, state.last_enrollment_id, max_enrollment_id),
+            (WishedCourses, state.last_wish_id, max_wish_id),
+        ]
+    ]))
+
+    updated = 0
+    if len(user_ids):
+        enrollment_pks, enrollment_pairs = _load_user_interactions(Enrollment, user_ids, max_enrollment_id)
+        wish_pks, wish_pairs = _load_user_interactions(WishedCourses, user_ids, max_wish_id)
+        _, n_courses = _matrix_shape(enrollment_pairs, wish_pairs)
+        new = _user_matrix(user_ids, enrollment_pairs, wish_pairs, n_courses)
+        old = _user_matrix(
+            user_ids,
+            enrollment_pairs[enrollment_pks <= state.last_enrollment_id],
+            wish_pairs[wish_pks <= state.last_wish_id],
+            n_courses,
+        )
+        delta = (new.T @ new - old.T @ old).tocsr()
+        delta.eliminate_zeros()
+
+        # 이웃의 벡터 크기는 저장된 norm_sq로 구하고, 이번에 바뀐 과외만 아래에서 덮어씀
+        norm_rows = list(CourseCooccurrence.objects.values_list('course_id', 'norm_sq').iterator())
+        size = max([n_courses] + [course_id + 1 for course_id, _ in norm_rows])
+        existing = _existing_course_mask(size)
+        norms = np.zeros(size)
+        for course_id, norm_sq in norm_rows:
+            norms[course_id] = norm_sq
+
+        course_ids = np.flatnonzero(np.diff(delta.indptr))
+        course_ids = course_ids[existing[course_ids]].tolist()
+
+        # 바뀐 과외의 C 행 = 저장된 행 + delta 행 (그 사이에 삭제된 과외는 뺌)
+        stored = _load_rows(course_ids, batch_size)
+        rows = {}
+        for course_id in course_ids:
+            other_ids, weights, norm_sq = stored.get(course_id, (np.empty(0, np.int64), np.empty(0), 0.0))
+            begin, end = delta.indptr[course_id], delta.indptr[course_id + 1]
+            ids, inverse = np.unique(
+                np.concatenate([other_ids, [course_id], delta.indices[begin:end]]), return_inverse=True,
+            )
+            sums = np.bincount(inverse, weights=np.concatenate([weights, [norm_sq], delta.data[begin:end]]))
+            sums[~existing[ids]] = 0
+            rows[course_id] = _split_row(course_id, ids, sums)
+            norms[course_id] = rows[course_id][2]
+        norms[~existing] = 0
+        norms = np.sqrt(norms)
+
+        neighbors = {
+            course_id: _neighbors(other_ids, weights, norms[course_id], norms, top_k)
+            for course_id, (other_ids, weights, _) in rows.items()
+        }
+        for start in range(0, len(course_ids), batch_size):
+            batch = course_ids[start:start + batch_size]
+            _save_rows({course_id: rows[course_id] for course_id in batch},
+                       {course_id: neighbors[course_id] for course_id in batch})
+        updated = len(course_ids)
+
+    state.last_enrollment_id = max_enrollment_id
+    state.last_wish_id = max_wish_id
+    state.built_at = timezone.now()
+    state.save()
+    return updated
+
+
+def build_recommendations(full=False, top_k=DEFAULT_TOP_K, batch_size=500, lag=WATERMARK_LAG):
+    '''
+    추천 테이블을 갱신하고 다시 계산한 과외 수를 반환합니다.
+    full=False면 워터마크 이후의 상호작용에 영향을 받은 과외만 다시 계산합니다. (증분 갱신)
+    '''
+    RecommendationBuildState.load()
+    if not full:
+        with transaction.atomic():
+            # 증분 갱신이 동시에 두 번 실행되어 같은 변화를 두 번 더하지 않도록 상태 행을 잠금
+            state = RecommendationBuildState.objects.select_for_update().get(pk=1)
+            if state.built_at is not None:
+                return _build_incremental(state, top_k, batch_size, lag)
+    return _build_full(RecommendationBuildState.load(), top_k, batch_size, lag)
+
+
+def get_recommendations(course_id, limit=10, status=None):
+    '''미리 계산된 추천 과외를 순위대로 반환합니다. (쿼리 1번, 최대 K행)'''
+    queryset = (
+        CourseRecommendation.objects.filter(course_id=course_id)
+        .select_related('recommended_course')
+        .order_by('rank')
+    )
+    if status is not None:
+        queryset = queryset.filter(recommended_course__status=status)
+    return [recommendation.recommended_course for recommendation in queryset[:limit]]
@@ -0,0 +1,145 @@
+'''
+과외 검색 (제목, 소개, 커리큘럼)
+
+icontains(LIKE '%...%')는 테이블 전체를 읽고 한국어 형태소(조사 등)를 처리하지 못하므로,
+CourseSearchToken 테이블에 역색인을 만들어 토큰으로 과외를 찾습니다.
+
+- 토큰: 한글은 글자 2-gram("파이썬기초" -> 파이, 이썬, 썬기, 기초), 영문/숫자는 소문자 단어
+- 색인: 과외가 저장될 때 시그널로 해당 과외의 토큰만 다시 만듦 (courses/signals.py)
+  bulk_create 등 시그널이 없는 작업 이후에는 `manage.py rebuild_search_index`
+- 순위: 검색어의 모든 토큰(색인에 없는 토큰 제외)을 포함하는 과외 중에서
+  sum(토큰 가중치 * idf) + SEARCH_POPULARITY_WEIGHT * ln(1 + popularity_score)
+'''
+import math
+import re
+import unicodedata
+from collections import Counter
+
+from django.db import transaction
+from django.db.models import Case, Count, F, FloatField, Max, Sum, Value, When
+from django.db.models.functions import Ln
+
+from courses.cached_fields import iter_course_id_batches
+from courses.models import Course, CourseSearchToken
+
+# 필드별 가중치 - 제목에 나온 단어가 가장 중요함
+FIELD_WEIGHTS = {
+    'title': 3.0,
+    'description': 1.0,
+    'curriculum': 0.5,
+}
+SEARCH_FIELDS = list(FIELD_WEIGHTS)
+
+# 관련도가 같을 때 인기 과외가 먼저 나오도록 더하는 값의 가중치
+SEARCH_POPULARITY_WEIGHT = 0.5
+
+MAX_TOKEN_LENGTH = 30
+
+_WORD_RE = re.compile(r'[가-힣]+|[a-z0-9]+')
+
+
+def tokenize(text):
+    '''텍스트를 검색 토큰 목록으로 바꿉니다. (중복 포함, 등장 순서대로)'''
+    text = unicodedata.normalize('NFC', text or '').lower()
+    tokens = []
+    for word in _WORD_RE.findall(text):
+        if '가' <= word[0] <= '힣' and len(word) > 1:
+            tokens.extend(word[i:i + 2] for i in range(len(word) - 1))
+        else:
+            tokens.append(word[:MAX_TOKEN_LENGTH])
+    return tokens
+
+
+def token_weights(course):
+    '''과외 하나의 {토큰: 가중치} - 필드 가중치 * (1 + ln(필드 안 등장 횟수))를 필드별로 더함'''
+    weights = Counter()
+    for field, field_weight in FIELD_WEIGHTS.items():
+        for token, count in Counter(tokenize(getattr(course, field))).items():
+            weights[token] += field_weight * (1 + math.log(count))
+    return weights
+
+
+def _build_tokens(courses):
+    return [
+        CourseSearchToken(token=token, course_id=course.pk, weight=weight)
+        for course in courses
+        for token, weight in token_weights(course).items()
+    ]
+
+
+def index_course(course):
+    '''과외 하나의 색인을 다시 만듭니다.'''
+    with transaction.atomic():
+        CourseSearchToken.objects.filter(course_id=course.pk).delete()
+        CourseSearchToken.objects.bulk_create(_build_tokens([course]))
+
+
+def rebuild_search_index(queryset=None, batch_size=500):
+    '''과외(기본값: 전체)의 색인을 batch_size개씩 다시 만들고, 색인한 과외 수를 반환합니다.'''
+    if queryset is None:
+        queryset = Course.objects.all()
+
+    indexed = 0
+    for ids in iter_course_id_batches(queryset, batch_size):
+        courses = Course.objects.filter(pk__in=ids).only('pk', *SEARCH_FIELDS)
+        with transaction.atomic():
+            CourseSearchToken.objects.filter(course_id__in=ids).delete()
+            CourseSearchToken.objects.bulk_create(_build_tokens(courses), batch_size=5000)
+        indexed += len(ids)
+    return indexed
+
+
+def _idf(tokens):
+    # 토큰별 문서 빈도로 idf 계산 - 흔한 토큰(예: "강의")일수록 점수가 작음
+    total = Course.objects.count() or 1
+    frequencies = dict(
+        CourseSearchToken.objects.filter(token__in=tokens)
+        .values('token')
+        .annotate(n=Count('course_id'))
+        .values_list('token', 'n')
+    )
+    return {token: math.log(1 + total / frequencies[token]) for token in tokens if token in frequencies}
+
+
+def search_courses(query, limit=20, category=None, status=None):
+    '''
+    검색어의 모든 토큰(색인에 없는 토큰 제외)을 포함하는 과외를 순위대로 반환합니다.
+    각 과외에는 search_rank 속성으로 점수가 들어 있습니다.
+    '''
+    tokens = list(dict.fromkeys(tokenize(query)))
+    if not tokens:
+        return []
+    idf = _idf(tokens)
+    # 어떤 과외에도 없는 토큰(예: "기타를"의 "타를")은 조사 등으로 보고 무시함
+    tokens = [token for token in tokens if token in idf]
+    if not tokens:
+        return []
+
+    matches = CourseSearchToken.objects.filter(token__in=tokens)
+    if category is not None:
+        matches = matches.filter(course__category=category)
+    if status is not None:
+        matches = matches.filter(course__status=status)
+
+    relevance = Sum(
+        Case(
+            *[When(token=token, then=F('weight') * Value(value)) for token, value in idf.items()],
+            output_field=FloatField(),
+        )
+    )
+    rows = (
+        matches.values('course_id')
+        .annotate(matched=Count('token'), relevance=relevance, popularity=Max('course__popularity_score'))
+        .filter(matched=len(tokens))
+        .annotate(rank=F('relevance') + SEARCH_POPULARITY_WEIGHT * Ln(1 + F('popularity')))
+        .order_by('-rank', 'course_id')
+        .values_list('course_id', 'rank')[:limit]
+    )
+    ranks = dict(rows)
+    courses = Course.objects.in_bulk(list(ranks))
+    results = []
+    for course_id, rank in ranks.items():
+        course = courses[course_id]
+        course.search_rank = rank
+        results.append(course)
+    return results
@@ -0,0 +1,215 @@
+'''
+Enrollment, WishedCourses, Review가 생성/삭제될 때 Course의 캐싱 필드를 F() 식으로 증분 갱신합니다.
+과외 개설/수강 신청/찜에 따라 유저별 카운터(UserCourseStats)도 같은 방식으로 갱신합니다.
+
+- 갱신은 과외 행 하나에 대한 UPDATE 한 번이므로 동시에 여러 요청이 와도 값이 유실되지 않습니다.
+- bulk_create / QuerySet.update는 시그널을 보내지 않으므로, 대량 작업은
+  deferred_counter_updates() 블록 안에서 실행하고 영향을 받은 과외 ID를 직접 추가합니다.
+
+Course/Category/User(튜터 username)가 바뀔 때 read-through 캐시(courses/cache.py)도 여기서 무효화합니다.
+Course의 제목/소개/커리큘럼이 바뀌면 검색 색인(courses/search.py)도 다시 만듭니다.
+과외나 카운터가 바뀐 카테고리는 집계 스냅샷(courses/category_stats.py)의 다음 갱신 대상으로 표시합니다.
+'''
+import contextlib
+import threading
+
+from django.conf import settings
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from courses.cached_fields import (
+    recompute_cached_fields,
+    review_rating_change_updates,
+    review_updates,
+    tutee_count_updates,
+    wish_count_updates,
+)
+from courses import cache, category_stats, search
+from courses.models import Category, Course, Enrollment, WishedCourses
+from courses.ratings import to_points
+from courses.user_stats import backfill_user_stats, bump_user_stat
+
+_state = threading.local()
+
+
+@contextlib.contextmanager
+def deferred_counter_updates(batch_size=500):
+    '''
+    블록 안에서 발생한 증감은 바로 반영하지 않고 과외/유저 ID만 모아 두었다가,
+    블록이 정상적으로 끝나면 해당 과외/유저들만 집계 쿼리로 다시 계산합니다.
+    (bulk_create로 만든 행의 유저 카운터는 `manage.py backfill_user_stats`로 채웁니다.)
+
+        with deferred_counter_updates() as touched:
+            Enrollment.objects.filter(course__in=...).delete()
+            Enrollment.objects.bulk_create(objs)
+            touched.update(obj.course_id for obj in objs)
+    '''
+    touched = getattr(_state, 'touched', None)
+    if touched is not None:
+        # 중첩된 블록은 바깥 블록에 합쳐서 한 번만 계산합니다.
+        yield touched
+        return
+
+    touched = _state.touched = set()
+    touched_users = _state.touched_users = set()
+    try:
+        yield touched
+    except BaseException:
+        _state.touched = _state.touched_users = None
+        raise
+    _state.touched = _state.touched_users = None
+
+    course_ids = sorted(touched)
+    for start in range(0, len(course_ids), batch_size):
+        chunk = course_ids[start:start + batch_size]
+        recompute_cached_fields(Course.objects.filter(pk__in=chunk), batch_size=batch_size)
+        category_stats.mark_courses_dirty(chunk)
+    cache.invalidate_courses(course_ids)
+    if touched_users:
+        backfill_user_stats(batch_size, user_ids=touched_users)
+
+
+def _apply(course_id, updates):
+    touched = getattr(_state, 'touched', None)
+    if touched is not None:
+        # 블록이 끝나고 다시 계산한 뒤에 무효화함
+        touched.add(course_id)
+        return
+    Course.objects.filter(pk=course_id).update(**updates)
+    # 캐싱 필드가 바뀌었으므로 캐시된 과외 정보도 무효화함 (UPDATE 뒤, 커밋 후에 한 번 더)
+    cache.invalidate_course(course_id)
+    category_stats.mark_courses_dirty([course_id])
+
+
+def _bump_user(user_id, field, delta):
+    touched_users = getattr(_state, 'touched_users', None)
+    if touched_users is not None:
+        touched_users.add(user_id)
+        return
+    bump_user_stat(user_id, field, delta)
+
+
+@receiver(post_save, sender=Enrollment)
+def enrollment_created(sender, instance, created, raw=False, **kwargs):
+    if created and not raw:
+        # courses/enrollment.py의 enroll()은 좌석 예약 UPDATE에서 이미 카운터를 올림
+        if not getattr(instance, '_seat_reserved', False):
+            _apply(instance.course_id, tutee_count_updates(1))
+        _bump_user(instance.user_id, 'attending_courses_count', 1)
+
+
+@receiver(post_delete, sender=Enrollment)
+def enrollment_deleted(sender, instance, **kwargs):
+    _apply(instance.course_id, tutee_count_updates(-1))
+    _bump_user(instance.user_id, 'attending_courses_count', -1)
+
+
+@receiver(post_save, sender=WishedCourses)
+def wish_created(sender, instance, created, raw=False, **kwargs):
+    if created and not raw:
+        _apply(instance.course_id, wish_count_updates(1))
+        _bump_user(instance.user_id, 'wished_courses_count', 1)
+
+
+@receiver(post_delete, sender=WishedCourses)
+def wish_deleted(sender, instance, **kwargs):
+    _apply(instance.course_id, wish_count_updates(-1))
+    _bump_user(instance.user_id, 'wished_courses_count', -1)
+
+
+def _review_course_id(review):
+    # Review는 Enrollment를 통해 Course와 연결됨
+    return Enrollment.objects.filter(pk=review.enrollment_id).values_list('course_id', flat=True).first()
+
+
+@receiver(pre_save, sender='reviews.Review')
+def review_before_save(sender, instance, raw=False, **kwargs):
+    # 수정인 경우 이전 평점/수강 정보를 기억해 둠 (post_save에서 차이만 반영)
+    instance._previous_review = None
+    if instance.pk is not None and not raw and not instance._state.adding:
+        instance._previous_review = sender.objects.filter(pk=instance.pk).values('rating', 'enrollment_id').first()
+
+
+@receiver(post_save, sender='reviews.Review')
+def review_saved(sender, instance, created, raw=False, **kwargs):
+    if raw:
+        return
+    previous = getattr(instance, '_previous_review', None)
+    if created or previous is None:
+        course_id = _review_course_id(instance)
+        if course_id is not None:
+            _apply(course_id, review_updates(instance.rating, 1))
+        return
+
+    old_course_id = Enrollment.objects.filter(pk=previous['enrollment_id']).values_list('course_id', flat=True).first()
+    new_course_id = _review_course_id(instance)
+    if old_course_id == new_course_id:
+        # 같은 평점이 다른 타입(예: 문자열 '3.0')으로 저장돼도 같은 값으로 봄
+        if old_course_id is not None and to_points(previous['rating']) != to_points(instance.rating):
+            _apply(old_course_id, review_rating_change_updates(previous['rating'], instance.rating))
+        return
+    # 리뷰가 다른 과외의 수강 기록으로 옮겨진 경우
+    if old_course_id is not None:
+        _apply(old_course_id, review_updates(previous['rating'], -1))
+    if new_course_id is not None:
+        _apply(new_course_id, review_updates(instance.rating, 1))
+
+
+@receiver(post_delete, sender='reviews.Review')
+def review_deleted(sender, instance, **kwargs):
+    course_id = _review_course_id(instance)
+    if course_id is not None:
+        _apply(course_id, review_updates(instance.rating, -1))
+
+
+# --- read-through 캐시 무효화 (courses/cache.py) ---
+
+@receiver(post_save, sender=Course)
+def course_saved(sender, instance, created, update_fields=None, **kwargs):
+    cache.invalidate_course(instance.pk)
+    if created:
+        cache.invalidate_category(instance.category_id)
+        category_stats.mark_categories_dirty([instance.category_id])
+        if not kwargs.get('raw'):
+            _bump_user(instance.tutor_id, 'created_courses_count', 1)
+    elif update_fields is None or 'category' in update_fields:
+        # 이전 카테고리를 알 수 없으므로 카테고리 목록을 모두 비움 (카테고리 수가 적음)
+        cache.clear_category_course_ids()
+        category_stats.mark_categories_dirty()
+    else:
+        category_stats.mark_categories_dirty([instance.category_id])
+
+
+@receiver(post_delete, sender=Course)
+def course_deleted(sender, instance, **kwargs):
+    cache.invalidate_course(instance.pk)
+    cache.invalidate_category(instance.category_id)
+    category_stats.mark_categories_dirty([instance.category_id])
+    _bump_user(instance.tutor_id, 'created_courses_count', -1)
+
+
+# --- 검색 색인 (courses/search.py) ---
+
+@receiver(post_save, sender=Course)
+def course_text_saved(sender, instance, created, raw=False, update_fields=None, **kwargs):
+    # 캐싱 필드만 저장하는 경우(update_fields 지정)에는 색인할 필요 없음
+    if raw or (update_fields is not None and not set(update_fields) & set(search.SEARCH_FIELDS)):
+        return
+    search.index_course(instance)
+
+
+@receiver(post_save, sender=Category)
+@receiver(post_delete, sender=Category)
+def category_changed(sender, instance, **kwargs):
+    # 과외 정보에 카테고리 이름이 들어 있으므로 과외 캐시도 모두 비움 (카테고리 변경은 드묾)
+    cache.invalidate_category(instance.pk)
+    cache.clear_course_records()
+
+
+@receiver(post_save, sender=settings.AUTH_USER_MODEL)
+def user_saved(sender, instance, created, raw=False, update_fields=None, **kwargs):
+    # 과외 정보에 튜터 username이 들어 있으므로 튜터의 과외 캐시를 비움
+    # (로그인 시 last_login만 저장하는 경우처럼 username이 바뀔 수 없는 저장은 건너뜀)
+    if created or raw or (update_fields is not None and 'username' not in update_fields):
+        return
+    cache.invalidate_courses(Course.objects.filter(tutor_id=instance.pk).values_list('pk', flat=True))
@@ -0,0 +1,65 @@
+'''
+날짜에 따른 수강 신청/과외 상태 변경 (매일 실행하는 `manage.py transition_statuses`)
+
+- 수강 신청: 수강 종료일(end_date)이 지난 enrolled -> completed
+- 과외: in_progress 과외 중 수강 신청이 있고 모두 completed인 과외 -> finished
+  (Course에는 종료일이 없으므로 수강생 전원의 수강 기간이 끝난 과외를 종료된 것으로 봅니다.)
+
+행마다 save()하지 않고 batch_size개씩 잘라서 UPDATE 한 번으로 바꿉니다. 묶음마다 바로 커밋되므로
+운영 중에 실행해도 테이블을 오래 잠그지 않으며, pause로 묶음 사이에 쉬어 갈 수 있습니다.
+UPDATE에도 이전 상태 조건을 다시 걸기 때문에 요청 처리와 겹치거나 두 번 실행해도 안전합니다.
+
+QuerySet.update는 시그널을 보내지 않으므로, 상태가 바뀐 과외의 캐시 무효화와
+카테고리 집계 스냅샷(모집중 과외 수) 갱신 표시는 여기서 직접 합니다.
+수강생 수/유저 카운터는 상태와 관계없이 수강 신청 수를 세므로 바뀌지 않습니다.
+'''
+import time
+
+from django.db.models import Exists, OuterRef
+from django.utils import timezone
+
+from courses import cache, category_stats
+from courses.cached_fields import iter_course_id_batches
+from courses.models import Course, Enrollment
+
+DEFAULT_BATCH_SIZE = 1000
+
+
+def complete_expired_enrollments(today=None, batch_size=DEFAULT_BATCH_SIZE, pause=0):
+    '''수강 종료일이 today 이전인 수강 신청을 completed로 바꾸고, 바꾼 행 수를 반환합니다.'''
+    today = today or timezone.localdate()
+    expired = Enrollment.objects.filter(status=Enrollment.StatusChoices.ENROLLED, end_date__lt=today)
+
+    completed = 0
+    while True:
+        # (status, end_date) 인덱스로 앞에서부터 batch_size개만 읽음 - 바뀐 행은 조건에서 빠지므로 OFFSET 불필요
+        ids = list(expired.order_by('end_date').values_list('pk', flat=True)[:batch_size])
+        if not ids:
+            return completed
+        completed += expired.filter(pk__in=ids).update(status=Enrollment.StatusChoices.COMPLETED)
+        if pause:
+            time.sleep(pause)
+
+
+def finish_completed_courses(batch_size=DEFAULT_BATCH_SIZE, pause=0):
+    '''수강생 전원의 수강이 끝난 in_progress 과외를 finished로 바꾸고, 바꾼 과외 수를 반환합니다.'''
+    in_progress = Course.objects.filter(status=Course.StatusChoices.IN_PROGRESS)
+    course_enrollments = Enrollment.objects.filter(course_id=OuterRef('pk'))
+
+    finished = 0
+    for course_ids in iter_course_id_batches(in_progress, batch_size):
+        done = in_progress.filter(pk__in=course_ids).filter(
+            Exists(course_enrollments),
+        ).exclude(
+            Exists(course_enrollments.filter(status=Enrollment.StatusChoices.ENROLLED)),
+        )
+        done_ids = list(done.values_list('pk', flat=True))
+        if not done_ids:
+            continue
+        finished += in_progress.filter(pk__in=done_ids).update(status=Course.StatusChoices.FINISHED)
+        for course_id in done_ids:
+            cache.invalidate_course(course_id)
+        category_stats.mark_courses_dirty(done_ids)
+        if pause:
+            time.sleep(pause)
+    return finished
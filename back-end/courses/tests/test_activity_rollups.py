@@ -0,0 +1,95 @@
+import datetime
+from datetime import timedelta
+
+from django.test import TestCase
+from django.utils import timezone
+
+from courses.activity_rollups import Period, activity_series, backfill_activity_rollups, update_activity_rollups
+from courses.models import CourseActivityRollup, Enrollment, WishedCourses
+from courses.tests.utils import END_DATE, START_DATE, make_category, make_course, make_user
+
+NO_LAG = timedelta(0)
+
+# 2025-03-03은 월요일
+MONDAY = datetime.date(2025, 3, 3)
+
+
+def at(day):
+    return timezone.make_aware(datetime.datetime.combine(day, datetime.time(12)))
+
+
+class ActivityRollupTests(TestCase):
+
+    def setUp(self):
+        self.category = make_category()
+        tutor = make_user('tutor')
+        self.course = make_course(tutor, self.category)
+        self.other = make_course(tutor, self.category, title='자바 기초')
+        self.user_count = 0
+
+    def enroll(self, course, day):
+        self.user_count += 1
+        enrollment = Enrollment.objects.create(
+            user=make_user(f'user{self.user_count}'), course=course, start_date=START_DATE, end_date=END_DATE,
+        )
+        Enrollment.objects.filter(pk=enrollment.pk).update(created_at=at(day))
+
+    def wish(self, course, day):
+        self.user_count += 1
+        wish = WishedCourses.objects.create(user=make_user(f'user{self.user_count}'), course=course)
+        WishedCourses.objects.filter(pk=wish.pk).update(created_at=at(day))
+
+    def seed_activity(self):
+        self.enroll(self.course, MONDAY)
+        self.enroll(self.course, MONDAY)
+        self.wish(self.course, MONDAY + timedelta(days=1))
+        self.enroll(self.other, MONDAY + timedelta(days=8))
+
+    def series(self, period, **scope):
+        return [
+            (row['bucket'], row['enrollments'], row['wishes'])
+            for row in activity_series(period, MONDAY, MONDAY + timedelta(days=8), **scope)
+        ]
+
+    def test_incremental_update(self):
+        self.seed_activity()
+        self.assertEqual(update_activity_rollups(lag=NO_LAG), 4)
+        self.assertEqual(self.series(Period.DAY, course_id=self.course.pk)[:3], [
+            (MONDAY, 2, 0), (MONDAY + timedelta(days=1), 0, 1), (MONDAY + timedelta(days=2), 0, 0),
+        ])
+        self.assertEqual(self.series(Period.WEEK, category_id=self.category.pk), [
+            (MONDAY, 2, 1), (MONDAY + timedelta(days=7), 1, 0),
+        ])
+
+        # 다시 실행해도 두 번 더하지 않고, 새 행만 기존 구간에 더함
+        self.assertEqual(update_activity_rollups(lag=NO_LAG), 0)
+        self.wish(self.course, MONDAY)
+        self.assertEqual(update_activity_rollups(lag=NO_LAG), 1)
+        self.assertEqual(self.series(Period.WEEK, course_id=self.course.pk)[0], (MONDAY, 2, 2))
+
+    def test_recent_rows_wait_for_watermark_lag(self):
+        self.seed_activity()
+        update_activity_rollups(lag=NO_LAG)
+        # 방금 생성된 행은 기본 지연(5분)이 지나야 반영됨
+        wish = WishedCourses.objects.create(user=make_user('late'), course=self.course)
+        self.assertEqual(update_activity_rollups(), 0)
+        self.assertEqual(update_activity_rollups(lag=NO_LAG), 1)
+        today = timezone.localdate(wish.created_at)
+        self.assertEqual(
+            CourseActivityRollup.objects.get(course=self.course, period=Period.DAY, bucket=today).wish_count, 1,
+        )
+
+    def test_backfill_matches_incremental(self):
+        self.seed_activity()
+        update_activity_rollups(lag=NO_LAG)
+        incremental = self.series(Period.DAY, category_id=self.category.pk)
+        CourseActivityRollup.objects.filter(course=self.course).update(enrollment_count=99)
+        self.assertEqual(backfill_activity_rollups(course_batch_size=1, lag=NO_LAG), 4)
+        self.assertEqual(self.series(Period.DAY, category_id=self.category.pk), incremental)
+        self.assertEqual(self.series(Period.DAY, course_id=self.course.pk)[0], (MONDAY, 2, 0))
+
+    def test_series_requires_one_scope(self):
+        with self.assertRaises(ValueError):
+            activity_series(Period.DAY, MONDAY, MONDAY)
+        with self.assertRaises(ValueError):
+            activity_series(Period.DAY, MONDAY, MONDAY, course_id=self.course.pk, category_id=self.category.pk)
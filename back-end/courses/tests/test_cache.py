@@ -0,0 +1,52 @@
+from django.test import TestCase
+
+from courses import cache
+from courses.models import Enrollment
+from courses.tests.utils import END_DATE, START_DATE, make_category, make_course, make_user
+
+
+class CourseCacheTests(TestCase):
+
+    def setUp(self):
+        cache.course_records.clear()
+        cache.category_course_ids.clear()
+        self.tutor = make_user('tutor')
+        self.category = make_category()
+        self.course = make_course(self.tutor, self.category)
+
+    def test_read_through(self):
+        record = cache.get_course_record(self.course.pk)
+        self.assertEqual(record['tutor_username'], 'tutor')
+        with self.assertNumQueries(0):
+            cache.get_course_record(self.course.pk)
+
+    def test_returns_copies(self):
+        cache.get_course_record(self.course.pk)['title'] = '바뀐 제목'
+        self.assertEqual(cache.get_course_record(self.course.pk)['title'], '파이썬 기초')
+
+    def test_missing_course_is_not_cached(self):
+        self.assertIsNone(cache.get_course_record(0))
+        self.assertEqual(cache.course_records.stats()['size'], 0)
+
+    def test_invalidated_on_course_save(self):
+        cache.get_course_record(self.course.pk)
+        self.course.title = '자바 기초'
+        self.course.save()
+        self.assertEqual(cache.get_course_record(self.course.pk)['title'], '자바 기초')
+
+    def test_invalidated_on_counter_change(self):
+        cache.get_course_record(self.course.pk)
+        Enrollment.objects.create(user=make_user('tutee'), course=self.course, start_date=START_DATE, end_date=END_DATE)
+        self.assertEqual(cache.get_course_record(self.course.pk)['current_tutees_count'], 1)
+
+    def test_invalidated_on_tutor_rename(self):
+        cache.get_course_record(self.course.pk)
+        self.tutor.username = 'renamed'
+        self.tutor.save()
+        self.assertEqual(cache.get_course_record(self.course.pk)['tutor_username'], 'renamed')
+
+    def test_category_course_ids(self):
+        newer = make_course(self.tutor, self.category, title='자바 기초')
+        self.assertEqual(cache.get_category_course_ids(self.category.pk), [newer.pk, self.course.pk])
+        other = make_course(self.tutor, self.category, title='C 기초')
+        self.assertEqual(cache.get_category_course_ids(self.category.pk)[0], other.pk)
@@ -0,0 +1,57 @@
+from django.test import TestCase
+
+from courses.cached_fields import find_counter_drift, recompute_cached_fields
+from courses.models import Course, Enrollment, WishedCourses
+from courses.signals import deferred_counter_updates
+from courses.tests.utils import END_DATE, START_DATE, make_category, make_course, make_user
+
+
+class CounterSignalTests(TestCase):
+
+    def setUp(self):
+        self.tutor = make_user('tutor')
+        self.tutee = make_user('tutee')
+        self.course = make_course(self.tutor, make_category())
+
+    def refresh(self):
+        self.course.refresh_from_db()
+        return self.course
+
+    def enroll(self, user=None):
+        return Enrollment.objects.create(
+            user=user or self.tutee, course=self.course, start_date=START_DATE, end_date=END_DATE,
+        )
+
+    def test_enrollment_and_wish_counters(self):
+        enrollment = self.enroll()
+        wish = WishedCourses.objects.create(user=self.tutee, course=self.course)
+        self.assertEqual(self.refresh().current_tutees_count, 1)
+        self.assertEqual(self.course.wishlist_count, 1)
+        self.assertGreater(self.course.popularity_score, 0)
+
+        enrollment.delete()
+        wish.delete()
+        self.assertEqual(self.refresh().current_tutees_count, 0)
+        self.assertEqual(self.course.wishlist_count, 0)
+        self.assertEqual(self.course.popularity_score, 0)
+        self.assertEqual(find_counter_drift(), [])
+
+    def test_deferred_updates_recompute_once(self):
+        users = [make_user(f'user{i}') for i in range(3)]
+        with deferred_counter_updates() as touched:
+            Enrollment.objects.bulk_create(
+                [Enrollment(user=user, course=self.course, start_date=START_DATE, end_date=END_DATE)
+                 for user in users]
+            )
+            touched.add(self.course.pk)
+            # 블록 안에서는 반영되지 않음
+            self.assertEqual(self.refresh().current_tutees_count, 0)
+        self.assertEqual(self.refresh().current_tutees_count, 3)
+        self.assertEqual(find_counter_drift(), [])
+
+    def test_recompute_fixes_drift(self):
+        self.enroll()
+        Course.objects.filter(pk=self.course.pk).update(current_tutees_count=5)
+        self.assertEqual(len(find_counter_drift()), 1)
+        recompute_cached_fields()
+        self.assertEqual(find_counter_drift(), [])
@@ -0,0 +1,31 @@
+from unittest import mock
+
+from django.test import SimpleTestCase
+
+from courses import db_settings
+from courses.db_settings import POSTGRESQL_ENGINE, configure_connections
+
+
+class ConfigureConnectionsTests(SimpleTestCase):
+
+    def test_wsgi_reuses_connections(self):
+        database = {'ENGINE': 'django.db.backends.sqlite3', 'NAME': 'db.sqlite3', 'OPTIONS': {'pool': True}}
+        configured = configure_connections(database)
+        self.assertEqual((configured['CONN_MAX_AGE'], configured['CONN_HEALTH_CHECKS']), (60, True))
+        self.assertEqual(configured['OPTIONS'], {})
+        # 원본은 바꾸지 않음
+        self.assertEqual(database['OPTIONS'], {'pool': True})
+
+    def test_asgi_postgresql_uses_pool(self):
+        database = {'ENGINE': POSTGRESQL_ENGINE, 'NAME': 'yunissaem'}
+        with mock.patch.object(db_settings, '_has_psycopg_pool', return_value=True):
+            configured = configure_connections(database, asgi=True, pool_max_size=8)
+        self.assertEqual(configured['CONN_MAX_AGE'], 0)
+        self.assertEqual(configured['OPTIONS']['pool'], {'min_size': 4, 'max_size': 8})
+
+    def test_asgi_without_psycopg_pool_falls_back(self):
+        database = {'ENGINE': POSTGRESQL_ENGINE, 'NAME': 'yunissaem'}
+        with mock.patch.object(db_settings, '_has_psycopg_pool', return_value=False):
+            configured = configure_connections(database, asgi=True)
+        self.assertEqual(configured['CONN_MAX_AGE'], 60)
+        self.assertNotIn('pool', configured['OPTIONS'])
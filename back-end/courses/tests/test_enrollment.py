@@ -0,0 +1,87 @@
+import threading
+from unittest import skipIf
+
+from django.db import close_old_connections, connection
+from django.test import TestCase, TransactionTestCase
+
+from courses import category_stats
+from courses.cached_fields import find_counter_drift
+from courses.enrollment import AlreadyEnrolled, CourseFull, CourseNotRecruiting, enroll
+from courses.models import Course, Enrollment
+from courses.tests.utils import END_DATE, START_DATE, make_category, make_course, make_user
+
+
+class EnrollTests(TestCase):
+
+    def setUp(self):
+        self.course = make_course(make_user('tutor'), make_category(), max_tutees=2)
+
+    def test_fills_seats_and_closes_recruiting(self):
+        enroll(make_user('a').pk, self.course.pk, START_DATE, END_DATE)
+        enroll(make_user('b').pk, self.course.pk, START_DATE, END_DATE)
+        self.course.refresh_from_db()
+        self.assertEqual(self.course.current_tutees_count, 2)
+        self.assertEqual(self.course.status, Course.StatusChoices.IN_PROGRESS)
+        with self.assertRaises(CourseNotRecruiting):
+            enroll(make_user('c').pk, self.course.pk, START_DATE, END_DATE)
+        self.assertEqual(find_counter_drift(), [])
+
+    def test_full_course(self):
+        # 상태는 모집중이지만 정원이 찬 경우
+        Course.objects.filter(pk=self.course.pk).update(current_tutees_count=2)
+        with self.assertRaises(CourseFull):
+            enroll(make_user('a').pk, self.course.pk, START_DATE, END_DATE)
+
+    def test_already_enrolled_releases_seat(self):
+        user = make_user('a')
+        enroll(user.pk, self.course.pk, START_DATE, END_DATE)
+        with self.assertRaises(AlreadyEnrolled):
+            enroll(user.pk, self.course.pk, START_DATE, END_DATE)
+        self.course.refresh_from_db()
+        self.assertEqual(self.course.current_tutees_count, 1)
+        self.assertEqual(self.course.status, Course.StatusChoices.RECRUITING)
+
+    def test_marks_category_stats_dirty(self):
+        # 좌석 예약 경로는 시그널의 과외 카운터 갱신을 건너뛰므로 enroll()에서 직접 표시해야 함
+        category_id = self.course.category_id
+        category_stats._save_snapshots([category_stats.compute_category_snapshot(category_id)])
+        self.assertEqual(category_stats.dirty_category_ids(), [])
+        enroll(make_user('a').pk, self.course.pk, START_DATE, END_DATE)
+        self.assertEqual(category_stats.dirty_category_ids(), [category_id])
+
+    def test_missing_course(self):
+        with self.assertRaises(Course.DoesNotExist):
+            enroll(make_user('a').pk, 0, START_DATE, END_DATE)
+
+
+# SQLite 테스트 DB(메모리 공유 캐시)는 동시 쓰기를 기다리지 않고 바로 실패하므로 다른 DB에서만 실행
+@skipIf(connection.vendor == 'sqlite', '동시 쓰기를 지원하는 DB에서만 실행')
+class EnrollRaceTests(TransactionTestCase):
+
+    def test_concurrent_enrollments_do_not_overbook(self):
+        course = make_course(make_user('tutor'), make_category(), max_tutees=3)
+        users = [make_user(f'user{i}') for i in range(10)]
+        barrier = threading.Barrier(len(users))
+        results = []
+
+        def run(user):
+            try:
+                barrier.wait()
+                enroll(user.pk, course.pk, START_DATE, END_DATE)
+                results.append('ok')
+            except (CourseFull, CourseNotRecruiting):
+                results.append('full')
+            finally:
+                close_old_connections()
+
+        threads = [threading.Thread(target=run, args=(user,)) for user in users]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        course.refresh_from_db()
+        self.assertEqual(results.count('ok'), 3)
+        self.assertEqual(course.current_tutees_count, 3)
+        self.assertEqual(Enrollment.objects.filter(course=course).count(), 3)
+        self.assertEqual(course.status, Course.StatusChoices.IN_PROGRESS)
@@ -0,0 +1,55 @@
+import shutil
+import tempfile
+from datetime import timedelta
+
+from django.test import TestCase
+
+from courses.export import export_snapshot, load_manifest, load_table
+from courses.models import Enrollment
+from courses.tests.utils import END_DATE, START_DATE, make_category, make_course, make_user
+
+NO_LAG = timedelta(0)
+
+
+class ExportTests(TestCase):
+
+    def setUp(self):
+        self.path = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.path, ignore_errors=True)
+        self.tutor = make_user('tutor')
+        self.category = make_category()
+        self.course = make_course(self.tutor, self.category)
+        self.tutee = make_user('tutee')
+        Enrollment.objects.create(user=self.tutee, course=self.course, start_date=START_DATE, end_date=END_DATE)
+
+    def test_full_export_round_trip(self):
+        counts = export_snapshot(self.path, full=True, lag=NO_LAG)
+        self.assertEqual(counts['user'], 2)
+        self.assertEqual(counts['course'], 1)
+
+        users = load_table(self.path, 'user', ['username', 'is_active'])
+        self.assertEqual(list(users['username']), ['tutor', 'tutee'])
+        self.assertTrue(users['is_active'].all())
+        enrollments = load_table(self.path, 'enrollment')
+        self.assertEqual(list(enrollments['user_id']), [self.tutee.pk])
+        self.assertEqual(str(enrollments['start_date'][0]), START_DATE.isoformat())
+
+    def test_incremental_export_keeps_latest_value(self):
+        export_snapshot(self.path, full=True, lag=NO_LAG)
+        self.course.title = '파이썬 심화'
+        self.course.save()
+        make_course(self.tutor, self.category, title='자바 기초')
+
+        self.assertEqual(export_snapshot(self.path, tables=['course'], lag=NO_LAG), {'course': 2})
+        self.assertEqual(len(load_manifest(self.path)['tables']['course']['parts']), 2)
+        courses = load_table(self.path, 'course', ['title'])
+        self.assertEqual(list(courses['title']), ['파이썬 심화', '자바 기초'])
+
+        # 바뀐 행이 없으면 빈 part를 만들지 않음
+        self.assertEqual(export_snapshot(self.path, tables=['course'], lag=NO_LAG), {'course': 0})
+        self.assertEqual(len(load_manifest(self.path)['tables']['course']['parts']), 2)
+
+    def test_recent_rows_wait_for_watermark_lag(self):
+        counts = export_snapshot(self.path, tables=['user'], full=True)
+        self.assertEqual(counts, {'user': 0})
+        self.assertEqual(len(load_table(self.path, 'user')['id']), 0)
@@ -0,0 +1,47 @@
+import datetime
+
+from django.test import TestCase
+from django.utils import timezone
+
+from courses.models import Course
+from courses.pagination import InvalidCursor, KeysetPaginator
+from courses.tests.utils import make_category, make_course, make_user
+
+
+class KeysetPaginatorTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        tutor = make_user('tutor')
+        category = make_category()
+        courses = [make_course(tutor, category, title=f'과외 {i}') for i in range(23)]
+        # 인기 점수/생성 시각이 같은 과외가 여러 개 있도록 함 (동점은 pk로 정렬)
+        created_at = timezone.now() - datetime.timedelta(days=1)
+        for i, course in enumerate(courses):
+            Course.objects.filter(pk=course.pk).update(
+                popularity_score=i % 4, created_at=created_at + datetime.timedelta(seconds=i // 3),
+            )
+
+    def walk(self, ordering, page_size):
+        paginator = KeysetPaginator(Course.objects.all(), ordering, page_size)
+        pks, cursor = [], None
+        while True:
+            page = paginator.page(cursor)
+            self.assertLessEqual(len(page.items), page_size)
+            pks.extend(course.pk for course in page.items)
+            if not page.has_next:
+                return pks
+            cursor = page.next_cursor
+
+    def test_pages_match_full_ordering(self):
+        for ordering in ['-created_at', '-popularity_score', 'popularity_score', '-pk']:
+            for page_size in [1, 5, 23]:
+                with self.subTest(ordering=ordering, page_size=page_size):
+                    paginator = KeysetPaginator(Course.objects.all(), ordering, page_size)
+                    expected = list(Course.objects.order_by(*paginator._order_by()).values_list('pk', flat=True))
+                    self.assertEqual(self.walk(ordering, page_size), expected)
+
+    def test_invalid_cursor(self):
+        paginator = KeysetPaginator(Course.objects.all(), '-created_at')
+        with self.assertRaises(InvalidCursor):
+            paginator.page('not-a-cursor')
@@ -0,0 +1,23 @@
+from io import StringIO
+from unittest import skipUnless
+
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase
+
+from courses.management.commands.check_query_plans import hot_queries
+
+
+@skipUnless(connection.vendor == 'sqlite', '실행 계획 검사는 SQLite 기준')
+class QueryPlanTests(TestCase):
+
+    def test_hot_queries_use_their_indexes(self):
+        for name, queryset, index_name in hot_queries():
+            with self.subTest(name):
+                plan = queryset.explain()
+                self.assertIn(index_name, plan)
+                self.assertNotIn('TEMP B-TREE', plan)
+
+    def test_check_query_plans_command(self):
+        # 인덱스를 사용하지 않는 쿼리가 있으면 CommandError
+        call_command('check_query_plans', stdout=StringIO())
@@ -0,0 +1,60 @@
+from django.test import TestCase
+
+from courses.cached_fields import find_counter_drift, rebuild_rating_stats
+from courses.models import Course, Enrollment
+from courses.tests.utils import END_DATE, START_DATE, make_category, make_course, make_user
+from reviews.models import Review
+
+
+class RatingStatsTests(TestCase):
+
+    def setUp(self):
+        self.course = make_course(make_user('tutor'), make_category())
+
+    def refresh(self):
+        self.course.refresh_from_db()
+        return self.course
+
+    def review(self, username, rating):
+        enrollment = Enrollment.objects.create(
+            user=make_user(username), course=self.course, start_date=START_DATE, end_date=END_DATE,
+        )
+        return Review.objects.create(enrollment=enrollment, rating=rating)
+
+    def test_review_rating_stats(self):
+        review = self.review('a', '4.0')
+        other = self.review('b', '3.0')
+        course = self.refresh()
+        self.assertEqual((course.review_count, course.rating_points_sum), (2, 14))
+        self.assertEqual((course.rating_40_count, course.rating_30_count), (1, 1))
+        self.assertEqual(course.average_rating, 3.5)
+
+        review.rating = '5.0'
+        review.save()
+        course = self.refresh()
+        self.assertEqual((course.rating_40_count, course.rating_50_count), (0, 1))
+        self.assertEqual(course.average_rating, 4.0)
+
+        other.delete()
+        self.assertEqual(self.refresh().review_count, 1)
+        self.assertEqual(find_counter_drift(), [])
+
+    def test_same_rating_as_string_does_not_move_buckets(self):
+        review = self.review('a', '3.0')
+        review = Review.objects.get(pk=review.pk)
+        review.rating = '3.0'
+        review.save()
+        course = self.refresh()
+        self.assertEqual((course.review_count, course.rating_30_count), (1, 1))
+        self.assertEqual(find_counter_drift(), [])
+
+    def test_rebuild_fixes_drift(self):
+        self.review('a', '4.5')
+        self.review('b', '2.0')
+        Course.objects.filter(pk=self.course.pk).update(rating_45_count=0, rating_points_sum=0, average_rating=0)
+        self.assertNotEqual(find_counter_drift(), [])
+        rebuild_rating_stats()
+        course = self.refresh()
+        self.assertEqual((course.rating_45_count, course.rating_20_count, course.rating_points_sum), (1, 1, 13))
+        self.assertEqual(course.average_rating, 3.25)
+        self.assertEqual(find_counter_drift(), [])
@@ -0,0 +1,41 @@
+from asgiref.sync import sync_to_async
+from django.test import TestCase
+
+from courses import cache, read_queries, view_counter
+from courses.models import Course, WishedCourses
+from courses.tests.utils import make_category, make_course, make_user
+
+
+class ReadQueriesTests(TestCase):
+
+    def setUp(self):
+        cache.course_records.clear()
+        cache.category_course_ids.clear()
+        view_counter.view_counts.flush()
+        self.user = make_user('tutee')
+        self.category = make_category()
+        tutor = make_user('tutor')
+        self.courses = [make_course(tutor, self.category, title=f'과외 {i}') for i in range(3)]
+        for course in self.courses[:2]:
+            WishedCourses.objects.create(user=self.user, course=course)
+
+    def test_course_detail_records_view(self):
+        read_queries.course_detail(self.courses[0].pk)
+        read_queries.course_detail(self.courses[0].pk)
+        self.assertEqual(view_counter.view_counts.pending, 2)
+        view_counter.view_counts.flush()
+        self.assertEqual(Course.objects.get(pk=self.courses[0].pk).view_count, 2)
+        with self.assertRaises(Course.DoesNotExist):
+            read_queries.course_detail(0)
+
+    async def test_async_matches_sync(self):
+        course_id = self.courses[0].pk
+        cases = [
+            (read_queries.acourse_detail, read_queries.course_detail, (course_id,), {}),
+            (read_queries.acategory_page, read_queries.category_page, (self.category.pk,), {'page_size': 2}),
+            (read_queries.awishlist_page, read_queries.wishlist_page, (self.user.pk,), {}),
+            (read_queries.aenrollments_page, read_queries.enrollments_page, (self.user.pk,), {}),
+        ]
+        for async_func, sync_func, args, kwargs in cases:
+            with self.subTest(sync_func.__name__):
+                self.assertEqual(await async_func(*args, **kwargs), await sync_to_async(sync_func)(*args, **kwargs))
@@ -0,0 +1,105 @@
+from datetime import timedelta
+
+import numpy as np
+from django.test import TestCase
+
+from courses.models import CourseCooccurrence, CourseRecommendation, Enrollment, RecommendationBuildState, WishedCourses
+from courses.recommendations import build_recommendations, get_recommendations
+from courses.tests.utils import END_DATE, START_DATE, make_category, make_course, make_user
+
+NO_LAG = timedelta(0)
+
+
+class RecommendationTests(TestCase):
+
+    def setUp(self):
+        tutor = make_user('tutor')
+        category = make_category()
+        self.courses = [make_course(tutor, category, title=f'과외 {i}') for i in range(5)]
+        self.users = [make_user(f'user{i}') for i in range(6)]
+
+    def enroll(self, user, course):
+        Enrollment.objects.create(user=user, course=course, start_date=START_DATE, end_date=END_DATE)
+
+    def wish(self, user, course):
+        WishedCourses.objects.create(user=user, course=course)
+
+    def seed_interactions(self):
+        c = self.courses
+        u = self.users
+        for user, course in [(u[0], c[0]), (u[0], c[1]), (u[1], c[0]), (u[1], c[2]), (u[2], c[1]), (u[2], c[2])]:
+            self.enroll(user, course)
+        for user, course in [(u[0], c[2]), (u[3], c[3]), (u[3], c[0])]:
+            self.wish(user, course)
+
+    def add_interactions(self):
+        c = self.courses
+        u = self.users
+        # 기존 유저의 새 상호작용과 새 유저의 상호작용
+        self.enroll(u[3], c[1])
+        self.wish(u[2], c[4])
+        self.enroll(u[4], c[4])
+        self.wish(u[4], c[0])
+
+    def snapshot(self):
+        rows = {
+            row.course_id: (dict(zip(np.frombuffer(row.other_ids, np.int64).tolist(),
+                                     np.frombuffer(row.weights, np.float64).tolist())), row.norm_sq)
+            for row in CourseCooccurrence.objects.all()
+        }
+        recommendations = {
+            course.pk: [recommended.pk for recommended in get_recommendations(course.pk)] for course in self.courses
+        }
+        return rows, recommendations
+
+    def test_incremental_matches_full_build(self):
+        self.seed_interactions()
+        build_recommendations(full=True, lag=NO_LAG)
+        self.add_interactions()
+        updated = build_recommendations(lag=NO_LAG)
+        incremental_rows, incremental_recommendations = self.snapshot()
+
+        build_recommendations(full=True, lag=NO_LAG)
+        full_rows, full_recommendations = self.snapshot()
+        self.assertEqual(incremental_rows, full_rows)
+        # 새 상호작용을 만든 유저들(0, 2, 3, 4번 과외를 가진)의 과외 행만 다시 계산됨
+        self.assertEqual(updated, 5)
+        self.assertEqual(incremental_recommendations, full_recommendations)
+
+    def test_incremental_reads_only_changed_users(self):
+        self.seed_interactions()
+        build_recommendations(full=True, lag=NO_LAG)
+        self.assertEqual(build_recommendations(lag=NO_LAG), 0)
+
+        self.wish(self.users[5], self.courses[3])
+        self.wish(self.users[5], self.courses[4])
+        self.assertEqual(build_recommendations(lag=NO_LAG), 2)
+        self.assertEqual(get_recommendations(self.courses[4].pk), [self.courses[3]])
+
+    def test_recent_rows_wait_for_watermark_lag(self):
+        self.seed_interactions()
+        build_recommendations(full=True, lag=NO_LAG)
+        state = RecommendationBuildState.load()
+        self.add_interactions()
+        # 기본 지연(5분)보다 최근에 생긴 행은 반영하지 않음
+        self.assertEqual(build_recommendations(), 0)
+        self.assertEqual(RecommendationBuildState.load().last_enrollment_id, state.last_enrollment_id)
+        self.assertEqual(build_recommendations(lag=NO_LAG), 5)
+
+    def test_first_incremental_run_builds_everything(self):
+        self.seed_interactions()
+        self.assertEqual(build_recommendations(lag=NO_LAG), 4)
+        self.assertEqual(CourseCooccurrence.objects.count(), 4)
+
+    def test_deleted_course_is_not_recommended(self):
+        self.seed_interactions()
+        build_recommendations(full=True, lag=NO_LAG)
+        deleted_id = self.courses[2].pk
+        self.courses[2].delete()
+        self.enroll(self.users[0], self.courses[3])
+        build_recommendations(lag=NO_LAG)
+        self.assertFalse(CourseRecommendation.objects.filter(recommended_course_id=deleted_id).exists())
+        # 다시 계산한 과외의 행에서도 삭제된 과외가 빠짐
+        for course in self.courses[:2]:
+            other_ids = np.frombuffer(CourseCooccurrence.objects.get(course=course).other_ids, np.int64)
+            self.assertNotIn(deleted_id, other_ids.tolist())
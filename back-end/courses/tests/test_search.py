@@ -0,0 +1,44 @@
+from django.test import TestCase
+
+from courses.models import Course
+from courses.search import rebuild_search_index, search_courses, tokenize
+from courses.tests.utils import make_category, make_course, make_user
+
+
+class SearchTests(TestCase):
+
+    def setUp(self):
+        tutor = make_user('tutor')
+        self.programming = make_category()
+        self.music = make_category('음악')
+        self.python = make_course(tutor, self.programming, title='파이썬 기초', description='처음 배우는 파이썬')
+        self.django = make_course(tutor, self.programming, title='Django 웹 개발', description='파이썬 웹 서버 만들기')
+        self.guitar = make_course(tutor, self.music, title='기타 초보 탈출', description='코드 잡는 법')
+
+    def test_tokenize(self):
+        self.assertEqual(tokenize('파이썬기초'), ['파이', '이썬', '썬기', '기초'])
+        self.assertIn('django', tokenize('Django 웹'))
+
+    def test_title_match_ranks_first(self):
+        results = search_courses('파이썬')
+        self.assertEqual([course.pk for course in results], [self.python.pk, self.django.pk])
+        self.assertGreater(results[0].search_rank, results[1].search_rank)
+
+    def test_ignores_particles_and_filters(self):
+        # "기타를"의 "타를"은 어느 과외에도 없으므로 무시됨
+        self.assertEqual([course.pk for course in search_courses('기타를')], [self.guitar.pk])
+        self.assertEqual(search_courses('파이썬', category=self.music.pk), [])
+        self.assertEqual(search_courses(''), [])
+
+    def test_index_follows_course_changes(self):
+        self.guitar.title = '우쿨렐레 입문'
+        self.guitar.curriculum = '우쿨렐레 입문 커리큘럼'
+        self.guitar.save()
+        self.assertEqual([course.pk for course in search_courses('우쿨렐레')], [self.guitar.pk])
+        self.assertEqual(search_courses('기타'), [])
+
+    def test_rebuild_after_bulk_update(self):
+        # QuerySet.update는 시그널이 없으므로 색인을 다시 만들어야 함
+        Course.objects.filter(pk=self.guitar.pk).update(title='드럼 입문')
+        rebuild_search_index()
+        self.assertEqual([course.pk for course in search_courses('드럼')], [self.guitar.pk])
@@ -0,0 +1,65 @@
+import contextlib
+import csv
+import io
+import os
+import tempfile
+
+from django.test import TestCase
+
+import seed_all_data
+from courses.models import Enrollment
+from courses.tests.utils import make_category, make_course, make_user
+
+
+class BulkSeedErrorTests(TestCase):
+
+    def setUp(self):
+        self.users = [make_user(f'user{i}') for i in range(4)]
+        self.course = make_course(make_user('tutor'), make_category())
+        self.id_sets = {'user': {user.pk for user in self.users}, 'category': set(), 'course': {self.course.pk}}
+
+    def write_csv(self, rows):
+        file = tempfile.NamedTemporaryFile('w', suffix='.csv', delete=False, newline='', encoding='utf-8')
+        with file:
+            writer = csv.DictWriter(file, fieldnames=['user', 'course', 'status', 'start_date', 'end_date'])
+            writer.writeheader()
+            writer.writerows(rows)
+        self.addCleanup(os.remove, file.name)
+        return file.name
+
+    def row(self, user, start_date='2025-03-01', end_date='2025-06-30', status='enrolled'):
+        return {'user': user.pk, 'course': self.course.pk, 'status': status,
+                'start_date': start_date, 'end_date': end_date}
+
+    def test_bad_enrollment_rows_are_reported_and_skipped(self):
+        path = self.write_csv([
+            self.row(self.users[0]),
+            self.row(self.users[1], start_date='2025-13-45'),
+            self.row(self.users[2], status='unknown'),
+            self.row(self.users[1]),
+            self.row(self.users[3], start_date='2025-07-01'),
+        ])
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            seed_all_data.bulk_seed_m2m(path, Enrollment, id_sets=self.id_sets, batch_size=10)
+
+        # 잘못된 행 뒤에 나온 같은 (유저, 과외)의 올바른 행은 저장됨
+        self.assertEqual(
+            set(Enrollment.objects.values_list('user_id', flat=True)), {self.users[0].pk, self.users[1].pk},
+        )
+        self.assertIn('2행 생성 실패: 날짜 형식 오류', output.getvalue())
+        self.assertIn('3행 생성 실패: status 값 오류', output.getvalue())
+        self.assertIn('5행 생성 실패: start_date가 end_date보다 늦음', output.getvalue())
+
+    def test_flush_batch_falls_back_to_rows_on_invalid_value(self):
+        objs = [
+            seed_all_data._with_row(1, Enrollment(user=self.users[0], course=self.course,
+                                                  start_date='2025-03-01', end_date='2025-06-30')),
+            seed_all_data._with_row(2, Enrollment(user=self.users[1], course=self.course,
+                                                  start_date='2025-13-45', end_date='2025-06-30')),
+        ]
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            inserted, failed = seed_all_data._flush_batch(Enrollment, objs, ignore_conflicts=True)
+        self.assertEqual((inserted, failed), (1, 1))
+        self.assertIn('Enrollment 2행 저장 실패', output.getvalue())
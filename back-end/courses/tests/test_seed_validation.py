@@ -0,0 +1,63 @@
+import contextlib
+import csv
+import io
+import os
+import tempfile
+
+from django.test import TestCase
+
+import seed_all_data
+from courses.models import Category
+from seed_validation import prevalidate, rejected_rows_by_file
+
+
+class PrevalidateTests(TestCase):
+
+    def write_csv(self, fieldnames, rows):
+        file = tempfile.NamedTemporaryFile('w', suffix='.csv', delete=False, newline='', encoding='utf-8')
+        with file:
+            writer = csv.writer(file)
+            writer.writerow(fieldnames)
+            writer.writerows(rows)
+        self.addCleanup(os.remove, file.name)
+        return file.name
+
+    def paths(self, categories, courses, course_fields=('id', 'tutor', 'category', 'max_tutees')):
+        return {
+            'users': self.write_csv(['username'], [['kim'], ['lee']]),
+            'categories': self.write_csv(['id', 'name'], categories),
+            'courses': self.write_csv(list(course_fields), courses),
+            'wished_courses': self.write_csv(['user', 'course'], [[1, 1]]),
+            'enrollment': self.write_csv(
+                ['user', 'course', 'status', 'start_date', 'end_date'],
+                [[2, 1, 'enrolled', '2025-03-01', '2025-06-30'], [1, 2, 'enrolled', '2025-03-01', '2025-06-30']],
+            ),
+        }
+
+    def reasons(self, report, file_name):
+        rows = report[report['file'] == file_name]
+        return dict(zip(rows['row'], rows['reason']))
+
+    def test_bad_category_ids_are_rejected_and_skipped(self):
+        paths = self.paths(
+            [[2, '음악'], ['x', '운동'], [2, '예술'], [3, '외국어']],
+            [[1, 1, 2, 5], [2, 2, 3, 5]],
+        )
+        report = prevalidate(paths)
+        self.assertEqual(self.reasons(report, 'categories'), {2: 'id 형식 오류', 3: 'id 중복'})
+        self.assertEqual(self.reasons(report, 'courses'), {})
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            seed_all_data.seed_categories(paths['categories'], rejected_rows_by_file(report)['categories'])
+        self.assertEqual(dict(Category.objects.values_list('id', 'name')), {1: '기타', 2: '음악', 3: '외국어'})
+
+    def test_courses_without_id_column(self):
+        paths = self.paths(
+            [[2, '음악']],
+            [[1, 2, 5], [9, 2, 5], [2, 2, 5]],
+            course_fields=('tutor', 'category', 'max_tutees'),
+        )
+        report = prevalidate(paths)
+        self.assertEqual(self.reasons(report, 'courses'), {2: '튜터 ID 9를 찾을 수 없음'})
+        # 거부되지 않은 과외는 1, 2번으로 가정되므로 수강 신청 행이 모두 통과함
+        self.assertEqual(self.reasons(report, 'enrollment'), {})
@@ -0,0 +1,52 @@
+from django.test import TestCase
+
+from courses.models import Enrollment, UserCourseStats, WishedCourses
+from courses.tests.utils import END_DATE, START_DATE, make_category, make_course, make_user
+from courses.user_stats import backfill_user_stats, find_user_stats_drift, get_profile_user
+
+
+class UserStatsTests(TestCase):
+
+    def setUp(self):
+        self.tutor = make_user('tutor')
+        self.tutee = make_user('tutee')
+        self.course = make_course(self.tutor, make_category())
+
+    def stats(self, user):
+        stats = UserCourseStats.objects.get(user=user)
+        return stats.created_courses_count, stats.attending_courses_count, stats.wished_courses_count
+
+    def test_signals_keep_counters(self):
+        enrollment = Enrollment.objects.create(
+            user=self.tutee, course=self.course, start_date=START_DATE, end_date=END_DATE,
+        )
+        WishedCourses.objects.create(user=self.tutee, course=self.course)
+        self.assertEqual(self.stats(self.tutee), (0, 1, 1))
+        self.assertEqual(self.stats(self.tutor), (1, 0, 0))
+
+        enrollment.delete()
+        self.course.delete()
+        self.assertEqual(self.stats(self.tutee), (0, 0, 0))
+        self.assertEqual(self.stats(self.tutor), (0, 0, 0))
+        self.assertEqual(find_user_stats_drift(), [])
+
+    def test_backfill_fixes_drift(self):
+        WishedCourses.objects.create(user=self.tutee, course=self.course)
+        UserCourseStats.objects.filter(user=self.tutee).update(wished_courses_count=7)
+        UserCourseStats.objects.filter(user=self.tutor).delete()
+        self.assertEqual(
+            sorted(find_user_stats_drift()),
+            sorted([
+                (self.tutor.pk, 'created_courses_count', None, 1),
+                (self.tutor.pk, 'attending_courses_count', None, 0),
+                (self.tutor.pk, 'wished_courses_count', None, 0),
+                (self.tutee.pk, 'wished_courses_count', 7, 1),
+            ]),
+        )
+        self.assertEqual(backfill_user_stats(batch_size=1), 2)
+        self.assertEqual(find_user_stats_drift(), [])
+
+    def test_profile_user_loads_counters_in_one_query(self):
+        with self.assertNumQueries(1):
+            user = get_profile_user(self.tutor.pk)
+            self.assertEqual(user.course_stats.created_courses_count, 1)
@@ -0,0 +1,64 @@
+from unittest import mock
+
+from django.db import DatabaseError
+from django.db.models import QuerySet
+from django.test import TestCase
+
+from courses.models import Course
+from courses.tests.utils import make_category, make_course, make_user
+from courses.view_counter import ViewCountBuffer
+
+
+class ViewCountBufferTests(TestCase):
+
+    def setUp(self):
+        tutor = make_user('tutor')
+        category = make_category()
+        self.courses = [make_course(tutor, category, title=f'과외 {i}') for i in range(3)]
+        # 자동 flush가 일어나지 않도록 주기/기준을 크게 둠
+        self.buffer = ViewCountBuffer(flush_interval=3600, flush_threshold=10 ** 6, batch_size=1)
+
+    def view_counts(self):
+        return list(Course.objects.order_by('pk').values_list('view_count', flat=True))
+
+    def test_flush_adds_increments(self):
+        for course, n in zip(self.courses, [3, 1, 2]):
+            self.buffer.increment(course.pk, n)
+        self.assertEqual(self.buffer.pending, 6)
+        self.assertEqual(self.buffer.flush(), 6)
+        self.assertEqual(self.buffer.pending, 0)
+        self.buffer.increment(self.courses[0].pk)
+        self.buffer.flush()
+        self.assertEqual(self.view_counts(), [4, 1, 2])
+
+    def test_threshold_triggers_flush(self):
+        buffer = ViewCountBuffer(flush_interval=3600, flush_threshold=2)
+        buffer.increment(self.courses[0].pk)
+        self.assertEqual(self.view_counts()[0], 0)
+        buffer.increment(self.courses[0].pk)
+        self.assertEqual(buffer.pending, 0)
+        self.assertEqual(self.view_counts()[0], 2)
+
+    def test_failed_flush_is_not_counted_twice(self):
+        for course in self.courses:
+            self.buffer.increment(course.pk, 5)
+
+        real_update = QuerySet.update
+        calls = []
+
+        def update_then_fail(queryset, **kwargs):
+            # 첫 묶음은 반영하고 두 번째 묶음에서 실패
+            calls.append(kwargs)
+            if len(calls) == 2:
+                raise DatabaseError('연결 끊김')
+            return real_update(queryset, **kwargs)
+
+        with mock.patch.object(QuerySet, 'update', update_then_fail):
+            with self.assertRaises(DatabaseError):
+                self.buffer.flush()
+        # 실패한 flush의 증가분은 하나도 반영되지 않고 전부 버퍼에 되돌려짐
+        self.assertEqual(self.view_counts(), [0, 0, 0])
+        self.assertEqual(self.buffer.pending, 15)
+
+        self.buffer.flush()
+        self.assertEqual(self.view_counts(), [5, 5, 5])
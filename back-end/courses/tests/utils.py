@@ -0,0 +1,29 @@
+'''테스트용 데이터 생성 함수'''
+import datetime
+
+from accounts.models import User
+from courses.models import Category, Course
+
+START_DATE = datetime.date(2025, 3, 1)
+END_DATE = datetime.date(2025, 6, 30)
+
+
+def make_user(username, **fields):
+    return User.objects.create_user(username=username, password='password', name=username[:10], **fields)
+
+
+def make_category(name='프로그래밍'):
+    return Category.objects.create(name=name)
+
+
+def make_course(tutor, category, title='파이썬 기초', max_tutees=10, **fields):
+    return Course.objects.create(
+        tutor=tutor,
+        category=category,
+        title=title,
+        thumbnail_image_url='https://example.com/thumbnail.png',
+        description=fields.pop('description', f'{title} 소개'),
+        curriculum=fields.pop('curriculum', f'{title} 커리큘럼'),
+        max_tutees=max_tutees,
+        **fields,
+    )
@@ -0,0 +1,105 @@
+'''
+유저별 대시보드 카운터(UserCourseStats) 관리
+
+- 증분 갱신: 과외 개설, 수강 신청, 찜이 생성/삭제될 때 시그널에서 F() 식으로 갱신 (courses/signals.py)
+- 일괄 채우기: backfill_user_stats() - GROUP BY 집계 3번 + upsert 1번을 유저 배치마다 실행
+- 정합성 검사: find_user_stats_drift()
+'''
+from django.db.models import Count, F
+
+from accounts.models import User
+from courses.models import Course, Enrollment, UserCourseStats, WishedCourses
+
+USER_STAT_FIELDS = ['created_courses_count', 'attending_courses_count', 'wished_courses_count']
+
+
+def get_profile_user(user_id):
+    '''프로필 페이지용 - 유저와 카운터를 한 번에 조회합니다.'''
+    return User.objects.select_related('course_stats').get(pk=user_id)
+
+
+def _count_by(model, field, user_ids):
+    rows = (
+        model.objects.filter(**{f'{field}__in': user_ids})
+        .values(field)
+        .annotate(n=Count('id'))
+        .values_list(field, 'n')
+    )
+    return dict(rows)
+
+
+def aggregate_user_stats(user_ids):
+    '''유저 ID 목록에 대해 실제 테이블에서 집계한 카운터를 {user_id: {field: value}}로 반환합니다.'''
+    created = _count_by(Course, 'tutor_id', user_ids)
+    attending = _count_by(Enrollment, 'user_id', user_ids)
+    wished = _count_by(WishedCourses, 'user_id', user_ids)
+    return {
+        user_id: {
+            'created_courses_count': created.get(user_id, 0),
+            'attending_courses_count': attending.get(user_id, 0),
+            'wished_courses_count': wished.get(user_id, 0),
+        }
+        for user_id in user_ids
+    }
+
+
+def _save_user_stats(user_ids):
+    stats = aggregate_user_stats(user_ids)
+    UserCourseStats.objects.bulk_create(
+        [UserCourseStats(user_id=user_id, **fields) for user_id, fields in stats.items()],
+        update_conflicts=True,
+        unique_fields=['user'],
+        update_fields=USER_STAT_FIELDS,
+    )
+
+
+def bump_user_stat(user_id, field, delta):
+    '''카운터 하나를 delta만큼 증감합니다. 카운터 행이 아직 없으면 실제 값으로 새로 만듭니다.'''
+    updated = UserCourseStats.objects.filter(user_id=user_id).update(**{field: F(field) + delta})
+    # 삭제(delta < 0) 중에는 행을 만들지 않음 - 유저 자체가 CASCADE로 삭제되는 중일 수 있음
+    if not updated and delta > 0:
+        _save_user_stats([user_id])
+
+
+def _iter_user_id_batches(batch_size):
+    last_id = 0
+    while True:
+        ids = list(User.objects.filter(pk__gt=last_id).order_by('pk').values_list('pk', flat=True)[:batch_size])
+        if not ids:
+            return
+        yield ids
+        last_id = ids[-1]
+
+
+def backfill_user_stats(batch_size=1000, user_ids=None):
+    '''모든 유저(또는 user_ids)의 카운터를 실제 값으로 다시 채우고, 처리한 유저 수를 반환합니다.'''
+    if user_ids is not None:
+        # 그 사이에 삭제된 유저는 제외
+        user_ids = sorted(User.objects.filter(pk__in=list(user_ids)).values_list('pk', flat=True))
+        batches = (user_ids[start:start + batch_size] for start in range(0, len(user_ids), batch_size))
+    else:
+        batches = _iter_user_id_batches(batch_size)
+
+    count = 0
+    for ids in batches:
+        _save_user_stats(ids)
+        count += len(ids)
+    return count
+
+
+def find_user_stats_drift(batch_size=1000):
+    '''
+    저장된 카운터와 실제 값이 다른 유저를 찾습니다. 카운터 행이 없는 유저는 저장값을 None으로 봅니다.
+    (user_id, 필드명, 저장된 값, 실제 값) 목록을 반환합니다.
+    '''
+    drift = []
+    for ids in _iter_user_id_batches(batch_size):
+        actual = aggregate_user_stats(ids)
+        stored = {row['user_id']: row for row in UserCourseStats.objects.filter(user_id__in=ids).values('user_id', *USER_STAT_FIELDS)}
+        for user_id in ids:
+            row = stored.get(user_id)
+            for field in USER_STAT_FIELDS:
+                value = row[field] if row else None
+                if value != actual[user_id][field]:
+                    drift.append((user_id, field, value, actual[user_id][field]))
+    return drift
@@ -0,0 +1,142 @@
+'''
+과외 조회수(view_count) 버퍼
+
+상세 페이지를 볼 때마다 과외 행을 UPDATE 하면 인기 과외에 쓰기 잠금이 몰립니다.
+(SQLite는 DB 전체에 쓰기 잠금이 하나뿐이라 더 심함)
+조회수 증가분은 프로세스 메모리에 과외 ID별로 모아 두었다가, 일정 시간이 지나거나
+증가분이 일정 개수를 넘으면 UPDATE ... CASE 한 번으로 한꺼번에 반영합니다.
+
+    from courses.view_counter import record_view
+    record_view(course.id)
+
+설정 (settings.py, 선택)
+    VIEW_COUNT_FLUSH_INTERVAL = 10    # 초
+    VIEW_COUNT_FLUSH_THRESHOLD = 1000 # 모인 증가분 합계
+
+⭐️ 참고: 버퍼는 프로세스마다 따로 존재하므로, 반영되기 전의 증가분은 DB의 view_count에 보이지 않습니다.
+반영에 실패한 증가분은 버퍼에 되돌려 다음 flush에 다시 반영하고, 오류는 'courses.view_counter' 로거에 남깁니다.
+'''
+import atexit
+import logging
+import threading
+import time
+from collections import Counter
+
+from django.conf import settings
+from django.db import close_old_connections, transaction
+from django.db.models import Case, F, IntegerField, Value, When
+
+from courses.models import Course
+
+logger = logging.getLogger(__name__)
+
+
+class ViewCountBuffer:
+
+    def __init__(self, flush_interval=None, flush_threshold=None, batch_size=500):
+        if flush_interval is None:
+            flush_interval = getattr(settings, 'VIEW_COUNT_FLUSH_INTERVAL', 10)
+        if flush_threshold is None:
+            flush_threshold = getattr(settings, 'VIEW_COUNT_FLUSH_THRESHOLD', 1000)
+        self.flush_interval = flush_interval
+        self.flush_threshold = flush_threshold
+        self.batch_size = batch_size
+
+        self._lock = threading.Lock()
+        self._counts = Counter()
+        self._pending = 0
+        self._last_flush = time.monotonic()
+        self._stop = None
+
+    @property
+    def pending(self):
+        return self._pending
+
+    def increment(self, course_id, n=1):
+        with self._lock:
+            self._counts[course_id] += n
+            self._pending += n
+            due = (
+                self._pending >= self.flush_threshold or
+                time.monotonic() - self._last_flush >= self.flush_interval
+            )
+        if due:
+            try:
+                self.flush()
+            except Exception:
+                # 조회수 반영 실패로 상세 페이지 요청이 실패하지 않게 함 (증가분은 버퍼에 되돌려져 있음)
+                logger.exception('조회수 반영에 실패했습니다. (대기 중인 증가분 %d)', self._pending)
+
+    def flush(self):
+        '''모아 둔 증가분을 DB에 반영하고, 반영한 증가분 합계를 반환합니다.'''
+        # 버퍼를 통째로 바꿔치기한 뒤 잠금 밖에서 쓰므로, 쓰는 동안에도 increment는 막히지 않습니다.
+        with self._lock:
+            counts, self._counts = self._counts, Counter()
+            self._pending = 0
+            self._last_flush = time.monotonic()
+        if not counts:
+            return 0
+
+        try:
+            self._write(counts)
+        except Exception:
+            # 실패한 증가분은 버퍼에 되돌려서 다음 flush에 다시 반영합니다. (조회수 유실 방지)
+            with self._lock:
+                self._counts.update(counts)
+                self._pending += sum(counts.values())
+            raise
+        return sum(counts.values())
+
+    def _write(self, counts):
+        course_ids = sorted(counts)
+        # 실패하면 flush가 counts 전체를 버퍼에 되돌리므로, 앞 묶음만 반영되어 두 번 세는 일이 없도록 한 트랜잭션으로 씀
+        with transaction.atomic():
+            for start in range(0, len(course_ids), self.batch_size):
+                chunk = course_ids[start:start + self.batch_size]
+                # UPDATE ... SET view_count = view_count + CASE id WHEN 1 THEN 3 WHEN 2 THEN 5 ... END
+                increment = Case(
+                    *[When(pk=course_id, then=Value(counts[course_id])) for course_id in chunk],
+                    default=Value(0),
+                    output_field=IntegerField(),
+                )
+                Course.objects.filter(pk__in=chunk).update(view_count=F('view_count') + increment)
+
+    def start(self):
+        '''flush_interval마다 flush 하는 백그라운드 스레드를 시작합니다.'''
+        if self._stop is not None:
+            return
+        self._stop = threading.Event()
+        thread = threading.Thread(target=self._run, name='view-count-flush', daemon=True)
+        thread.start()
+
+    def stop(self):
+        if self._stop is not None:
+            self._stop.set()
+            self._stop = None
+
+    def _run(self):
+        stop = self._stop
+        while not stop.wait(self.flush_interval):
+            try:
+                self.flush()
+            except Exception:
+                # 실패한 증가분은 버퍼에 되돌려져 있으므로 다음 주기에 다시 시도합니다.
+                logger.exception('조회수 반영에 실패했습니다. (대기 중인 증가분 %d)', self._pending)
+            finally:
+                close_old_connections()
+
+
+view_counts = ViewCountBuffer()
+
+
+def record_view(course_id):
+    view_counts.increment(course_id)
+
+
+# 프로세스가 정상 종료될 때 남은 증가분을 반영함
+@atexit.register
+def _flush_on_exit():
+    try:
+        view_counts.flush()
+    except Exception:
+        logger.exception('종료 시 조회수 반영에 실패했습니다. 조회수 증가분 %d이 반영되지 않았습니다.', view_counts.pending)
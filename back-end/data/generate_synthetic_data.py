@@ -0,0 +1,253 @@
+"""
+부하 테스트용 대용량 합성 데이터 생성기
+
+users / categories / courses / wished_courses / enrollment / reviews CSV(또는 Parquet)를
+seed_all_data.py가 읽는 컬럼 형식 그대로 생성합니다.
+행마다 random.choice를 호출하지 않고 NumPy로 chunk 단위 벡터 샘플링을 하며,
+chunk마다 바로 파일에 이어 쓰므로 수백만 행도 메모리 사용량이 일정합니다.
+
+- 이름: convert_name_to_korean.py의 성/이름 음절 목록
+- 강의명/카테고리: convert_title_to_korean.py의 korean_titles_with_categories
+- 과외 인기도: Zipf 분포 (--zipf 값이 클수록 소수 과외에 수강/찜이 몰림)
+- 같은 --seed면 항상 같은 데이터가 생성됩니다.
+
+    $ cd back-end/data
+    $ python generate_synthetic_data.py --users 1000000 --courses 50000 --out synthetic
+    $ python generate_synthetic_data.py --users 100000 --format parquet --out synthetic
+
+⭐️ 참고: 유저 ID는 users 파일의 행 순서(1부터)를 가정합니다. 빈 DB에 시딩해야 ID가 맞습니다.
+"""
+import argparse
+import os
+
+import numpy as np
+import pandas as pd
+
+from convert_name_to_korean import GIVEN_NAME_SYLLABLES, SURNAMES
+from convert_title_to_korean import korean_titles_with_categories
+
+# --- 설정 ---
+CATEGORIES = [(1, '음악'), (2, '운동'), (3, '예술'), (4, '프로그래밍'), (5, '금융/재테크'), (6, '외국어'), (7, '기타')]
+
+# origin_users.csv에 있는 bcrypt 해시 (seed_all_data.py --fast-users로 해시 재계산 없이 저장됨)
+PASSWORD_HASH = '$2a$04$dq62bqv961FI9JnA/14YReEjH2HiSIcmw4N7vBVhw7wpRTUNhy4ui'
+
+BIOS = ['Yodo', 'Bubbletube', 'Zoomzone', 'Skinix', 'Quatz', 'Jabbersphere', 'Feedfire', 'Twinte']
+
+# 0.5 ~ 5.0점, 높은 점수가 더 자주 나오도록 가중치를 줌
+RATINGS = np.arange(1, 11) / 2
+RATING_WEIGHTS = np.array([1, 1, 2, 2, 4, 6, 10, 16, 20, 18], dtype=float)
+RATING_WEIGHTS /= RATING_WEIGHTS.sum()
+
+REVIEW_COMMENTS = ['좋아요', '설명이 친절해요', '많이 배웠습니다', '추천합니다', '보통이에요', '']
+
+# 수강 기간 기준일 - 종료일이 기준일 이전이면 completed
+REFERENCE_DATE = np.datetime64('2025-11-16')
+# --- 설정 끝 ---
+
+
+class ChunkWriter:
+    """DataFrame chunk를 CSV 또는 Parquet 파일 하나에 이어 씁니다."""
+
+    def __init__(self, out_dir, name, file_format):
+        self.file_format = file_format
+        self.path = os.path.join(out_dir, f'{name}.{file_format}')
+        self.rows = 0
+        self._parquet_writer = None
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+    def write(self, df):
+        if self.file_format == 'csv':
+            df.to_csv(self.path, mode='a', header=self.rows == 0, index=False, encoding='utf-8')
+        else:
+            # Parquet은 선택 의존성 (pyarrow)
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+
+            table = pa.Table.from_pandas(df, preserve_index=False)
+            if self._parquet_writer is None:
+                self._parquet_writer = pq.ParquetWriter(self.path, table.schema)
+            self._parquet_writer.write_table(table)
+        self.rows += len(df)
+
+    def close(self):
+        if self._parquet_writer is not None:
+            self._parquet_writer.close()
+        print(f"'{self.path}'에 {self.rows}행 저장")
+
+
+def chunk_ranges(total, chunk_size):
+    for start in range(0, total, chunk_size):
+        yield start, min(start + chunk_size, total)
+
+
+def load_text_pool(column, fallback):
+    """기존 courses.csv의 소개/커리큘럼 문장을 재사용합니다."""
+    try:
+        return pd.read_csv('courses.csv', usecols=[column])[column].dropna().to_numpy(dtype=object)
+    except (FileNotFoundError, ValueError):
+        return np.array([fallback], dtype=object)
+
+
+def zipf_probabilities(rng, n, exponent):
+    """n개 항목의 Zipf 확률. 순위는 무작위로 섞어서 ID와 인기도가 상관없도록 합니다."""
+    weights = 1.0 / np.arange(1, n + 1) ** exponent
+    rng.shuffle(weights)
+    return weights / weights.sum()
+
+
+def generate_users(rng, writer, n_users, chunk_size):
+    surnames = np.array(SURNAMES)
+    syllables = np.array(GIVEN_NAME_SYLLABLES)
+    bios = np.array(BIOS)
+    for start, end in chunk_ranges(n_users, chunk_size):
+        size = end - start
+        index = np.arange(start, end).astype(str)
+        names = np.char.add(
+            np.char.add(rng.choice(surnames, size), rng.choice(syllables, size)),
+            rng.choice(syllables, size),
+        )
+        middle = np.char.zfill(rng.integers(0, 10000, size).astype(str), 4)
+        last = np.char.zfill(rng.integers(0, 10000, size).astype(str), 4)
+        writer.write(pd.DataFrame({
+            'username': np.char.add('user', index),
+            'email': np.char.add(np.char.add('user', index), '@example.com'),
+            'password': PASSWORD_HASH,
+            'name': names,
+            'phone': np.char.add(np.char.add(np.char.add('010-', middle), '-'), last),
+            'bio': rng.choice(bios, size),
+            'profile_image': 'http://dummyimage.com/140x100.png/5fa2dd/ffffff',
+        }))
+
+
+def generate_pairs(rng, writer, n_users, course_probs, mean_per_user, chunk_size, make_frame, next_id):
+    """
+    유저 chunk마다 (user, course) 쌍을 샘플링해서 씁니다.
+    유저 범위가 chunk끼리 겹치지 않으므로 chunk 안에서만 중복을 제거하면 전체에서 중복이 없습니다.
+    과외별 쌍의 개수를 반환합니다.
+    """
+    n_courses = len(course_probs)
+    counts = np.zeros(n_courses + 1, dtype=np.int64)
+    for start, end in chunk_ranges(n_users, chunk_size):
+        per_user = rng.poisson(mean_per_user, end - start)
+        users = np.repeat(np.arange(start + 1, end + 1), per_user)
+        courses = rng.choice(n_courses, size=len(users), p=course_probs) + 1
+
+        keys = np.unique(users.astype(np.int64) * (n_courses + 1) + courses)
+        users, courses = keys // (n_courses + 1), keys % (n_courses + 1)
+        if not len(keys):
+            continue
+
+        ids = np.arange(next_id, next_id + len(keys))
+        next_id += len(keys)
+        counts += np.bincount(courses, minlength=n_courses + 1)
+        writer.write(make_frame(ids, users, courses))
+    return counts
+
+
+def generate_courses(rng, writer, n_courses, n_users, enrolled_counts, chunk_size):
+    titles = np.array([title for title, _ in korean_titles_with_categories])
+    title_categories = np.array([category for _, category in korean_titles_with_categories])
+    descriptions = load_text_pool('description', '과외 소개')
+    curriculums = load_text_pool('curriculum', '커리큘럼')
+    for start, end in chunk_ranges(n_courses, chunk_size):
+        size = end - start
+        picked = rng.integers(0, len(titles), size)
+        # 정원은 실제 수강 인원보다 작지 않게 잡아서 정원 초과 데이터가 생기지 않도록 함
+        max_tutees = np.maximum(rng.integers(5, 31, size), enrolled_counts[start + 1:end + 1])
+        writer.write(pd.DataFrame({
+            'id': np.arange(start + 1, end + 1),
+            'title': titles[picked],
+            'thumbnail': 'http://dummyimage.com/221x161.png/5fa2dd/ffffff',
+            'description': rng.choice(descriptions, size),
+            'curriculum': rng.choice(curriculums, size),
+            'max_tutees': max_tutees,
+            'category': title_categories[picked],
+            'tutor': rng.integers(1, n_users + 1, size),
+        }))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='부하 테스트용 합성 데이터를 생성합니다.')
+    parser.add_argument('--users', type=int, default=100_000)
+    parser.add_argument('--courses', type=int, default=5_000)
+    parser.add_argument('--enrollments-per-user', type=float, default=3.0, help='유저당 평균 수강 수')
+    parser.add_argument('--wishes-per-user', type=float, default=5.0, help='유저당 평균 찜 수')
+    parser.add_argument('--review-ratio', type=float, default=0.3, help='수강 완료 건 중 리뷰를 남기는 비율')
+    parser.add_argument('--zipf', type=float, default=1.1, help='과외 인기도 Zipf 지수 (0이면 균등)')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--chunk-size', type=int, default=100_000)
+    parser.add_argument('--format', choices=['csv', 'parquet'], default='csv')
+    parser.add_argument('--out', default='synthetic', help='출력 폴더')
+    args = parser.parse_args()
+
+    os.makedirs(args.out, exist_ok=True)
+    rng = np.random.default_rng(args.seed)
+
+    def writer(name):
+        return ChunkWriter(args.out, name, args.format)
+
+    categories = writer('categories')
+    categories.write(pd.DataFrame(CATEGORIES, columns=['id', 'name']))
+    categories.close()
+
+    users = writer('users')
+    generate_users(rng, users, args.users, args.chunk_size)
+    users.close()
+
+    course_probs = zipf_probabilities(rng, args.courses, args.zipf)
+    comments = np.array(REVIEW_COMMENTS)
+    enrollment = writer('enrollment')
+    reviews = writer('reviews')
+    next_review_id = [1]
+
+    def enrollment_frame(ids, user_ids, course_ids):
+        size = len(ids)
+        start_date = REFERENCE_DATE - rng.integers(0, 365, size).astype('timedelta64[D]')
+        end_date = start_date + rng.integers(14, 121, size).astype('timedelta64[D]')
+        completed = end_date < REFERENCE_DATE
+
+        # 리뷰는 수강 완료 건 중 일부에만 작성
+        reviewed = completed & (rng.random(size) < args.review_ratio)
+        review_count = int(reviewed.sum())
+        if review_count:
+            reviews.write(pd.DataFrame({
+                'id': np.arange(next_review_id[0], next_review_id[0] + review_count),
+                'enrollment': ids[reviewed],
+                'rating': rng.choice(RATINGS, review_count, p=RATING_WEIGHTS),
+                'comment': rng.choice(comments, review_count),
+            }))
+            next_review_id[0] += review_count
+
+        return pd.DataFrame({
+            'id': ids,
+            'user': user_ids,
+            'course': course_ids,
+            'status': np.where(completed, 'completed', 'enrolled'),
+            'start_date': start_date.astype(str),
+            'end_date': end_date.astype(str),
+        })
+
+    enrolled_counts = generate_pairs(
+        rng, enrollment, args.users, course_probs, args.enrollments_per_user, args.chunk_size,
+        enrollment_frame, next_id=1,
+    )
+    enrollment.close()
+    reviews.close()
+
+    wished = writer('wished_courses')
+    generate_pairs(
+        rng, wished, args.users, course_probs, args.wishes_per_user, args.chunk_size,
+        lambda ids, user_ids, course_ids: pd.DataFrame({'id': ids, 'user': user_ids, 'course': course_ids}),
+        next_id=1,
+    )
+    wished.close()
+
+    courses = writer('courses')
+    generate_courses(rng, courses, args.courses, args.users, enrolled_counts, args.chunk_size)
+    courses.close()
+
+
+if __name__ == '__main__':
+    main()
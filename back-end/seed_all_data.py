@@ -1,8 +1,15 @@
 import os
+import re
+import sqlite3
 import django
 import csv
-from django.db import IntegrityError
-from datetime import datetime
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+from django.apps import apps
+from django.core.management.color import no_style
+from django.core.exceptions import ValidationError
+from django.db import DataError, IntegrityError, connection, transaction
+from datetime import datetime, timedelta
 
 # 1. Django 환경 설정
 # ---------------------------------------------------------------------
@@ -15,7 +22,17 @@ django.setup()
 # 2. Django 환경이 로드된 *후에* 모델을 임포트합니다.
 from accounts.models import User
 from courses.models import Course, Category, WishedCourses, Enrollment
-from django.db.models import Avg
+from courses.models import SeedCheckpoint as CheckpointModel
+from courses.cached_fields import recompute_cached_fields
+from courses.signals import deferred_counter_updates
+from courses.search import rebuild_search_index
+from courses.category_stats import refresh_category_stats
+from courses.activity_rollups import backfill_activity_rollups
+from courses.user_stats import backfill_user_stats
+from courses import instrumentation
+from courses.instrumentation import count_rows, instrumented
+from django.db.models import Avg, Max
+from django.contrib.auth.hashers import make_password
 
 # --- CSV 파일 경로 정의 ---
 # (파일이 manage.py와 같은 위치에 있다면 "users.csv"로 수정)
@@ -29,6 +46,15 @@ WISHED_CSV_PATH = os.path.join(DATA_DIR, 'wished_courses.csv')
 ENROLLMENT_CSV_PATH = os.path.join(DATA_DIR, 'enrollment.csv')
 # REVIEWS_CSV_PATH = os.path.join(DATA_DIR, 'reviews.csv') # (필요시 리뷰도 추가)
 
+# 벌크 모드에서 한 번에 insert 하는 행 수 (배치 하나 = 트랜잭션 하나)
+DEFAULT_BATCH_SIZE = 1000
+
+# 사전 검증에서 거부된 행 목록을 저장하는 파일
+REJECTED_REPORT_PATH = os.path.join(BASE_DIR, 'seed_rejected_rows.csv')
+
+# origin_users.csv 등에 들어있는 bcrypt 해시 ($2a$, $2b$, $2y$)
+BCRYPT_HASH_RE = re.compile(r'^\$2[aby]\$\d{2}\$[./A-Za-z0-9]{53}$')
+
 
 def print_success(message):
     print(f"✅ \033[92m{message}\033[0m") # 초록색
@@ -39,25 +65,117 @@ def print_error(message):
 def print_warning(message):
     print(f"⚠️ \033[93m{message}\033[0m") # 노란색
 
+@instrumented('clear_data')
 def clear_data():
     """기존 데이터를 모두 삭제합니다."""
     print("기존 데이터 삭제 중...")
     # 순서 중요: M2M -> Course -> User/Category
-    Enrollment.objects.all().delete()
-    WishedCourses.objects.all().delete()
-    # Review.objects.all().delete() # (리뷰가 있다면)
-    Course.objects.all().delete()
+    # 삭제 시그널마다 과외 카운터를 갱신하지 않도록 증분 갱신을 미뤄둡니다. (과외도 곧 삭제됨)
+    with deferred_counter_updates():
+        Enrollment.objects.all().delete()
+        WishedCourses.objects.all().delete()
+        # Review.objects.all().delete() # (리뷰가 있다면)
+        Course.objects.all().delete()
     User.objects.all().delete()
     Category.objects.all().delete()
     print_success("모든 데이터 삭제 완료.")
 
 
+
+# --- 빠른 초기화 / 스냅샷 ---
+# clear_data()의 QuerySet.delete()는 CASCADE와 시그널을 흉내 내기 위해 연관 객체를 모두 파이썬으로
+# 모으므로 큰 DB에서는 몇 분이 걸리고 메모리도 많이 씁니다.
+# fast_clear_data()는 앱 테이블을 DELETE/TRUNCATE 문으로 한 번에 비우고 ID 시퀀스도 초기화합니다.
+# (SQLite: DELETE + sqlite_sequence 초기화, PostgreSQL: TRUNCATE ... RESTART IDENTITY)
+
+SEED_APPS = ['accounts', 'courses', 'reviews']
+
+
+def seed_tables():
+    """시드 대상 앱의 테이블(자동 생성 M2M 테이블 포함)을 참조하는 쪽부터 순서대로 반환합니다."""
+    # 참조하는 쪽(자식) -> 참조되는 쪽(부모) 순서. 목록에 없는 테이블은 맨 앞에 둡니다.
+    ordered = [Enrollment, WishedCourses, Course, User, Category]
+    ordered_tables = [model._meta.db_table for model in ordered]
+    existing = set(connection.introspection.table_names())
+
+    tables = []
+    for app_label in SEED_APPS:
+        for model in apps.get_app_config(app_label).get_models(include_auto_created=True):
+            table = model._meta.db_table
+            if table not in ordered_tables and table in existing:
+                tables.append(table)
+    # 유저를 참조하는 admin 로그도 함께 비워야 외래 키 오류가 나지 않음
+    if 'django_admin_log' in existing:
+        tables.append('django_admin_log')
+    return tables + [table for table in ordered_tables if table in existing]
+
+
+@instrumented('fast_clear_data')
+def fast_clear_data():
+    """앱 테이블을 ORM 없이 한 번에 비우고 ID 시퀀스를 초기화합니다. (시그널은 실행되지 않음)"""
+    print("기존 데이터 빠른 삭제 중...")
+    tables = seed_tables()
+    sql_list = connection.ops.sql_flush(
+        no_style(),
+        tables,
+        reset_sequences=True,
+        # PostgreSQL TRUNCATE는 다른 앱의 테이블이 참조하고 있으면 CASCADE가 필요함
+        allow_cascade=connection.vendor == 'postgresql',
+    )
+    connection.ops.execute_sql_flush(sql_list)
+    clear_process_caches()
+    print_success(f"테이블 {len(tables)}개 삭제 완료. (ID 시퀀스 초기화)")
+
+
+def clear_process_caches():
+    # DB를 직접 바꿨으므로 프로세스 메모리의 과외 캐시를 비움
+    from courses import cache
+    cache.course_records.clear()
+    cache.category_course_ids.clear()
+
+
+def snapshot_database(path):
+    """현재 SQLite DB를 파일로 복사합니다. (테스트 fixture용)"""
+    if connection.vendor != 'sqlite':
+        print_error(f"스냅샷은 SQLite에서만 지원합니다. (현재: {connection.vendor})")
+        return False
+    connection.ensure_connection()
+    target = sqlite3.connect(path)
+    try:
+        connection.connection.backup(target)
+    finally:
+        target.close()
+    print_success(f"DB 스냅샷 저장 완료: {path}")
+    return True
+
+
+def restore_database(path):
+    """스냅샷 파일의 내용으로 현재 SQLite DB를 통째로 덮어씁니다."""
+    if connection.vendor != 'sqlite':
+        print_error(f"스냅샷 복원은 SQLite에서만 지원합니다. (현재: {connection.vendor})")
+        return False
+    if not os.path.exists(path):
+        print_error(f"스냅샷 파일 '{path}'를 찾을 수 없습니다.")
+        return False
+    connection.ensure_connection()
+    source = sqlite3.connect(path)
+    try:
+        source.backup(connection.connection)
+    finally:
+        source.close()
+    clear_process_caches()
+    print_success(f"DB 스냅샷 복원 완료: {path}")
+    return True
+
+
+@instrumented('seed_users')
 def seed_users(file_path):
     """users.csv 파일에서 유저 데이터를 생성합니다."""
     print("\n유저 생성 시작...")
     with open(file_path, mode='r', encoding='utf-8') as file:
         reader = csv.DictReader(file)
         for row in reader:
+            count_rows()
             try:
                 # create_user를 사용해야 비밀번호가 암호화됩니다.
                 User.objects.create_user(
@@ -78,15 +196,84 @@ def seed_users(file_path):
     print_success("유저 생성 완료.")
 
 
-def seed_categories(file_path):
-    """categories.csv 파일에서 카테고리 데이터를 생성합니다."""
+# --- 유저 대량 import ---
+# create_user는 행마다 PBKDF2 해시를 계산하므로 대량 import 시 CPU 하나에 병목이 생깁니다.
+# 이미 bcrypt로 해시된 비밀번호는 Django의 bcrypt 형식('bcrypt$<해시>')으로 그대로 저장하고,
+# 평문 비밀번호만 프로세스 풀에서 병렬로 해시합니다.
+# ⭐️ 참고: 'bcrypt$' 형식을 로그인에 사용하려면 settings.PASSWORD_HASHERS에
+#    'django.contrib.auth.hashers.BCryptPasswordHasher'가 포함되어 있어야 합니다.
+
+def to_django_password(raw_password):
+    """bcrypt 해시는 Django 형식으로 감싸고, 평문이면 None을 반환합니다."""
+    if BCRYPT_HASH_RE.match(raw_password):
+        return f'bcrypt${raw_password}'
+    return None
+
+
+def _hash_password(raw_password):
+    # 프로세스 풀 워커에서 실행됩니다. (pickle 가능하도록 모듈 최상위에 정의)
+    return make_password(raw_password)
+
+
+@instrumented('bulk_seed_users')
+def bulk_seed_users(file_path, batch_size=DEFAULT_BATCH_SIZE, workers=None, checkpoint=None, skip_rows=None):
+    """users.csv 파일에서 유저 데이터를 해시 재계산 없이 대량 생성합니다."""
+    print("\n유저 벌크 생성 시작...")
+    chunksize = max(1, batch_size // ((workers or os.cpu_count() or 1) * 4))
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        def build_batch(rows):
+            users = []
+            plain_indexes = []
+            plain_passwords = []
+            # 이미 있는 username은 배치마다 DB에서 확인 (이전 배치는 커밋되어 있으므로 메모리 사용량이 배치 크기로 고정됨)
+            existing = set(User.objects.filter(
+                username__in={row['username'] for _, row in rows},
+            ).values_list('username', flat=True))
+            for row_number, row in rows:
+                if row['username'] in existing:
+                    # 중복 데이터 건너뛰기
+                    print_warning(f"유저 '{row['username']}'는 이미 존재합니다. 건너뜁니다.")
+                    continue
+                existing.add(row['username'])
+
+                password = to_django_password(row['password'])
+                if password is None:
+                    # 평문 비밀번호는 배치 단위로 모아서 병렬로 해시합니다.
+                    plain_indexes.append(len(users))
+                    plain_passwords.append(row['password'])
+                users.append(_with_row(row_number, User(
+                    username=row['username'],
+                    password=password or '',
+                    email=row.get('email', ''),
+                    name=row.get('name', ''),
+                    bio=row.get('bio', ''),
+                    profile_image=row.get('profile_image', ''),
+                    phone=row.get('phone', ''),
+                )))
+
+            hashed = executor.map(_hash_password, plain_passwords, chunksize=chunksize)
+            for index, password in zip(plain_indexes, hashed):
+                users[index].password = password
+            return users
+
+        created = _run_stage('users', file_path, User, build_batch, batch_size, False, checkpoint, skip_rows)
+    print_success(f"유저 벌크 생성 완료. ({created}건 처리)")
+
+
+@instrumented('seed_categories')
+def seed_categories(file_path, skip_rows=None):
+    """categories.csv 파일에서 카테고리 데이터를 생성합니다. (skip_rows: 사전 검증에서 거부된 행 번호 집합)"""
     print("\n카테고리 생성 시작...")
     # 카테고리 1번(default)이 없을 경우를 대비해 get_or_create 사용
     Category.objects.get_or_create(id=1, defaults={'name': '기타'})
 
     with open(file_path, mode='r', encoding='utf-8-sig') as file:
         reader = csv.DictReader(file)
-        for row in reader:
+        for row_number, row in enumerate(reader, start=1):
+            count_rows()
+            if skip_rows and row_number in skip_rows:
+                continue
             Category.objects.get_or_create(
                 id=int(row['id']),
                 defaults={'name': row['name']}
@@ -94,12 +281,14 @@ def seed_categories(file_path):
     print_success("카테고리 생성 완료.")
 
 
+@instrumented('seed_courses')
 def seed_courses(file_path):
     """courses.csv 파일에서 과외 데이터를 생성합니다."""
     print("\n과외 생성 시작...")
     with open(file_path, mode='r', encoding='utf-8') as file:
         reader = csv.DictReader(file)
         for row in reader:
+            count_rows()
             try:
                 # 1. 외래 키(객체)를 먼저 찾습니다.
                 tutor_obj = User.objects.get(id=int(row['tutor']))
@@ -139,6 +328,7 @@ def seed_m2m(file_path, model_class):
     with open(file_path, mode='r', encoding='utf-8') as file:
         reader = csv.DictReader(file)
         for row in reader:
+            count_rows()
             try:
                 user_obj = User.objects.get(id=int(row['user']))
                 course_obj = Course.objects.get(id=int(row['course']))
@@ -169,39 +359,515 @@ def seed_m2m(file_path, model_class):
     print_success(f"{model_name} 생성 완료.")
 
 
+# --- 벌크 시딩 ---
+# 행마다 .get() / get_or_create를 호출하면 행당 2~3번의 쿼리가 발생하므로,
+# 대용량 CSV는 아래의 벌크 함수들을 사용합니다.
+# 외래 키 ID 집합을 메모리에 한 번 올려두고 검증한 뒤, 배치 단위로 bulk_create 합니다.
+# CSV는 배치 크기만큼씩 스트리밍으로 읽으므로 파일 크기와 관계없이 메모리 사용량이 일정합니다.
+
+def _with_row(row_number, obj):
+    # 한 행씩 다시 저장할 때 실패한 행을 CSV 행 번호로 보고하기 위해 기록해 둠
+    obj._seed_row = row_number
+    return obj
+
+
+def load_id_sets():
+    """User, Category, Course의 ID 집합을 메모리에 로드합니다."""
+    return {
+        'user': set(User.objects.values_list('id', flat=True).iterator()),
+        'category': set(Category.objects.values_list('id', flat=True).iterator()),
+        'course': set(Course.objects.values_list('id', flat=True).iterator()),
+    }
+
+
+def iter_csv_chunks(file_path, chunk_size, start_offset=0, start_row=0):
+    """
+    CSV 파일을 chunk_size 행씩 읽어 (rows, 끝 바이트 오프셋, 끝 행 번호)를 반환합니다.
+    rows는 (행 번호, dict) 목록이며, 행 번호는 헤더를 제외하고 1부터 셉니다.
+    start_offset은 이전 chunk가 끝난 바이트 위치로, 체크포인트에서 재개할 때 사용합니다.
+    """
+    with open(file_path, mode='rb') as file:
+        header = next(csv.reader([file.readline().decode('utf-8-sig')]))
+        offset = start_offset or file.tell()
+        file.seek(offset)
+
+        row_number = start_row
+        chunk = []
+        pending = []
+        quote_count = 0
+        for line in file:
+            offset += len(line)
+            text = line.decode('utf-8')
+            pending.append(text)
+            # 따옴표 안에 줄바꿈이 있는 필드는 따옴표 개수가 짝수가 될 때까지 이어 붙입니다.
+            quote_count += text.count('"')
+            if quote_count % 2:
+                continue
+            values = next(csv.reader(pending), None)
+            pending = []
+            quote_count = 0
+            if not values:
+                continue
+
+            row_number += 1
+            chunk.append((row_number, dict(zip(header, values))))
+            if len(chunk) >= chunk_size:
+                yield chunk, offset, row_number
+                chunk = []
+        if chunk:
+            yield chunk, offset, row_number
+
+
+class SeedCheckpoint:
+    """
+    단계별로 마지막으로 커밋된 배치의 위치(바이트 오프셋, 행 번호, 배치 번호)를 DB(courses.SeedCheckpoint)에 기록합니다.
+    배치를 저장하는 트랜잭션 안에서 기록하므로, 중간에 멈춰도 체크포인트와 실제로 커밋된 배치가 어긋나지 않습니다.
+    """
+
+    def get(self, stage, file_path):
+        state = CheckpointModel.objects.filter(stage=stage).first()
+        if state is None:
+            return None
+        # 다른 파일이거나 파일이 짧아졌다면 체크포인트를 사용하지 않습니다.
+        if state.file != os.path.abspath(file_path) or state.offset > os.path.getsize(file_path):
+            print_warning(f"'{stage}' 체크포인트가 현재 CSV 파일과 맞지 않아 처음부터 시작합니다.")
+            return None
+        return {'offset': state.offset, 'row': state.row, 'batch': state.batch, 'done': state.done}
+
+    def save(self, stage, file_path, offset, row, batch, done=False):
+        CheckpointModel.objects.update_or_create(stage=stage, defaults={
+            'file': os.path.abspath(file_path),
+            'offset': offset,
+            'row': row,
+            'batch': batch,
+            'done': done,
+        })
+
+    def reset(self):
+        CheckpointModel.objects.all().delete()
+
+
+def _inserted_count(model_class, objs, max_id_before, existing_explicit):
+    # ignore_conflicts=True면 bulk_create가 건너뛴 행을 알려주지 않으므로, 배치 전후의 행으로 실제 추가 수를 셉니다.
+    # - ID를 직접 지정한 행: 지정한 ID 중 배치 전에 없던 것
+    # - ID가 자동으로 붙는 행: 배치 전 최대 ID보다 큰 ID (지정한 ID 제외)
+    explicit_ids = {obj.pk for obj in objs if obj.pk is not None}
+    auto_inserted = model_class.objects.filter(pk__gt=max_id_before).exclude(pk__in=explicit_ids).count()
+    return auto_inserted + len(explicit_ids) - existing_explicit
+
+
+# 행 하나의 값 때문에 배치 전체가 실패하는 오류 - 한 행씩 다시 저장해서 해당 행만 보고합니다.
+ROW_ERRORS = (IntegrityError, DataError, ValidationError, ValueError)
+
+
+def _flush_rows(model_class, objs):
+    """배치를 한 행씩 저장하고 (추가된 행 수, 실패한 행 수)를 반환합니다. 실패한 행은 CSV 행 번호와 함께 출력합니다."""
+    created = failed = 0
+    for obj in objs:
+        try:
+            with transaction.atomic():
+                model_class.objects.bulk_create([obj])
+            created += 1
+        except ROW_ERRORS as e:
+            failed += 1
+            print_error(f"{model_class.__name__} {getattr(obj, '_seed_row', '?')}행 저장 실패: {e}")
+    return created, failed
+
+
+def _flush_batch(model_class, objs, ignore_conflicts):
+    """
+    배치 하나를 bulk_create 하고 (실제로 추가된 행 수, 실패한 행 수)를 반환합니다.
+    배치에 저장할 수 없는 행(제약 조건 위반, 잘못된 값)이 있으면 한 행씩 다시 저장해서 나머지 행은 살리고, 실패한 행을 보고합니다.
+    """
+    if not objs:
+        return 0, 0
+    max_id_before = model_class.objects.aggregate(max_id=Max('pk'))['max_id'] or 0
+    existing_explicit = model_class.objects.filter(pk__in={obj.pk for obj in objs if obj.pk is not None}).count()
+    try:
+        with transaction.atomic():
+            model_class.objects.bulk_create(objs, ignore_conflicts=ignore_conflicts)
+    except ROW_ERRORS as e:
+        print_warning(f"{model_class.__name__} 배치({len(objs)}건)에 저장할 수 없는 행이 있어 한 행씩 다시 저장합니다: {e}")
+        return _flush_rows(model_class, objs)
+    if not ignore_conflicts:
+        return len(objs), 0
+    return _inserted_count(model_class, objs, max_id_before, existing_explicit), 0
+
+
+def _run_stage(stage, file_path, model_class, build_batch, batch_size, ignore_conflicts, checkpoint=None, skip_rows=None):
+    """
+    CSV를 배치 단위로 읽어 build_batch로 객체를 만들고 저장합니다. 체크포인트가 있으면 이어서 실행합니다.
+    skip_rows: 사전 검증(seed_validation.py)에서 거부된 행 번호 집합
+    """
+    start_offset, start_row, batch_number = 0, 0, 0
+    state = checkpoint.get(stage, file_path) if checkpoint else None
+    if state:
+        if state['done']:
+            print_warning(f"'{stage}' 단계는 이미 완료되어 건너뜁니다.")
+            return 0
+        start_offset, start_row, batch_number = state['offset'], state['row'], state['batch']
+        print(f"'{stage}' 단계를 {start_row}행(배치 {batch_number}) 이후부터 재개합니다.")
+
+    created = failed_rows = 0
+    offset, row_number = start_offset, start_row
+    for rows, offset, row_number in iter_csv_chunks(file_path, batch_size, start_offset, start_row):
+        count_rows(len(rows))
+        if skip_rows:
+            rows = [(number, row) for number, row in rows if number not in skip_rows]
+        objs = build_batch(rows)
+        # 배치와 체크포인트를 한 트랜잭션으로 커밋 - 제약 조건 위반이 아닌 오류로 배치가 실패하면
+        # 체크포인트도 함께 롤백되므로 --resume이 그 배치부터 다시 시작합니다.
+        with transaction.atomic():
+            inserted, failed = _flush_batch(model_class, objs, ignore_conflicts)
+            if checkpoint:
+                checkpoint.save(stage, file_path, offset, row_number, batch_number + 1)
+        created += inserted
+        failed_rows += failed
+        batch_number += 1
+
+    if failed_rows:
+        print_warning(f"'{stage}' 단계에서 {failed_rows}행을 저장하지 못했습니다. (위의 행 번호 참고)")
+    if checkpoint:
+        checkpoint.save(stage, file_path, offset, row_number, batch_number, done=True)
+    return created
+
+
+@instrumented('bulk_seed_courses')
+def bulk_seed_courses(file_path, id_sets=None, batch_size=DEFAULT_BATCH_SIZE, ignore_conflicts=False, checkpoint=None, skip_rows=None):
+    """
+    courses.csv 파일에서 과외 데이터를 배치 단위로 생성합니다.
+    CSV에 id 컬럼이 있으면 그 값을 과외 ID로 사용하므로, 중간에 거부된 행이 있어도
+    찜/수강 CSV가 참조하는 과외 ID가 밀리지 않습니다.
+    """
+    print("\n과외 벌크 생성 시작...")
+    if id_sets is None:
+        id_sets = load_id_sets()
+
+    def build_batch(rows):
+        batch = []
+        for row_number, row in rows:
+            try:
+                tutor_id = int(row['tutor'])
+                category_id = int(row['category'])
+                # 외래 키는 DB 조회 대신 메모리의 ID 집합으로 검증합니다.
+                if tutor_id not in id_sets['user']:
+                    print_error(f"과외 '{row['title']}' 생성 실패: 튜터 ID {row['tutor']}를 찾을 수 없습니다.")
+                    continue
+                if category_id not in id_sets['category']:
+                    print_error(f"과외 '{row['title']}' 생성 실패: 카테고리 ID {row['category']}를 찾을 수 없습니다.")
+                    continue
+
+                batch.append(_with_row(row_number, Course(
+                    id=int(row['id']) if row.get('id') else None,
+                    title=row['title'],
+                    thumbnail_image_url=row['thumbnail'],
+                    description=row['description'],
+                    curriculum=row['curriculum'],
+                    max_tutees=int(row['max_tutees']),
+                    status=row.get('status') or Course.StatusChoices.RECRUITING,
+                    view_count=int(row.get('view_count') or 0),
+                    category_id=category_id,
+                    tutor_id=tutor_id,
+                )))
+            except Exception as e:
+                print_error(f"과외 '{row.get('title')}' 생성 중 오류: {e}")
+        return batch
+
+    created = _run_stage('courses', file_path, Course, build_batch, batch_size, ignore_conflicts, checkpoint, skip_rows)
+
+    # ID를 직접 넣었으므로 PostgreSQL 등은 시퀀스를 최대 ID 뒤로 맞춥니다. (SQLite는 필요 없음)
+    sequence_sql = connection.ops.sequence_reset_sql(no_style(), [Course])
+    if sequence_sql:
+        with connection.cursor() as cursor:
+            for sql in sequence_sql:
+                cursor.execute(sql)
+
+    # 이후 M2M 단계에서 검증할 수 있도록 과외 ID 집합을 갱신합니다.
+    id_sets['course'] = set(Course.objects.values_list('id', flat=True).iterator())
+    print_success(f"과외 벌크 생성 완료. ({created}건 처리)")
+
+
+def bulk_seed_m2m(file_path, model_class, id_sets=None, batch_size=DEFAULT_BATCH_SIZE, ignore_conflicts=True, checkpoint=None, skip_rows=None):
+    """WishedCourses, Enrollment 데이터를 배치 단위로 생성합니다."""
+    model_name = model_class.__name__
+    print(f"\n{model_name} 벌크 생성 시작...")
+    if id_sets is None:
+        id_sets = load_id_sets()
+
+    def build_batch(rows):
+        batch = []
+        # 배치 안의 (user, course) 중복은 여기서 거름 - 이전 배치/DB와의 중복은 unique 제약 조건으로 걸러짐
+        seen = set()
+        for row_number, row in rows:
+            try:
+                user_id = int(row['user'])
+                course_id = int(row['course'])
+                if user_id not in id_sets['user']:
+                    print_error(f"{model_name} 생성 실패: 유저 ID {row['user']}를 찾을 수 없습니다.")
+                    continue
+                if course_id not in id_sets['course']:
+                    print_error(f"{model_name} 생성 실패: 과외 ID {row['course']}를 찾을 수 없습니다.")
+                    continue
+                if (user_id, course_id) in seen:
+                    print_warning(f"{model_name} {row_number}행: (유저 {user_id}, 과외 {course_id})가 중복되어 건너뜁니다.")
+                    continue
+
+                # 모델별로 필요한 필드가 다름
+                if model_class == WishedCourses:
+                    batch.append(_with_row(row_number, WishedCourses(user_id=user_id, course_id=course_id)))
+                elif model_class == Enrollment:
+                    # 날짜/상태는 bulk_create 전에 행마다 검사함 (잘못된 값 하나로 배치 전체가 실패하지 않도록)
+                    status = row.get('status') or Enrollment.StatusChoices.ENROLLED
+                    if status not in Enrollment.StatusChoices.values:
+                        print_error(f"{model_name} {row_number}행 생성 실패: status 값 오류 ({status})")
+                        continue
+                    try:
+                        start_date = datetime.strptime(row['start_date'], '%Y-%m-%d').date()  # ⭐️ CSV에 필수!
+                        end_date = datetime.strptime(row['end_date'], '%Y-%m-%d').date()      # ⭐️ CSV에 필수!
+                    except ValueError:
+                        print_error(f"{model_name} {row_number}행 생성 실패: 날짜 형식 오류 "
+                                    f"({row['start_date']}, {row['end_date']})")
+                        continue
+                    if start_date > end_date:
+                        print_error(f"{model_name} {row_number}행 생성 실패: start_date가 end_date보다 늦음")
+                        continue
+                    batch.append(_with_row(row_number, Enrollment(
+                        user_id=user_id,
+                        course_id=course_id,
+                        status=status,
+                        start_date=start_date,
+                        end_date=end_date,
+                    )))
+                # 저장할 행으로 만든 경우에만 중복 검사에 포함 (잘못된 행 뒤의 같은 쌍은 살림)
+                seen.add((user_id, course_id))
+            except Exception as e:
+                print_error(f"데이터 {row} 생성 중 오류: {e}")
+        return batch
+
+    created = _run_stage(model_name, file_path, model_class, build_batch, batch_size, ignore_conflicts, checkpoint, skip_rows)
+    print_success(f"{model_name} 벌크 생성 완료. ({created}건 처리)")
+
+
+@instrumented('update_cached_fields')
 def update_cached_fields():
-    """모든 과외의 캐싱 필드(카운트, 평점 등)를 업데이트합니다."""
+    """모든 과외의 캐싱 필드(카운트, 평점, 인기 점수)를 집계 쿼리로 한 번에 업데이트합니다."""
     print("\n캐싱 필드(카운트, 평점) 업데이트 시작...")
     
-    # ⭐️ 참고: update_popularity_score는 모델 코드에 오류가 있어서(current_students) 호출하지 않습니다.
     # ⭐️ 참고: Review 시딩이 없으므로 리뷰 카운트는 0이 됩니다.
+    # 과외마다 update_* 메서드를 호출하지 않고, 배치마다 GROUP BY 집계 + bulk_update로 처리합니다.
+    updated = recompute_cached_fields()
+    count_rows(updated)
     
-    for course in Course.objects.all():
-        course.update_tutee_count()
-        # course.update_review_metrics() # (Review 시딩을 구현했다면 주석 해제)
-    
-    print_success("캐싱 필드 업데이트 완료.")
+    print_success(f"캐싱 필드 업데이트 완료. (과외 {updated}개)")
 
 
-# --- 메인 실행 ---
-if __name__ == "__main__":
-    
-    # 0. 기존 데이터 삭제 (선택 사항, 새로 시작할 때만 주석 해제)
-    # clear_data()
-    
+@instrumented('run_prevalidation')
+def run_prevalidation(report_path=REJECTED_REPORT_PATH):
+    """DB에 쓰기 전에 모든 시드 CSV를 검사하고, 거부된 행 번호를 {파일 이름: 행 번호 집합}으로 반환합니다."""
+    from seed_validation import prevalidate, rejected_rows_by_file
+
+    print("\n시드 CSV 사전 검증 시작...")
+    id_sets = load_id_sets()
+    report = prevalidate(
+        {
+            'users': USERS_CSV_PATH,
+            'categories': CATEGORIES_CSV_PATH,
+            'courses': COURSES_CSV_PATH,
+            'wished_courses': WISHED_CSV_PATH,
+            'enrollment': ENROLLMENT_CSV_PATH,
+        },
+        existing_user_max_id=User.objects.aggregate(max_id=Max('id'))['max_id'] or 0,
+        existing_user_ids=id_sets['user'],
+        existing_category_ids=id_sets['category'],
+        existing_course_ids=id_sets['course'],
+        existing_usernames=User.objects.values_list('username', flat=True).iterator(),
+        existing_pairs={
+            'wished_courses': WishedCourses.objects.values_list('user_id', 'course_id').iterator(),
+            'enrollment': Enrollment.objects.values_list('user_id', 'course_id').iterator(),
+        },
+    )
+    report.to_csv(report_path, index=False, encoding='utf-8')
+
+    if report.empty:
+        print_success("사전 검증 완료. 거부된 행이 없습니다.")
+    else:
+        for (file_name, reason), group in report.groupby(['file', 'reason']):
+            print_warning(f"{file_name}: {reason} ({len(group)}행)")
+        print_warning(f"사전 검증 완료. {len(report)}행이 거부되어 적재에서 제외됩니다. ('{report_path}' 참고)")
+    return rejected_rows_by_file(report)
+
+
+@instrumented('update_user_stats')
+def update_user_stats():
+    """모든 유저의 대시보드 카운터(개설/수강/찜한 과외 수)를 채웁니다."""
+    print("\n유저 카운터 업데이트 시작...")
+    updated = backfill_user_stats()
+    count_rows(updated)
+    print_success(f"유저 카운터 업데이트 완료. (유저 {updated}명)")
+
+
+@instrumented('update_search_index')
+def update_search_index():
+    """bulk_create로 만든 과외는 시그널이 없으므로 검색 색인을 한 번에 다시 만듭니다."""
+    print("\n검색 색인 생성 시작...")
+    indexed = rebuild_search_index()
+    count_rows(indexed)
+    print_success(f"검색 색인 생성 완료. (과외 {indexed}개)")
+
+
+@instrumented('update_category_stats')
+def update_category_stats():
+    """카테고리 집계 스냅샷과 인기 과외 순위표를 처음부터 계산합니다."""
+    print("\n카테고리 집계 스냅샷 생성 시작...")
+    refreshed = refresh_category_stats(full=True)
+    count_rows(len(refreshed))
+    print_success(f"카테고리 집계 스냅샷 생성 완료. (카테고리 {len(refreshed)}개)")
+
+
+@instrumented('update_activity_rollups')
+def update_activity_rollups():
+    """수강 신청/찜 기록으로 일/주 단위 활동 집계 테이블을 처음부터 만듭니다."""
+    print("\n활동 집계 생성 시작...")
+    # 시딩 중에는 다른 쓰기가 없으므로 워터마크를 늦추지 않고 방금 넣은 행까지 모두 집계함
+    processed = backfill_activity_rollups(lag=timedelta(0))
+    count_rows(processed)
+    print_success(f"활동 집계 생성 완료. (수강 신청/찜 {processed}건)")
+
+
+def print_instrumentation_report(report_path=None):
+    """단계별 계측 결과를 출력하고, 경로가 있으면 JSON 보고서로 저장합니다."""
+    print("\n단계별 계측 결과")
+    for line in instrumentation.summary_lines():
+        print(line)
+    report = instrumentation.report()
+    for suspect in report['n_plus_one']:
+        print_warning(f"N+1 의심 [{suspect['stage']}] {suspect['max_repeats']}회 반복: {suspect['sql']}")
+    if report_path:
+        instrumentation.write_report(report_path)
+        print_success(f"계측 보고서 저장 완료: {report_path}")
+
+
+def run_seed(bulk=False, fast_users=False, batch_size=DEFAULT_BATCH_SIZE, hash_workers=None, ignore_conflicts=True,
+             checkpoint=None, rejected=None):
+    """
+    CSV 적재부터 캐싱 필드/집계 채우기까지 시딩 본 단계를 실행합니다. (benchmarks/suite.py의 seeding도 이 함수를 측정)
+    rejected: 사전 검증에서 거부된 {파일 이름: 행 번호 집합}
+    """
+    checkpoint = checkpoint or SeedCheckpoint()
+    rejected = rejected or {}
+
     # 1. 의존성 없는 모델부터 생성
-    seed_users(USERS_CSV_PATH)
-    seed_categories(CATEGORIES_CSV_PATH)
+    if fast_users:
+        bulk_seed_users(USERS_CSV_PATH, batch_size, hash_workers, checkpoint, rejected.get('users'))
+    else:
+        seed_users(USERS_CSV_PATH)
+    seed_categories(CATEGORIES_CSV_PATH, rejected.get('categories'))
     
-    # 2. 외래 키가 있는 모델 생성
-    seed_courses(COURSES_CSV_PATH)
-    
-    # 3. M2M 중간 모델 생성
-    seed_m2m(WISHED_CSV_PATH, WishedCourses)
-    seed_m2m(ENROLLMENT_CSV_PATH, Enrollment)
+    if bulk:
+        # 2~3. ID 집합을 한 번 로드한 뒤 배치 단위로 생성
+        id_sets = load_id_sets()
+        bulk_seed_courses(COURSES_CSV_PATH, id_sets, batch_size, ignore_conflicts, checkpoint,
+                          rejected.get('courses'))
+        with instrumentation.stage('bulk_seed_m2m[WishedCourses]'):
+            bulk_seed_m2m(WISHED_CSV_PATH, WishedCourses, id_sets, batch_size, ignore_conflicts, checkpoint,
+                          rejected.get('wished_courses'))
+        with instrumentation.stage('bulk_seed_m2m[Enrollment]'):
+            bulk_seed_m2m(ENROLLMENT_CSV_PATH, Enrollment, id_sets, batch_size, ignore_conflicts, checkpoint,
+                          rejected.get('enrollment'))
+    else:
+        # 2. 외래 키가 있는 모델 생성
+        seed_courses(COURSES_CSV_PATH)
+        
+        # 3. M2M 중간 모델 생성
+        with instrumentation.stage('seed_m2m[WishedCourses]'):
+            seed_m2m(WISHED_CSV_PATH, WishedCourses)
+        with instrumentation.stage('seed_m2m[Enrollment]'):
+            seed_m2m(ENROLLMENT_CSV_PATH, Enrollment)
     # seed_m2m(REVIEWS_CSV_PATH, Review) # (리뷰 CSV가 있다면)
     
     # 4. 캐싱 필드 업데이트
     update_cached_fields()
+    update_user_stats()
+    update_search_index()
+    update_category_stats()
+    update_activity_rollups()
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description='CSV 파일로부터 시드 데이터를 생성합니다.')
+    parser.add_argument('--bulk', action='store_true',
+                        help='과외/찜/수강 데이터를 배치 단위 bulk_create로 생성합니다.')
+    parser.add_argument('--batch-size', type=int, default=DEFAULT_BATCH_SIZE,
+                        help=f'벌크 모드의 배치 크기 (기본값: {DEFAULT_BATCH_SIZE})')
+    parser.add_argument('--fast-users', action='store_true',
+                        help='bcrypt 해시는 그대로 저장하고 평문만 병렬 해시하여 유저를 대량 생성합니다.')
+    parser.add_argument('--hash-workers', type=int, default=None,
+                        help='평문 비밀번호 해시에 사용할 프로세스 수 (기본값: CPU 코어 수)')
+    parser.add_argument('--clear', action='store_true',
+                        help='시딩 전에 기존 데이터를 ORM으로 삭제합니다. (clear_data)')
+    parser.add_argument('--fast-reset', action='store_true',
+                        help='시딩 전에 앱 테이블을 DELETE/TRUNCATE로 한 번에 비우고 ID 시퀀스를 초기화합니다.')
+    parser.add_argument('--snapshot', metavar='PATH',
+                        help='시딩이 끝난 DB를 SQLite 스냅샷 파일로 저장합니다.')
+    parser.add_argument('--restore', metavar='PATH',
+                        help='시딩하지 않고 SQLite 스냅샷 파일로 DB를 복원한 뒤 종료합니다.')
+    parser.add_argument('--prevalidate', action='store_true',
+                        help='적재 전에 모든 CSV를 검사하고, 거부된 행은 벌크 적재에서 제외합니다. (--bulk --fast-users 필요)')
+    parser.add_argument('--prevalidate-only', action='store_true',
+                        help='사전 검증 보고서만 만들고 종료합니다.')
+    parser.add_argument('--resume', action='store_true',
+                        help='벌크 모드에서 마지막으로 커밋된 배치 이후부터 이어서 실행합니다.')
+    parser.add_argument('--no-ignore-conflicts', action='store_true',
+                        help='벌크 모드에서 중복(제약 조건 충돌) 행을 무시하지 않고 오류로 처리합니다.')
+    parser.add_argument('--report', metavar='PATH',
+                        help='단계별 쿼리 수, DB 시간, 처리 행 수, 처리량을 JSON 보고서로 저장합니다.')
+    parser.add_argument('--detect-n-plus-one', action='store_true',
+                        help='한 단계 안에서 같은 SQL이 반복 실행되면 N+1 의심 쿼리로 보고합니다.')
+    parser.add_argument('--n-plus-one-threshold', type=int, default=instrumentation.DEFAULT_N_PLUS_ONE_THRESHOLD,
+                        help=f'N+1로 판단할 반복 횟수 (기본값: {instrumentation.DEFAULT_N_PLUS_ONE_THRESHOLD})')
+    return parser.parse_args()
+
+
+# --- 메인 실행 ---
+if __name__ == "__main__":
+    args = parse_args()
+    if args.prevalidate and not (args.bulk and args.fast_users):
+        # 행 단위 시딩(seed_users/seed_courses/seed_m2m)은 CSV의 과외 id를 쓰지 않아
+        # 검증에서 가정한 ID와 맞지 않으므로, 거부된 행을 건너뛰는 적재는 벌크 모드에서만 지원함
+        raise SystemExit("--prevalidate는 --bulk --fast-users와 함께 사용해야 합니다. (보고서만 만들려면 --prevalidate-only)")
+
+    if args.report or args.detect_n_plus_one:
+        instrumentation.enable(args.detect_n_plus_one, args.n_plus_one_threshold)
+
+    # 스냅샷 복원은 시딩 없이 바로 종료
+    if args.restore:
+        raise SystemExit(0 if restore_database(args.restore) else 1)
+    
+    # 0. 기존 데이터 삭제 (선택 사항, 새로 시작할 때만)
+    if args.fast_reset:
+        fast_clear_data()
+    elif args.clear:
+        clear_data()
+    
+    # 벌크 모드는 배치마다 체크포인트를 기록하고, --resume이 없으면 처음부터 시작합니다.
+    checkpoint = SeedCheckpoint()
+    if not args.resume:
+        checkpoint.reset()
+
+    # 적재 전에 외래 키/중복/날짜/상태/정원을 한꺼번에 검사하고, 거부된 행은 건너뜀
+    rejected = {}
+    if args.prevalidate or args.prevalidate_only:
+        rejected = run_prevalidation()
+        if args.prevalidate_only:
+            raise SystemExit(0)
+
+    run_seed(args.bulk, args.fast_users, args.batch_size, args.hash_workers, not args.no_ignore_conflicts,
+             checkpoint, rejected)
+
+    if args.snapshot:
+        snapshot_database(args.snapshot)
+
+    if instrumentation.recorder.enabled:
+        print_instrumentation_report(args.report)
 
     print("\n데이터 시딩 완료. db.sqlite3 파일을 확인해주세요.")
\ No newline at end of file
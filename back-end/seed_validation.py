@@ -0,0 +1,168 @@
+"""
+시드 CSV 사전 검증
+
+DB에 쓰기 전에 모든 시드 CSV(users, categories, courses, wished_courses, enrollment)를
+필요한 컬럼만 pandas DataFrame으로 읽어서 한꺼번에(벡터 연산으로) 검사하고,
+거부할 행 목록(파일, 행 번호, 사유)을 반환합니다.
+seed_all_data.py --prevalidate는 이 목록의 행을 건너뛰므로 적재 단계에는 깨끗한 배치만 들어갑니다.
+
+검사 항목 (중복은 CSV 안에서와 DB에 이미 있는 행 모두 검사)
+- users: username 중복
+- categories: id 형식, id 중복
+- courses: 튜터/카테고리 외래 키, max_tutees 값, id 중복 (id 컬럼이 있을 때)
+- wished_courses / enrollment: 유저/과외 외래 키, (user, course) 중복
+- enrollment: status 값, start_date/end_date 형식과 순서, 과외 정원(max_tutees) 초과
+
+⭐️ 참고: users.csv에는 id가 없으므로 유저 ID는 (기존 최대 ID + 거부되지 않은 행의 순서)로 가정합니다.
+   courses.csv에 id 컬럼이 없을 때도 과외 ID를 같은 방식으로 가정합니다.
+   DB에 이미 있는 username은 여기서 거부되어 적재 단계에서도 건너뛰므로 ID가 밀리지 않습니다.
+   단, 행을 지워서 ID 시퀀스가 최대 ID보다 앞서 있다면 가정이 맞지 않으므로 --fast-reset으로 시퀀스를 초기화합니다.
+"""
+import pandas as pd
+
+from courses.models import Enrollment
+
+# 행 번호는 헤더를 제외하고 1부터 셉니다. (seed_all_data.iter_csv_chunks와 동일)
+REPORT_COLUMNS = ['file', 'row', 'reason']
+
+
+def _read(path, columns):
+    df = pd.read_csv(path, usecols=lambda c: c in columns, dtype=str, encoding='utf-8-sig', keep_default_na=False)
+    df.index = pd.RangeIndex(1, len(df) + 1, name='row')
+    return df
+
+
+def _to_int(series):
+    return pd.to_numeric(series, errors='coerce').astype('Int64')
+
+
+class _Report:
+
+    def __init__(self):
+        self.frames = []
+
+    def reject(self, name, mask, reason):
+        """mask가 True인 행을 거부 목록에 추가하고, 거부되지 않은 행의 mask(~mask)를 반환합니다."""
+        rows = mask[mask].index
+        if len(rows):
+            if callable(reason):
+                reasons = reason(rows)
+            else:
+                reasons = [reason] * len(rows)
+            self.frames.append(pd.DataFrame({'file': name, 'row': rows, 'reason': reasons}))
+        return ~mask
+
+    def to_frame(self):
+        if not self.frames:
+            return pd.DataFrame(columns=REPORT_COLUMNS)
+        return pd.concat(self.frames, ignore_index=True).sort_values(['file', 'row'], kind='stable')
+
+
+def _pair_index(pairs):
+    pairs = list(pairs)
+    return pd.MultiIndex.from_tuples(pairs) if pairs else pd.MultiIndex.from_arrays([[], []])
+
+
+def prevalidate(paths, existing_user_max_id=0, existing_category_ids=(), existing_course_ids=(),
+                existing_usernames=(), existing_pairs=None, existing_user_ids=()):
+    """
+    paths: {'users': 경로, 'categories': 경로, 'courses': 경로, 'wished_courses': 경로, 'enrollment': 경로}
+    existing_*: DB에 이미 있는 ID/username (DB 조회만 하고 쓰지는 않음)
+    existing_pairs: {'wished_courses': [(user, course), ...], 'enrollment': [...]} DB에 이미 있는 쌍
+    거부된 행을 file, row, reason 컬럼의 DataFrame으로 반환합니다.
+    """
+    report = _Report()
+    existing_pairs = existing_pairs or {}
+    existing_course_ids = set(existing_course_ids)
+
+    # --- users ---
+    users = _read(paths['users'], {'username'})
+    ok = report.reject('users', users['username'].isin(set(existing_usernames)), 'username이 이미 DB에 있음')
+    ok &= report.reject('users', ok & users['username'].duplicated(), 'username 중복')
+    user_ids = pd.Index(range(existing_user_max_id + 1, existing_user_max_id + int(ok.sum()) + 1)).union(
+        pd.Index(list(existing_user_ids))
+    )
+
+    # --- categories ---
+    categories = _read(paths['categories'], {'id'})
+    category_id = _to_int(categories['id'])
+    ok = report.reject('categories', category_id.isna(), 'id 형식 오류')
+    ok &= report.reject('categories', ok & category_id.duplicated(), 'id 중복')
+    # 카테고리 1번(기타)은 seed_categories에서 항상 만들어짐
+    category_ids = pd.Index(category_id[ok].dropna()).union(pd.Index(list(existing_category_ids) + [1]))
+
+    # --- courses ---
+    courses = _read(paths['courses'], {'id', 'tutor', 'category', 'max_tutees'})
+    tutor = _to_int(courses['tutor'])
+    category = _to_int(courses['category'])
+    max_tutees = _to_int(courses['max_tutees'])
+
+    ok = pd.Series(True, index=courses.index)
+    if 'id' in courses:
+        course_id = _to_int(courses['id'])
+        ok &= report.reject('courses', course_id.isna(), 'id 형식 오류')
+        ok &= report.reject('courses', ok & course_id.isin(existing_course_ids), 'id가 이미 DB에 있음')
+        ok &= report.reject('courses', ok & course_id.duplicated(), 'id 중복')
+    ok &= report.reject('courses', ok & ~tutor.isin(user_ids), lambda rows: [
+        f'튜터 ID {courses.at[row, "tutor"]}를 찾을 수 없음' for row in rows
+    ])
+    ok &= report.reject('courses', ok & ~category.isin(category_ids), lambda rows: [
+        f'카테고리 ID {courses.at[row, "category"]}를 찾을 수 없음' for row in rows
+    ])
+    ok &= report.reject('courses', ok & ~(max_tutees > 0).fillna(False), 'max_tutees가 양의 정수가 아님')
+    if 'id' not in courses:
+        existing_max_id = max(existing_course_ids, default=0)
+        course_id = pd.Series(pd.NA, index=courses.index, dtype='Int64')
+        course_id[ok] = range(existing_max_id + 1, existing_max_id + int(ok.sum()) + 1)
+    course_ids = pd.Index(course_id[ok]).union(pd.Index(list(existing_course_ids)))
+    capacity = pd.Series(max_tutees[ok].to_numpy(), index=course_id[ok].to_numpy())
+
+    # --- wished_courses / enrollment 공통: 외래 키, (user, course) 중복 ---
+    def validate_pairs(name, df):
+        user = _to_int(df['user'])
+        course = _to_int(df['course'])
+        ok = report.reject(name, ~user.isin(user_ids), lambda rows: [
+            f'유저 ID {df.at[row, "user"]}를 찾을 수 없음' for row in rows
+        ])
+        ok &= report.reject(name, ok & ~course.isin(course_ids), lambda rows: [
+            f'과외 ID {df.at[row, "course"]}를 찾을 수 없음' for row in rows
+        ])
+        pairs = pd.DataFrame({'user': user, 'course': course})
+        in_db = pd.MultiIndex.from_arrays([user.fillna(0), course.fillna(0)]).isin(
+            _pair_index(existing_pairs.get(name, ()))
+        )
+        ok &= report.reject(name, ok & pd.Series(in_db, index=df.index), '(user, course)가 이미 DB에 있음')
+        ok &= report.reject(name, ok & pairs.duplicated(), '(user, course) 중복')
+        return ok, course
+
+    wished = _read(paths['wished_courses'], {'user', 'course'})
+    validate_pairs('wished_courses', wished)
+
+    enrollment = _read(paths['enrollment'], {'user', 'course', 'status', 'start_date', 'end_date'})
+    ok, course = validate_pairs('enrollment', enrollment)
+
+    status = enrollment['status'] if 'status' in enrollment else pd.Series('', index=enrollment.index)
+    ok &= report.reject('enrollment', ok & (status != '') & ~status.isin(Enrollment.StatusChoices.values),
+                        lambda rows: [f'status 값 오류: {status[row]}' for row in rows])
+
+    start_date = pd.to_datetime(enrollment['start_date'], format='%Y-%m-%d', errors='coerce')
+    end_date = pd.to_datetime(enrollment['end_date'], format='%Y-%m-%d', errors='coerce')
+    ok &= report.reject('enrollment', ok & (start_date.isna() | end_date.isna()), '날짜 형식 오류')
+    ok &= report.reject('enrollment', ok & (start_date > end_date), 'start_date가 end_date보다 늦음')
+
+    # 정원: 과외별로 파일 순서대로 센 수강 인원이 max_tutees를 넘는 행을 거부
+    # (DB에 이미 있는 과외는 CSV에 정원 정보가 없으므로 검사하지 않음)
+    valid_course = course[ok]
+    seat = valid_course.groupby(valid_course).cumcount() + 1
+    limit = valid_course.map(capacity)
+    over = (limit.notna() & (seat > limit)).reindex(enrollment.index, fill_value=False)
+    report.reject('enrollment', over, lambda rows: [
+        f'과외 ID {course[row]} 정원({limit[row]}명) 초과' for row in rows
+    ])
+
+    return report.to_frame()
+
+
+def rejected_rows_by_file(report):
+    """{파일 이름: 거부된 행 번호 집합}"""
+    return {name: set(group['row']) for name, group in report.groupby('file')}